@@ -0,0 +1,93 @@
+import sys
+
+
+def fold(text : str) -> str:
+    """Case-insensitive lookup key (casefold also folds e.g. "ß" → "ss")."""
+    return text.casefold()
+
+
+class BookStore:
+    """
+    In-memory catalog of book dicts ({"Title", "Author", "Genre"}) with hash indexes on
+    an internal id, the case-folded title and the case-folded author.
+    
+    The books themselves carry no id, so every added book gets the next number of a
+    counter. Books are kept in a dict keyed by that id, which preserves insertion order,
+    and each title / author index entry is an ordered dict of ids, so add, lookup,
+    update and delete are all O(1) (plus the size of the answer) instead of a scan.
+    """
+    
+    def __init__(self, books = ()):
+        self._books = {}
+        self._by_title = {}
+        self._by_author = {}
+        self._next_id = 0
+        for book in books:
+            self.add(book)
+    
+    def __len__(self):
+        return len(self._books)
+    
+    def __iter__(self):
+        return iter(self._books.values())
+    
+    def __repr__(self):
+        return f"BookStore({len(self)} books)"
+    
+    # ------------------------------ index upkeep ------------------------------
+    @staticmethod
+    def _index(index : dict, key : str, book_id : int):
+        index.setdefault(key, {})[book_id] = None
+    
+    @staticmethod
+    def _unindex(index : dict, key : str, book_id : int):
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(book_id, None)
+            if not ids:
+                del index[key]
+    
+    def _first_with_title(self, title : str):
+        """Id of the first added book with this title, or None."""
+        return next(iter(self._by_title.get(fold(title), ())), None)
+    
+    # ------------------------------ writes ------------------------------
+    def add(self, book : dict) -> dict:
+        book_id = self._next_id
+        self._next_id += 1
+        # Authors and genres repeat across books, so every book shares one copy of each
+        book["Author"] = sys.intern(book["Author"])
+        book["Genre"] = sys.intern(book["Genre"])
+        self._books[book_id] = book
+        self._index(self._by_title, fold(book["Title"]), book_id)
+        self._index(self._by_author, fold(book["Author"]), book_id)
+        return book
+    
+    def update(self, title : str, author : str, genre : str):
+        """Sets author and genre of the first book with this title. Returns it, or None."""
+        book_id = self._first_with_title(title)
+        if book_id is None:
+            return None
+        book = self._books[book_id]
+        self._unindex(self._by_author, fold(book["Author"]), book_id)
+        book["Author"] = sys.intern(author)
+        book["Genre"] = sys.intern(genre)
+        self._index(self._by_author, fold(author), book_id)
+        return book
+    
+    def remove(self, title : str):
+        """Removes and returns the first book with this title, or None."""
+        book_id = self._first_with_title(title)
+        if book_id is None:
+            return None
+        book = self._books.pop(book_id)
+        self._unindex(self._by_title, fold(book["Title"]), book_id)
+        self._unindex(self._by_author, fold(book["Author"]), book_id)
+        return book
+    
+    # ------------------------------ reads ------------------------------
+    def by_title(self, title : str) -> list:
+        return [self._books[book_id] for book_id in self._by_title.get(fold(title), ())]
+    
+    def by_author(self, author : str) -> list:
+        return [self._books[book_id] for book_id in self._by_author.get(fold(author), ())]
@@ -1,6 +1,7 @@
 from typing import Optional
 from fastapi import FastAPI, Query
 from pydantic import BaseModel, Field
+from book_store import BookStore, fold
 
 # Uvicorn is the web server we use to start a FastAPI application
 app = FastAPI()
@@ -10,7 +11,8 @@ class Book(BaseModel):
     author : str = Field(..., title = "Author of the book")
     genre : str = Field(..., title = "Genre of the book")
 
-BOOKS = [
+# Indexed by title and author, so lookups do not scan the whole catalog
+BOOKS = BookStore([
     {
         "Title" : "Mindset: The New Psychology of Success",
         "Author" : "Carol Dweck",
@@ -51,7 +53,7 @@ BOOKS = [
         "Author" : "John Scalzi",
         "Genre" : "Science fiction"
     },
-]
+])
 
 @app.get("/books/")
 async def read_all_books(author_name : Optional[str] = Query(None, description = "Author of the book"), 
@@ -59,17 +61,20 @@ async def read_all_books(author_name : Optional[str] = Query(None, description =
     try:
         filtered_books = BOOKS
         if author_name:
-            filtered_books = [book for book in filtered_books if book["Author"].upper() == author_name.upper()]
+            filtered_books = BOOKS.by_author(author_name)
 
             if not filtered_books:
                 return {"message" : f"No books found for author '{author_name}'"}
         
         if book_title:
-            filtered_books = [book for book in filtered_books if book["Title"].upper() == book_title.upper()]
+            filtered_books = BOOKS.by_title(book_title)
+            if author_name:
+                filtered_books = [book for book in filtered_books if fold(book["Author"]) == fold(author_name)]
             
             if not filtered_books:
                 return {"message " : f"Author - {author_name} has not written any book with title - {book_title}"}
         
+        filtered_books = list(filtered_books)
         if len(filtered_books) == 1:
             return filtered_books[0]
         elif filtered_books:
@@ -83,7 +88,7 @@ async def read_all_books(author_name : Optional[str] = Query(None, description =
 @app.get("/books/title/{book_title}/")
 async def generate_book_title(book_title : str):
     try:
-        book_with_title = [book for book in BOOKS if book["Title"].upper() == book_title.upper()]
+        book_with_title = BOOKS.by_title(book_title)
 
         if not book_with_title:
             return {"message" : f"No books found with title '{book_title}'"}
@@ -96,7 +101,7 @@ async def generate_book_title(book_title : str):
 @app.get("/books/author/{author_name}/")
 async def generate_author_books(author_name : str):
     try:
-        author_books = [book for book in BOOKS if book["Author"].upper() == author_name.upper()]
+        author_books = BOOKS.by_author(author_name)
 
         if not author_books:
             return {"message" : f"No books found for author '{author_name}'"}
@@ -115,7 +120,7 @@ async def add_book(Title : str = Query(..., description = "Title of the book"),
                    Genre : str = Query(..., description = "Genre of the book")):
     try:
         book = {"Title" : Title, "Author" : Author, "Genre" : Genre}
-        BOOKS.append(book)
+        BOOKS.add(book)
         return {"message" : "Book added successfully", "book" : book}
     except Exception as e :
         return {"message" : f"An unexpected error occurred : {e}"}
@@ -126,12 +131,9 @@ async def update_book(Title : str = Query(..., description = "Title of the book"
                    Author : str = Query(..., description = "Author of the book"), 
                    Genre : str = Query(..., description = "Genre of the book")):
     try:
-        for i in BOOKS:
-            if i["Title"].upper() == Title.upper():
-                i["Author"] = Author
-                i["Genre"] = Genre
-                book = {"Title" : Title, "Author" : Author, "Genre" : Genre}
-                return {"message" : "Book updated successfully", "book" : book}
+        if BOOKS.update(Title, Author, Genre) is not None:
+            book = {"Title" : Title, "Author" : Author, "Genre" : Genre}
+            return {"message" : "Book updated successfully", "book" : book}
         else:
             return {"message" : f"No books found with title '{Title}'"}
     except Exception as e :
@@ -141,10 +143,8 @@ async def update_book(Title : str = Query(..., description = "Title of the book"
 @app.delete("/books/delete_book/{book_title}")
 async def delete_book(book_title : str):
     try:
-        for i in BOOKS:
-            if i["Title"].upper() == book_title.upper():
-                BOOKS.remove(i)
-                return {"message" : "Book deleted successfully"}
+        if BOOKS.remove(book_title) is not None:
+            return {"message" : "Book deleted successfully"}
         else:
             return {"message" : f"No books found with title '{book_title}'"}
     except Exception as e :
@@ -0,0 +1,110 @@
+"""
+Multi-criteria filtering of BookStore.select against the list comprehensions it replaced.
+
+Builds a synthetic catalog of --books books (1,000,000 by default) with random
+ratings and publication years, then times every scenario below. "select" is the full
+BookStore.select call including the list of matching books; "bitmap" is only the
+intersection of the rating / year bitmaps, i.e. the filtering itself; "list_scan" is
+the old chain of comprehensions (with far fewer repetitions, as it walks every book).
+Prints the number of matches and the median per call in microseconds as JSON.
+
+Usage (from the Project2 directory):
+    
+    python -m benchmarks.filters
+    python -m benchmarks.filters --books 100000 --repeat 200
+"""
+# In-built packages (Standard Library modules)
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+# External packages
+
+# Our Own Imports
+from main import Book
+from book_store import BookStore
+
+
+# name -> (author, title, (rating low, high), (published_year low, high))
+SCENARIOS = {
+    "rating_eq" : (None, None, (5, 5), (None, None)), 
+    "year_eq_rating_eq" : (None, None, (5, 5), (1950, 1950)), 
+    "year_ge_rating_ge" : (None, None, (4, None), (2020, None)), 
+    "year_between" : (None, None, (None, None), (1990, 1994)), 
+    "author_rating_ge" : ("Author 42", None, (3, None), (None, None)), 
+    "title_author" : ("Author 1042", "Title 1042", (None, None), (None, None))
+}
+
+
+def build_books(count : int, rng : random.Random) -> list:
+    authors = max(1, count // 10)
+    return [Book(book_id, f"Title {book_id}", "Synthetic", f"Author {book_id % authors}", rng.randint(1900, 2024), 
+                 "Fiction", rng.randint(1, 5)) for book_id in range(count)]
+
+
+def list_scan(books : list, author, title, rating, published_year) -> list:
+    # The former read_all_books: one comprehension per given criterion
+    if author:
+        books = [book for book in books if book.author.upper() == author.upper()]
+    if title:
+        books = [book for book in books if book.title.upper() == title.upper()]
+    low, high = rating
+    if low is not None or high is not None:
+        books = [book for book in books if (low is None or book.rating >= low) and (high is None or book.rating <= high)]
+    low, high = published_year
+    if low is not None or high is not None:
+        books = [book for book in books
+                 if (low is None or book.published_year >= low) and (high is None or book.published_year <= high)]
+    return books
+
+
+def median_us(call, repeat : int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1e6, 3)
+
+
+def run(args) -> dict:
+    books = build_books(args.books, random.Random(args.seed))
+    store = BookStore(books)
+    columns = store._columns
+    
+    results = {}
+    for name, (author, title, rating, published_year) in SCENARIOS.items():
+        selected, _ = store.select(author, title, rating, published_year)
+        scanned = list_scan(books, author, title, rating, published_year)
+        assert [book.id for book in selected] == [book.id for book in scanned], name
+        
+        result = {
+            "matches" : len(selected), 
+            "select_us" : median_us(lambda : store.select(author, title, rating, published_year), args.repeat), 
+            "list_scan_us" : median_us(lambda : list_scan(books, author, title, rating, published_year), args.scans)
+        }
+        if not (author or title):
+            result["bitmap_us"] = median_us(lambda : columns.bitmap("rating", *rating) & columns.bitmap("published_year", *published_year), 
+                                            args.repeat)
+        results[name] = result
+    
+    return {
+        "benchmark" : "filters", 
+        "python" : sys.version.split()[0], 
+        "config" : {"books" : args.books, "repeat" : args.repeat, "scans" : args.scans, "seed" : args.seed}, 
+        "scenarios" : results
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type = int, default = 1_000_000, help = "Books in the synthetic catalog")
+    parser.add_argument("--repeat", type = int, default = 100, help = "Timed select calls per scenario")
+    parser.add_argument("--scans", type = int, default = 3, help = "Timed list scans per scenario")
+    parser.add_argument("--seed", type = int, default = 42, help = "RNG seed, keeps the catalog identical between runs")
+    args = parser.parse_args()
+    
+    print(json.dumps(run(args), indent = 2))
@@ -0,0 +1,102 @@
+"""
+Lookup latency of the BookStore indexes against the list scans they replaced.
+
+Builds a synthetic catalog of --books books (1,000,000 by default; titles are
+unique, every author has ~10 books) and times get / by_title / by_author on random
+keys in random letter case. The old list-comprehension scans are timed on the same
+catalog with far fewer repetitions, since each of them walks every book. Prints
+the build time and the median / p99 per lookup in microseconds as JSON.
+
+Usage (from the Project2 directory):
+    
+    python -m benchmarks.lookups
+    python -m benchmarks.lookups --books 100000 --lookups 50000 --scans 5
+"""
+# In-built packages (Standard Library modules)
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+# External packages
+
+# Our Own Imports
+from main import Book
+from book_store import BookStore
+
+
+def build_books(count : int) -> list:
+    authors = max(1, count // 10)
+    return [Book(book_id, f"Title {book_id}", "Synthetic", f"Author {book_id % authors}", 1900 + book_id % 125, 
+                 "Fiction", 1 + book_id % 5) for book_id in range(count)]
+
+
+def _random_case(text : str, rng : random.Random) -> str:
+    return text.upper() if rng.random() < 0.5 else text.lower()
+
+
+def time_lookups(lookup, keys : list) -> dict:
+    samples = []
+    for key in keys:
+        started = time.perf_counter()
+        lookup(key)
+        samples.append(time.perf_counter() - started)
+    
+    samples.sort()
+    return {
+        "count" : len(samples), 
+        "median_us" : round(statistics.median(samples) * 1e6, 3), 
+        "p99_us" : round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6, 3)
+    }
+
+
+def run(args) -> dict:
+    rng = random.Random(args.seed)
+    books = build_books(args.books)
+    authors = max(1, args.books // 10)
+    
+    started = time.perf_counter()
+    store = BookStore(books)
+    build_seconds = time.perf_counter() - started
+    
+    def keys(count : int):
+        picks = [rng.randrange(args.books) for _ in range(count)]
+        return {
+            "id" : picks, 
+            "title" : [_random_case(f"Title {pick}", rng) for pick in picks], 
+            "author" : [_random_case(f"Author {pick % authors}", rng) for pick in picks]
+        }
+    
+    indexed, scanned = keys(args.lookups), keys(args.scans)
+    
+    return {
+        "benchmark" : "lookups", 
+        "python" : sys.version.split()[0], 
+        "config" : {"books" : args.books, "lookups" : args.lookups, "scans" : args.scans, "seed" : args.seed}, 
+        "build_seconds" : round(build_seconds, 3), 
+        "book_store" : {
+            "get" : time_lookups(store.get, indexed["id"]), 
+            "by_title" : time_lookups(store.by_title, indexed["title"]), 
+            "by_author" : time_lookups(store.by_author, indexed["author"])
+        }, 
+        "list_scan" : {
+            "get" : time_lookups(lambda book_id : [book for book in books if book.id == book_id], scanned["id"]), 
+            "by_title" : time_lookups(lambda title : [book for book in books if book.title.upper() == title.upper()], 
+                                      scanned["title"]), 
+            "by_author" : time_lookups(lambda author : [book for book in books if book.author.upper() == author.upper()], 
+                                       scanned["author"])
+        }
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type = int, default = 1_000_000, help = "Books in the synthetic catalog")
+    parser.add_argument("--lookups", type = int, default = 100_000, help = "Timed lookups per index")
+    parser.add_argument("--scans", type = int, default = 10, help = "Timed list scans per lookup kind")
+    parser.add_argument("--seed", type = int, default = 42, help = "RNG seed, keeps the keys identical between runs")
+    args = parser.parse_args()
+    
+    print(json.dumps(run(args), indent = 2))
@@ -0,0 +1,91 @@
+"""
+Memory per book of the catalog representations.
+
+Builds --books synthetic books in each representation below and measures the
+memory they take with tracemalloc. The strings of every book are built fresh, the
+way they arrive from a request body, so repeated authors / genres are only shared
+when the representation interns them. Prints the bytes per book as JSON.
+
+    project1_dict   {"Title", "Author", "Genre"} dict, as Project1 stores it (3 fields only)
+    plain_class     the former Project2 Book: a plain class with a per-instance __dict__
+    slotted_book    the current Project2 Book: __slots__ and interned author / genre
+
+Usage (from the Project2 directory):
+    
+    python -m benchmarks.memory
+    python -m benchmarks.memory --books 1000000
+"""
+# In-built packages (Standard Library modules)
+import gc
+import sys
+import json
+import argparse
+import tracemalloc
+
+# External packages
+
+# Our Own Imports
+from main import Book
+
+
+class PlainBook:
+    def __init__(self, id, title, book_description, author, published_year, genre, rating):
+        self.id = id
+        self.title = title
+        self.book_description = book_description
+        self.author = author
+        self.published_year = published_year
+        self.genre = genre
+        self.rating = rating
+
+
+AUTHORS = 1000
+GENRES = 8
+
+
+def _fields(book_id : int) -> tuple:
+    return (book_id, f"Title {book_id}", f"Description {book_id}", f"Author {book_id % AUTHORS}", 
+            1900 + book_id % 125, f"Genre {book_id % GENRES}", 1 + book_id % 5)
+
+
+def project1_dict(book_id : int) -> dict:
+    _, title, _, author, _, genre, _ = _fields(book_id)
+    return {"Title" : title, "Author" : author, "Genre" : genre}
+
+
+def plain_class(book_id : int) -> PlainBook:
+    return PlainBook(*_fields(book_id))
+
+
+def slotted_book(book_id : int) -> Book:
+    return Book(*_fields(book_id))
+
+
+REPRESENTATIONS = {
+    "project1_dict" : project1_dict, 
+    "plain_class" : plain_class, 
+    "slotted_book" : slotted_book
+}
+
+
+def measure(build, count : int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    books = [build(book_id) for book_id in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    # The list holding the books is the same for every representation, leave it out
+    allocated -= sys.getsizeof(books)
+    return {"bytes_per_book" : round(allocated / count, 1), "total_mb" : round(allocated / 2**20, 1)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type = int, default = 200_000, help = "Books per representation")
+    parser.add_argument("--representations", nargs = "+", choices = list(REPRESENTATIONS), default = list(REPRESENTATIONS))
+    args = parser.parse_args()
+    
+    results = {name : measure(REPRESENTATIONS[name], args.books) for name in args.representations}
+    print(json.dumps({"benchmark" : "memory", "python" : sys.version.split()[0], "books" : args.books, 
+                      "representations" : results}, indent = 2))
@@ -0,0 +1,188 @@
+from array import array
+from itertools import compress
+from bisect import bisect_left, bisect_right, insort
+
+
+# bytes.translate tables marking every non-zero byte / turning "0" "1" digits into 0 1 flags,
+# and the set bits of every byte value
+NONZERO = bytes([0] + [1] * 255)
+DIGIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+# Below one match in this many slots, walking the set bits beats flagging every slot
+SPARSE_RATIO = 64
+
+# Columns are rebuilt once more than one slot in this many belongs to a removed book
+COMPACT_RATIO = 4
+
+
+def bitmap_of(slots) -> int:
+    """Bitmap (a plain int) with the bits of `slots` set, built in one pass over a bytearray."""
+    slots = list(slots)
+    if not slots:
+        return 0
+    data = bytearray(max(slots) // 8 + 1)
+    for slot in slots:
+        data[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(data, "little")
+
+
+class RangeColumn:
+    """
+    Bitmap index of a low-cardinality integer column (rating, published_year).
+    
+    Every distinct value has a bitmap of the slots holding it, and the distinct values
+    are kept in a sorted array. A range is answered with two binary searches and at most
+    two cumulative bitmaps (OR of all values up to a position), so `>= X`, `<= Y` and
+    `between` cost the same as `==`. The cumulative bitmaps are rebuilt lazily on the
+    first range query after a write.
+    """
+    
+    def __init__(self):
+        self.values = []
+        self.bitmaps = {}
+        self._cumulative = None
+    
+    def add(self, slots_by_value : dict):
+        for value, slots in slots_by_value.items():
+            if value not in self.bitmaps:
+                insort(self.values, value)
+                self.bitmaps[value] = 0
+            self.bitmaps[value] |= bitmap_of(slots)
+        self._cumulative = None
+    
+    def discard(self, value : int, slot : int):
+        bitmap = self.bitmaps[value] & ~(1 << slot)
+        if bitmap:
+            self.bitmaps[value] = bitmap
+        else:
+            del self.bitmaps[value]
+            self.values.remove(value)
+        self._cumulative = None
+    
+    def between(self, low : int | None = None, high : int | None = None) -> int:
+        """Bitmap of the slots with low <= value <= high (None leaves that side open)."""
+        if self._cumulative is None:
+            running, self._cumulative = 0, []
+            for value in self.values:
+                running |= self.bitmaps[value]
+                self._cumulative.append(running)
+        
+        start = 0 if low is None else bisect_left(self.values, low)
+        stop = len(self.values) if high is None else bisect_right(self.values, high)
+        if start >= stop:
+            return 0
+        bitmap = self._cumulative[stop - 1]
+        if start:
+            bitmap &= ~self._cumulative[start - 1]
+        return bitmap
+
+
+class BookColumns:
+    """
+    Column-wise copy of the catalog for multi-criteria filtering, owned by BookStore.
+    
+    Every book gets a slot (its position in insertion order). Per slot, the author is
+    stored as a dictionary code and rating / published year as small ints, in compact
+    arrays; rating and published year also get a RangeColumn. Range filters are then
+    intersected as bitmaps, and a handful of candidates from the title / author hash
+    indexes are checked against the arrays directly instead of against bitmaps.
+    
+    Removing a book leaves its slot empty (so slot order stays insertion order); once
+    too many slots are empty, the columns are rebuilt from the remaining books, so
+    arrays and bitmaps follow the books stored, not the books ever added.
+    """
+    
+    RANGES = ("rating", "published_year")
+    
+    def __init__(self):
+        self._clear()
+    
+    def _clear(self):
+        self.books = []
+        self.removed = 0
+        self.slot_of = {}
+        self.author_codes = {}
+        self.authors = array("l")
+        self.values = {"rating" : array("b"), "published_year" : array("h")}
+        self.ranges = {name : RangeColumn() for name in self.RANGES}
+    
+    def _author_code(self, author : str) -> int:
+        return self.author_codes.setdefault(author.casefold(), len(self.author_codes))
+    
+    # ------------------------------ writes ------------------------------
+    def extend(self, books : list):
+        slots_by_value = {name : {} for name in self.RANGES}
+        for book in books:
+            slot = len(self.books)
+            self.books.append(book)
+            self.slot_of[book.id] = slot
+            self.authors.append(self._author_code(book.author))
+            for name in self.RANGES:
+                value = getattr(book, name)
+                self.values[name].append(value)
+                slots_by_value[name].setdefault(value, []).append(slot)
+        
+        for name in self.RANGES:
+            self.ranges[name].add(slots_by_value[name])
+    
+    def replace(self, book):
+        slot = self.slot_of[book.id]
+        self.books[slot] = book
+        self.authors[slot] = self._author_code(book.author)
+        for name in self.RANGES:
+            self.ranges[name].discard(self.values[name][slot], slot)
+            self.ranges[name].add({getattr(book, name) : [slot]})
+            self.values[name][slot] = getattr(book, name)
+    
+    def remove(self, book):
+        slot = self.slot_of.pop(book.id)
+        self.books[slot] = None
+        self.removed += 1
+        for name in self.RANGES:
+            self.ranges[name].discard(self.values[name][slot], slot)
+        
+        if self.removed * COMPACT_RATIO > len(self.books):
+            self.compact()
+    
+    def compact(self):
+        """Rebuilds every column from the stored books, dropping the empty slots."""
+        books = [book for book in self.books if book is not None]
+        self._clear()
+        self.extend(books)
+    
+    # ------------------------------ reads ------------------------------
+    def slots(self, book_ids) -> list:
+        return sorted(self.slot_of[book_id] for book_id in book_ids)
+    
+    def with_author(self, slots : list, author : str) -> list:
+        code = self.author_codes.get(author.casefold())
+        return [slot for slot in slots if self.authors[slot] == code]
+    
+    def within(self, slots : list, name : str, low : int | None, high : int | None) -> list:
+        values = self.values[name]
+        return [slot for slot in slots if (low is None or values[slot] >= low) and (high is None or values[slot] <= high)]
+    
+    def bitmap(self, name : str, low : int | None, high : int | None) -> int:
+        return self.ranges[name].between(low, high)
+    
+    def books_at(self, slots : list) -> list:
+        return [self.books[slot] for slot in slots]
+    
+    def books_in(self, bitmap : int) -> list:
+        """Books of the set bits of `bitmap`, in slot order."""
+        if bitmap.bit_count() * SPARSE_RATIO >= len(self.books):
+            # Dense: one 0/1 flag per slot (the binary digits, least significant first), all in C
+            return list(compress(self.books, bin(bitmap)[:1:-1].encode().translate(DIGIT_FLAGS)))
+        
+        # Sparse: bytes.find skips the zero bytes, Python only visits the set bits
+        data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+        marks = data.translate(NONZERO)
+        books = []
+        position = marks.find(1)
+        while position != -1:
+            base = position * 8
+            for bit in BYTE_BITS[data[position]]:
+                books.append(self.books[base + bit])
+            position = marks.find(1, position + 1)
+        return books
@@ -0,0 +1,151 @@
+from book_columns import BookColumns
+
+
+def fold(text : str) -> str:
+    """Case-insensitive lookup key (casefold also folds e.g. "ß" → "ss")."""
+    return text.casefold()
+
+
+class BookStore:
+    """
+    In-memory catalog of Book objects with hash indexes on id, title and author.
+    
+    Books are kept in a dict keyed by id, which preserves insertion order, so
+    iterating the store lists books in the order they were added (and replace()
+    keeps a book in its place). Titles and authors are indexed case-folded; each index
+    entry is an ordered dict of ids, so removing a book from it is O(1) as well.
+    
+    add / get / replace / remove / by_title / by_author are all O(1) (plus the size
+    of the answer) instead of a scan over the catalog. select() filters on several
+    criteria at once through the column indexes of BookColumns.
+    """
+    
+    def __init__(self, books = ()):
+        self._books = {}
+        self._by_title = {}
+        self._by_author = {}
+        self._columns = BookColumns()
+        self.extend(books)
+    
+    def __len__(self):
+        return len(self._books)
+    
+    def __iter__(self):
+        return iter(self._books.values())
+    
+    def __repr__(self):
+        return f"BookStore({len(self)} books)"
+    
+    # ------------------------------ index upkeep ------------------------------
+    @staticmethod
+    def _index(index : dict, key : str, book_id : int):
+        index.setdefault(key, {})[book_id] = None
+    
+    @staticmethod
+    def _unindex(index : dict, key : str, book_id : int):
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(book_id, None)
+            if not ids:
+                del index[key]
+    
+    def _link(self, book):
+        self._index(self._by_title, fold(book.title), book.id)
+        self._index(self._by_author, fold(book.author), book.id)
+    
+    def _unlink(self, book):
+        self._unindex(self._by_title, fold(book.title), book.id)
+        self._unindex(self._by_author, fold(book.author), book.id)
+    
+    # ------------------------------ writes ------------------------------
+    def add(self, book):
+        self.extend((book,))
+        return book
+    
+    def extend(self, books):
+        """Adds many books at once; the column bitmaps are then updated once, not per book."""
+        books = list(books)
+        new_ids = set()
+        for book in books:
+            if book.id in self._books or book.id in new_ids:
+                raise ValueError(f"A book with ID {book.id} is already in the store")
+            new_ids.add(book.id)
+        
+        for book in books:
+            self._books[book.id] = book
+            self._link(book)
+        self._columns.extend(books)
+    
+    def replace(self, book) -> bool:
+        """Swaps in `book` for the stored book with the same id. False if there is none."""
+        current = self._books.get(book.id)
+        if current is None:
+            return False
+        self._unlink(current)
+        self._books[book.id] = book
+        self._link(book)
+        self._columns.replace(book)
+        return True
+    
+    def remove(self, book_id : int):
+        """Removes and returns the book, or None if there is no book with that id."""
+        book = self._books.pop(book_id, None)
+        if book is not None:
+            self._unlink(book)
+            self._columns.remove(book)
+        return book
+    
+    # ------------------------------ reads ------------------------------
+    def get(self, book_id : int):
+        return self._books.get(book_id)
+    
+    def by_title(self, title : str) -> list:
+        return [self._books[book_id] for book_id in self._by_title.get(fold(title), ())]
+    
+    def by_author(self, author : str) -> list:
+        return [self._books[book_id] for book_id in self._by_author.get(fold(author), ())]
+    
+    def last_id(self) -> int | None:
+        """Id of the most recently added book that is still in the store."""
+        return next(reversed(self._books), None)
+    
+    def select(self, author : str | None = None, title : str | None = None, rating : tuple = (None, None), 
+               published_year : tuple = (None, None)) -> tuple:
+        """
+        Books matching every given criterion, in catalog order. rating and published_year
+        are (low, high) ranges, inclusive, None leaving a side open.
+        
+        Returns (books, empty_at): empty_at names the first criterion, in the order author,
+        title, rating, published_year, after which no book was left (None if some matched).
+        With an author or title the few books of those hash indexes are checked one by one;
+        otherwise the rating and year bitmaps are intersected and only the result is decoded.
+        """
+        ranges = [(name, low, high) for name, (low, high) in (("rating", rating), ("published_year", published_year)) 
+                  if low is not None or high is not None]
+        
+        if author or title:
+            if author:
+                slots = self._columns.slots(self._by_author.get(fold(author), ()))
+                if not slots:
+                    return [], "author"
+            if title:
+                slots = self._columns.slots(self._by_title.get(fold(title), ()))
+                if author:
+                    slots = self._columns.with_author(slots, author)
+                if not slots:
+                    return [], "title"
+            for name, low, high in ranges:
+                slots = self._columns.within(slots, name, low, high)
+                if not slots:
+                    return [], name
+            return self._columns.books_at(slots), None
+        
+        if not ranges:
+            return list(self), None
+        
+        bitmap = -1
+        for name, low, high in ranges:
+            bitmap &= self._columns.bitmap(name, low, high)
+            if not bitmap:
+                return [], name
+        return self._columns.books_in(bitmap), None
@@ -1,8 +1,10 @@
+import sys
 from typing import Optional
 from datetime import datetime
 from fastapi import FastAPI, Query, Path, HTTPException
 from pydantic import BaseModel, Field
 from starlette import status
+from book_store import BookStore
 
 # Uvicorn is the web server we use to start a FastAPI application
 app = FastAPI()
@@ -57,17 +59,26 @@ class Book_Update_Request_Body(BaseModel):
 
 
 class Book:
+    # No per-instance __dict__, and author / genre are interned: they repeat across many books
+    __slots__ = ("id", "title", "book_description", "author", "published_year", "genre", "rating")
+    
     def __init__(self, id, title, book_description, author, published_year, genre, rating):
         self.id = id
         self.title = title
         self.book_description = book_description
-        self.author = author
+        self.author = sys.intern(author)
         self.published_year = published_year
-        self.genre = genre
+        self.genre = sys.intern(genre)
         self.rating = rating
+    
+    def __iter__(self):
+        # A slotted object has no vars(), so FastAPI serializes a Book through dict(book) instead
+        for field in self.__slots__:
+            yield field, getattr(self, field)
 
 
-BOOKS = [
+# Indexed by id, title and author, so lookups do not scan the whole catalog
+BOOKS = BookStore([
     Book(0, "Mindset: The New Psychology of Success", "Description0", "Carol S. Dweck", 2006, "Self-help book", 4), 
     Book(1, "Siddhartha", "Description1", "Hermann Hesse", 1922, "Novel, Fiction", 3), 
     Book(2, "Demian", "Description2", "Hermann Hesse", 1919, "Novel, Fiction, Künstlerroman", 3), 
@@ -76,12 +87,12 @@ BOOKS = [
     Book(5, "The Psychology of Money: Timeless Lessons on Wealth, Greed, and Happiness", "Description5", "Morgan Housel", 2020, "Self-help book", 4), 
     Book(6, "Atomic Habits", "Description6", "James Clear", 2018, "Self-help book", 5), 
     Book(7, "The Kaiju Preservation Society", "Description7", "John Scalzi", 2022, "Science fiction", 3), 
-]
+])
 
 
 def generate_book_id(book_obj):
     if BOOKS:
-        last_book_id = BOOKS[-1].id
+        last_book_id = BOOKS.last_id()
         new_book_id = last_book_id + 1
     else:
         new_book_id = 0
@@ -93,35 +104,32 @@ def generate_book_id(book_obj):
 async def read_all_books(author_name : Optional[str] = Query(None, description = "Author of the book"), 
                          book_title : Optional[str] = Query(None, description = "Title of the book"),
                          book_rating : Optional[int] = Query(None, gt = 0, le = 5, description = "Rating of the book"),
-                         published_year : Optional[int] = Query(None, gt = 1000, lt = current_year + 1, description = "Year of first release of the book")):
+                         published_year : Optional[int] = Query(None, gt = 1000, lt = current_year + 1, description = "Year of first release of the book"), 
+                         min_rating : Optional[int] = Query(None, gt = 0, le = 5, description = "Lowest rating of the book (ignored with book_rating)"), 
+                         min_published_year : Optional[int] = Query(None, gt = 1000, lt = current_year + 1, description = "Books released in or after this year (ignored with published_year)"), 
+                         max_published_year : Optional[int] = Query(None, gt = 1000, lt = current_year + 1, description = "Books released in or before this year (ignored with published_year)")):
     if not BOOKS:
         raise HTTPException(status_code = 404, detail = "No books present in the Database")
     
-    filtered_books = BOOKS
-    if author_name:
-        filtered_books = [book for book in filtered_books if book.author.upper() == author_name.upper()]
-        
-        if not filtered_books:
-            raise HTTPException(status_code = 404, detail = f"No books found for author - {author_name}")
-    
-    if book_title:
-        filtered_books = [book for book in filtered_books if book.title.upper() == book_title.upper()]
-        
-        if not filtered_books:
-            raise HTTPException(status_code = 404, detail = f"No book found with title - {book_title}")
-    
-    if book_rating:
-        filtered_books = [book for book in filtered_books if book.rating == book_rating]
-        
-        if not filtered_books:
-            raise HTTPException(status_code = 404, detail = f"No book found with rating - {book_rating}")
+    # An exact value wins over the range parameters of the same field
+    rating_range = (book_rating, book_rating) if book_rating else (min_rating, None)
+    year_range = (published_year, published_year) if published_year else (min_published_year, max_published_year)
+    
+    filtered_books, empty_at = BOOKS.select(author_name, book_title, rating_range, year_range)
     
-    if published_year:
-        filtered_books = [book for book in filtered_books if book.published_year == published_year]
-        
-        if not filtered_books:
+    if empty_at == "author":
+        raise HTTPException(status_code = 404, detail = f"No books found for author - {author_name}")
+    elif empty_at == "title":
+        raise HTTPException(status_code = 404, detail = f"No book found with title - {book_title}")
+    elif empty_at == "rating":
+        if book_rating:
+            raise HTTPException(status_code = 404, detail = f"No book found with rating - {book_rating}")
+        raise HTTPException(status_code = 404, detail = f"No book found with rating of at least - {min_rating}")
+    elif empty_at == "published_year":
+        if published_year:
             raise HTTPException(status_code = 404, detail = f"No book found with published year - {published_year}")
-        
+        raise HTTPException(status_code = 404, detail = f"No book found published between - {min_published_year or 'any year'} and {max_published_year or current_year}")
+    
     if len(filtered_books) == 1:
         return filtered_books[0]
     elif filtered_books:
@@ -135,7 +143,7 @@ async def generate_book_title(book_title : str = Path(min_length = 3, max_length
     if not BOOKS:
         raise HTTPException(status_code = 404, detail = "No books present in the Database")
     
-    book_with_title = [book for book in BOOKS if book.title.upper() == book_title.upper()]
+    book_with_title = BOOKS.by_title(book_title)
     
     if not book_with_title:
         raise HTTPException(status_code = 404, detail = f"No book found with title - {book_title}")
@@ -148,12 +156,12 @@ async def get_book_based_on_book_id(book_id : int = Path(ge = 0, description = "
     if not BOOKS:
         raise HTTPException(status_code = 404, detail = "No books present in the Database")
     
-    book_based_on_book_id = [book for book in BOOKS if book.id == book_id]
+    book_based_on_book_id = BOOKS.get(book_id)
     
-    if not book_based_on_book_id:
+    if book_based_on_book_id is None:
         raise HTTPException(status_code = 404, detail = f"No book found with ID - '{book_id}'")
     
-    return book_based_on_book_id[0]
+    return book_based_on_book_id
 
 
 @app.get("/books/author/{author_name}/", status_code = status.HTTP_200_OK)
@@ -161,7 +169,7 @@ async def generate_author_books(author_name : str = Path(min_length = 3, max_len
     if not BOOKS:
         raise HTTPException(status_code = 404, detail = "No books present in the Database")
     
-    author_books = [book for book in BOOKS if book.author.upper() == author_name.upper()]
+    author_books = BOOKS.by_author(author_name)
     
     if not author_books:
         raise HTTPException(status_code = 404, detail = f"No books found for author - {author_name}")
@@ -176,7 +184,7 @@ async def generate_author_books(author_name : str = Path(min_length = 3, max_len
 async def add_book(payload_request : Book_Request_Body):
     new_book = Book(**payload_request.model_dump())
     new_book = generate_book_id(new_book)
-    BOOKS.append(new_book)
+    BOOKS.add(new_book)
     return {"message" : "Book added successfully", "book" : new_book}
 
 
@@ -185,11 +193,10 @@ async def update_book(payload_request : Book_Update_Request_Body):
     if not BOOKS:
         raise HTTPException(status_code = 404, detail = "No books present in the Database")
     
-    for idx, book in enumerate(BOOKS):
-        if book.id == payload_request.id:
-            BOOKS[idx] = Book(**payload_request.model_dump())
-            print(f"Updated list - {BOOKS}")
-            return {"message" : "Book updated successfully", "book" : BOOKS[idx]}
+    updated_book = Book(**payload_request.model_dump())
+    if BOOKS.replace(updated_book):
+        print(f"Updated list - {BOOKS}")
+        return {"message" : "Book updated successfully", "book" : updated_book}
     raise HTTPException(status_code = 404, detail = f"No book found with ID - {payload_request.id}")
 
 
@@ -198,10 +205,8 @@ async def delete_book(book_id : int = Path(ge = 0, description = "Book ID of the
     if not BOOKS:
         raise HTTPException(status_code = 404, detail = "No books present in the Database")
     
-    for book in BOOKS:
-        if book.id == book_id:
-            BOOKS.remove(book)
-            return {"message" : "Book deleted successfully"}
+    if BOOKS.remove(book_id) is not None:
+        return {"message" : "Book deleted successfully"}
     raise HTTPException(status_code = 404, detail = f"No book found with ID - {book_id}")
 
 
@@ -0,0 +1,112 @@
+# In-built packages (Standard Library modules)
+import random
+
+# External packages
+import pytest
+
+# Our Own Imports
+from main import Book
+from book_store import BookStore
+
+
+def _random_book(book_id : int, rng : random.Random) -> Book:
+    return Book(book_id, f"Title {rng.randint(0, 300)}", "Random", f"Author {rng.randint(0, 40)}", rng.randint(1990, 2010), 
+                "Fiction", rng.randint(1, 5))
+
+
+def _brute_force(books : dict, author, title, rating, published_year) -> list:
+    matches = list(books.values())
+    if author:
+        matches = [book for book in matches if book.author.casefold() == author.casefold()]
+    if title:
+        matches = [book for book in matches if book.title.casefold() == title.casefold()]
+    for name, (low, high) in (("rating", rating), ("published_year", published_year)):
+        matches = [book for book in matches if (low is None or getattr(book, name) >= low) and (high is None or getattr(book, name) <= high)]
+    return [book.id for book in matches]
+
+
+def _random_criteria(rng : random.Random) -> tuple:
+    author = rng.choice([None, None, f"AUTHOR {rng.randint(0, 40)}"])
+    title = rng.choice([None, None, None, f"title {rng.randint(0, 300)}"])
+    rating = (rng.choice([None, 1, 3, 5]), rng.choice([None, 2, 4, 5]))
+    published_year = rng.choice([(None, None), (2000, 2000), (rng.randint(1990, 2010), None), (None, rng.randint(1990, 2010)), 
+                                 (1995, 2005)])
+    return author, title, rating, published_year
+
+
+# ============================================== TEST #1 ====================================================== #
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_select_matches_brute_force_under_writes(seed):
+    rng = random.Random(seed)
+    books = {book_id : _random_book(book_id, rng) for book_id in range(1000)}
+    store = BookStore(books.values())
+    next_id = len(books)
+    
+    # Enough deletes for the columns to be compacted several times along the way
+    for _ in range(4000):
+        operation = rng.random()
+        if operation < 0.15:
+            book = _random_book(next_id, rng)
+            books[next_id] = book
+            store.add(book)
+            next_id += 1
+        elif operation < 0.3 and books:
+            book = _random_book(rng.choice(list(books)), rng)
+            books[book.id] = book
+            assert store.replace(book)
+        elif operation < 0.5 and books:
+            book_id = rng.choice(list(books))
+            del books[book_id]
+            assert store.remove(book_id).id == book_id
+        else:
+            criteria = _random_criteria(rng)
+            selected, empty_at = store.select(*criteria)
+            expected = _brute_force(books, *criteria)
+            # Same books, in catalog (insertion) order
+            assert [book.id for book in selected] == expected, criteria
+            assert (empty_at is None) == bool(expected)
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_dense_and_sparse_results_are_decoded_alike():
+    rng = random.Random(7)
+    books = [_random_book(book_id, rng) for book_id in range(5000)]
+    store = BookStore(books)
+    
+    # rating >= 2 matches most books (dense path), one year and rating 5 only a few (sparse path)
+    dense, _ = store.select(rating = (2, None))
+    sparse, _ = store.select(rating = (5, 5), published_year = (2000, 2000))
+    
+    assert [book.id for book in dense] == [book.id for book in books if book.rating >= 2]
+    assert [book.id for book in sparse] == [book.id for book in books if book.rating == 5 and book.published_year == 2000]
+    assert 0 < len(sparse) * 64 < len(books) <= len(dense) * 64
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_empty_at_names_the_first_criterion_without_matches():
+    store = BookStore([Book(0, "Demian", "Description", "Hermann Hesse", 1919, "Novel", 3), 
+                       Book(1, "Siddhartha", "Description", "Hermann Hesse", 1922, "Novel", 3)])
+    
+    assert store.select(author = "Nobody") == ([], "author")
+    assert store.select(author = "hermann hesse", title = "Atomic Habits") == ([], "title")
+    assert store.select(author = "hermann hesse", rating = (4, None)) == ([], "rating")
+    assert store.select(rating = (3, 3), published_year = (1920, 1921)) == ([], "published_year")
+    assert [book.id for book in store.select(published_year = (1920, None))[0]] == [1]
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_removed_books_are_compacted_away():
+    rng = random.Random(11)
+    store = BookStore(_random_book(book_id, rng) for book_id in range(1000))
+    next_id = 1000
+    
+    for _ in range(20):
+        for book in list(store)[:400]:
+            store.remove(book.id)
+        store.extend(_random_book(book_id, rng) for book_id in range(next_id, next_id + 400))
+        next_id += 400
+    
+    # Slots (and with them every array and bitmap) stay within a fixed factor of the stored books
+    assert len(store) == 1000
+    assert len(store._columns.books) * 3 <= len(store) * 4
+    assert [book.id for book in store.select(rating = (1, None))[0]] == [book.id for book in store]
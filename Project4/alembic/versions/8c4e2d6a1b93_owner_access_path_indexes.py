@@ -0,0 +1,32 @@
+"""owner access path indexes
+
+Composite indexes for the per-user todo queries.
+
+Revision ID: 8c4e2d6a1b93
+Revises: 3f9a1c2b7d10
+Create Date: 2026-10-17 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2d6a1b93'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c2b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_todos_owner_id_complete_priority', 'todos', ['owner_id', 'complete', 'priority'], unique=False, if_not_exists=True)
+    op.create_index('ix_todos_owner_id_id', 'todos', ['owner_id', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_owner_id_id', table_name='todos', if_exists=True)
+    op.drop_index('ix_todos_owner_id_complete_priority', table_name='todos', if_exists=True)
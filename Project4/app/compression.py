@@ -0,0 +1,194 @@
+# In-built packages (Standard Library modules)
+import zlib
+from os import environ
+
+# External packages
+from starlette.datastructures import Headers, MutableHeaders
+
+# Our Own Imports
+from app.metrics import registry, Counter
+from app.static_assets import accepted_encodings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Responses smaller than this (bytes) are sent as they are, compressing them costs more than it saves
+COMPRESSION_MIN_SIZE = int(environ.get("COMPRESSION_MIN_SIZE", "500"))
+
+# Only these media types are compressed
+COMPRESSION_CONTENT_TYPES = frozenset(
+    environ.get("COMPRESSION_CONTENT_TYPES", 
+                "application/json,application/x-ndjson,text/html,text/plain,text/csv,text/css,application/javascript").split(",")
+)
+
+# Server-side preference; codings whose package is not installed are skipped
+COMPRESSION_ENCODINGS = environ.get("COMPRESSION_ENCODINGS", "br,zstd,gzip").split(",")
+
+# Levels tuned for per-request (not build time) compression
+GZIP_LEVEL = int(environ.get("COMPRESSION_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(environ.get("COMPRESSION_BROTLI_QUALITY", "4"))
+ZSTD_LEVEL = int(environ.get("COMPRESSION_ZSTD_LEVEL", "3"))
+
+COMPRESSION_INPUT_BYTES = registry.register(Counter("http_compression_input_bytes_total", 
+                                                    "Response body bytes before compression", ("encoding",)))
+COMPRESSION_OUTPUT_BYTES = registry.register(Counter("http_compression_output_bytes_total", 
+                                                     "Response body bytes after compression", ("encoding",)))
+COMPRESSION_SAVED_BYTES = registry.register(Counter("http_compression_saved_bytes_total", 
+                                                    "Response body bytes saved by compression", ("encoding",)))
+
+
+# ---------------------------------------------------------------------------
+# Streaming encoders
+# compress(data, flush = True) returns everything the client can decode so far,
+# which is what a streamed body (NDJSON / CSV export) needs after every chunk.
+# ---------------------------------------------------------------------------
+class _GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    
+    def compress(self, data : bytes, flush : bool = False) -> bytes:
+        return self._compressor.compress(data) + (self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else b"")
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality = BROTLI_QUALITY)
+    
+    def compress(self, data : bytes, flush : bool = False) -> bytes:
+        return self._compressor.process(data) + (self._compressor.flush() if flush else b"")
+    
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level = ZSTD_LEVEL).compressobj()
+    
+    def compress(self, data : bytes, flush : bool = False) -> bytes:
+        return self._compressor.compress(data) + (self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else b"")
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+ENCODERS = {"gzip" : _GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = _BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = _ZstdEncoder
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI response compression (gzip always, brotli / zstd when installed).
+    
+    The encoding is the first of `encodings` that the request's Accept-Encoding allows.
+    A response is compressed when its media type is in `content_types`, it does not
+    carry a Content-Encoding already (precompressed static assets) or
+    `Cache-Control: no-transform`, and its body reaches `minimum_size`. Streamed bodies
+    are compressed chunk by chunk and flushed after each one. Their total size is
+    unknown up front, so the threshold only applies to complete bodies.
+    
+    Compressed responses get a weak ETag, since the bytes no longer match the strong
+    one; If-None-Match uses the weak comparison, so conditional GETs keep working.
+    """
+    
+    def __init__(self, app, minimum_size : int = COMPRESSION_MIN_SIZE, content_types = COMPRESSION_CONTENT_TYPES, 
+                 encodings = COMPRESSION_ENCODINGS):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = frozenset(content_types)
+        self.encodings = [encoding for encoding in encodings if encoding in ENCODERS]
+    
+    def _negotiate(self, scope) -> str | None:
+        accepted = accepted_encodings(Headers(scope = scope).get("accept-encoding", ""))
+        for encoding in self.encodings:
+            if encoding in accepted or "*" in accepted:
+                return encoding
+        return None
+    
+    def _compressible(self, scope, message) -> bool:
+        headers = Headers(raw = message["headers"])
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return (scope["method"] != "HEAD"
+                and message["status"] >= 200 and message["status"] not in (204, 206, 304)
+                and media_type in self.content_types
+                and "content-encoding" not in headers
+                and "no-transform" not in headers.get("cache-control", ""))
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = self._negotiate(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        encoder = None
+        passthrough = False
+        
+        async def send_wrapper(message):
+            nonlocal start_message, encoder, passthrough
+            
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk tells us whether to compress
+                start_message = message
+                return
+            
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            
+            if encoder is None:
+                start_message["headers"] = list(start_message.get("headers", []))
+                headers = MutableHeaders(scope = start_message)
+                compressible = self._compressible(scope, start_message)
+                if compressible:
+                    headers.add_vary_header("Accept-Encoding")
+                
+                if not compressible or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                
+                encoder = ENCODERS[encoding]()
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers and not headers["etag"].startswith("W/"):
+                    headers["ETag"] = "W/" + headers["etag"]
+                del headers["Content-Length"]
+                
+                data = encoder.compress(body, flush = more_body)
+                if not more_body:
+                    data += encoder.finish()
+                    headers["Content-Length"] = str(len(data))
+                await send(start_message)
+            else:
+                data = encoder.compress(body, flush = more_body)
+                if not more_body:
+                    data += encoder.finish()
+            
+            COMPRESSION_INPUT_BYTES.inc(encoding, amount = len(body))
+            COMPRESSION_OUTPUT_BYTES.inc(encoding, amount = len(data))
+            COMPRESSION_SAVED_BYTES.inc(encoding, amount = len(body) - len(data))
+            await send({"type" : "http.response.body", "body" : data, "more_body" : more_body})
+        
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,41 @@
+# In-built packages (Standard Library modules)
+import json
+import hashlib
+
+# External packages
+from starlette import status
+from fastapi import Request, Response
+
+# Our Own Imports
+
+
+# Clients may keep the body but must revalidate it with If-None-Match before every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over anything JSON-serializable (version tokens, query params, a row dict)."""
+    digest = hashlib.sha256(json.dumps(parts, sort_keys = True, default = str).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request : Request, etag : str) -> bool:
+    """
+    True when the request's If-None-Match names this ETag (or is "*").
+    If-None-Match uses the weak comparison, so a W/ prefix from a proxy still matches.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or etag in [candidate.removeprefix("W/") for candidate in candidates]
+
+
+def not_modified(etag : str) -> Response:
+    return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = {"ETag" : etag, "Cache-Control" : CACHE_CONTROL})
+
+
+def set_etag(response : Response, etag : str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -6,14 +6,18 @@ from typing import Annotated
 from starlette import status
 from dotenv import load_dotenv
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 
 # Our Own Imports
 from app.logger import get_logger
-from app.database import SessionLocal
+from app.hashing import PasswordHashingService
+from app.token_cache import VerifiedTokenCache
+from app.row_cache import RowCache, RedisBackend
+from app.group_commit import GroupCommitter
+from app.database import DATABASE_MODE, SessionLocal, AsyncSessionLocal, ThreadedSession
 
 
 # ---------------------------------------------- #
@@ -30,27 +34,47 @@ load_dotenv()
 # Here, you are using Argon2 (recommended modern hashing algorithm)
 bcrypt_context = CryptContext(schemes = ["argon2"])
 
+# Hash / verify calls go through this service so they never run on the event loop.
+# PASSWORD_HASH_WORKERS   → concurrent hashes allowed (0 = hash inline on the event loop)
+# PASSWORD_HASH_MAX_QUEUE → calls allowed to wait for a worker before answering 503 (0 = unbounded)
+password_hasher = PasswordHashingService(bcrypt_context, 
+                                         max_workers = int(environ.get("PASSWORD_HASH_WORKERS", "2")), 
+                                         max_queue = int(environ.get("PASSWORD_HASH_MAX_QUEUE", "64")))
+
 
 # ====================================================================
 #                    DATABASE DEPENDENCY
 # ====================================================================
-def get_db():
+def new_session():
+    """A session with the awaitable API for the configured DATABASE_MODE (the caller closes it)."""
+    if DATABASE_MODE == "async":
+        return AsyncSessionLocal()
+    return ThreadedSession(SessionLocal())
+
+
+async def get_db():
     """
     Creates and returns a database session for each request.
     FastAPI will call this function whenever a route depends on `db_dependency`.
     The session is automatically closed after the request completes.
+    
+    DATABASE_MODE=async → a native AsyncSession (asyncpg / aiosqlite).
+    DATABASE_MODE=sync  → a ThreadedSession, i.e. the regular Session with every
+                          blocking call pushed to the threadpool.
+    Both expose the same awaitable API, so routers do not care which one they get.
     """
-    logger.debug("Creating database session")
-    db = SessionLocal()
+    logger.debug(f"Creating database session (mode={DATABASE_MODE})")
+    db = new_session()
+    
     try:
         yield db  # Provide the session to the path operation function
     finally:
         logger.debug("Closing database session")
-        db.close()  # Always close the session (important to avoid DB connection leaks)
+        await db.close()  # Always close the session (important to avoid DB connection leaks)
 
 
 # Annotated is used to define dependency types in a clean manner
-db_dependency = Annotated[Session, Depends(get_db)]
+db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 # ====================================================================
@@ -63,6 +87,32 @@ oauth2_bearer = OAuth2PasswordBearer(tokenUrl = "auth/token")
 # JWT signing algorithm (must match what you used while generating tokens)
 ALGORITHM = "HS256"
 
+# Signing key is read once at startup instead of on every request
+SECRET_KEY = environ.get("SECRET_KEY", "")
+
+# Already-verified tokens → user info, valid until the token's own `exp`
+# TOKEN_CACHE_SIZE = 0 switches the cache off
+token_cache = VerifiedTokenCache(max_size = int(environ.get("TOKEN_CACHE_SIZE", "10000")))
+
+# Read-through cache of Todos / Users rows, invalidated by the write routes
+# ROW_CACHE_SIZE      → entries kept in the in-process LRU (0 switches the cache off)
+# ROW_CACHE_TTL       → seconds an entry may be served from the shared backend at most
+# ROW_CACHE_URL       → optional shared backend (redis://...), needs `pip install .[cache]`
+# ROW_CACHE_LOCAL_TTL → seconds an in-process copy is trusted (other workers' writes show up after this)
+row_cache = RowCache(max_size = int(environ.get("ROW_CACHE_SIZE", "10000")), 
+                     ttl = float(environ.get("ROW_CACHE_TTL", "60")), 
+                     shared = RedisBackend(environ["ROW_CACHE_URL"]) if environ.get("ROW_CACHE_URL") else None, 
+                     local_ttl = float(environ.get("ROW_CACHE_LOCAL_TTL", "5")))
+
+# Opt-in write-behind batching of create / update / delete todo
+# TODO_GROUP_COMMIT        → "true" queues those writes and commits them in groups
+# GROUP_COMMIT_INTERVAL_MS → how long a batch waits for more writes after its first one
+# GROUP_COMMIT_MAX_ITEMS   → a batch this big is committed right away
+todo_writes = GroupCommitter(new_session, 
+                             enabled = environ.get("TODO_GROUP_COMMIT", "false").lower() == "true", 
+                             interval = float(environ.get("GROUP_COMMIT_INTERVAL_MS", "5")) / 1000, 
+                             max_items = int(environ.get("GROUP_COMMIT_MAX_ITEMS", "100")))
+
 async def get_current_user(token : Annotated[str, Depends(oauth2_bearer)]):
     """
     Extracts the current user from the JWT token.
@@ -73,14 +123,22 @@ async def get_current_user(token : Annotated[str, Depends(oauth2_bearer)]):
     3. We validate the fields (username, user ID).
     4. If valid → return usable user info.
     5. If invalid → raise HTTP 401.
+    
+    Tokens that were verified before are answered from `token_cache`
+    (until their `exp`), skipping the signature check entirely.
     """
     
+    if token:
+        cached_user = token_cache.get(token)
+        if cached_user is not None:
+            return dict(cached_user)
+    
     logger.debug("Decoding JWT token inside get_current_user()")
     
     try:
         # Decode and verify the JWT token
         payload = jwt.decode(token = token, 
-                             key = environ.get("SECRET_KEY", ""), 
+                             key = SECRET_KEY, 
                              algorithms = ALGORITHM)
         
         # Extract expected fields from the JWT payload
@@ -96,8 +154,12 @@ async def get_current_user(token : Annotated[str, Depends(oauth2_bearer)]):
         
         logger.debug(f"Authenticated User → username={username}, id={user_id}, role={user_role}")
         
+        # Remember the verified token until it expires
+        user = {"username" : username, "id" : user_id, "user_role" : user_role}
+        token_cache.put(token, user, payload.get("exp"))
+        
         # Return user information to any endpoint that depends on this
-        return {"username" : username, "id" : user_id, "user_role" : user_role}
+        return dict(user)
     except JWTError as e:
         # JWT error means invalid or expired token
         logger.error(f"JWT decoding failed: {e}")
@@ -3,15 +3,47 @@ from os import environ
 
 # External packages
 from dotenv import load_dotenv
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine, URL
+from sqlalchemy.orm import sessionmaker, Session
+from starlette.concurrency import run_in_threadpool
 
 # Our Own Imports
+from app.pool_metrics import PoolMetrics, InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool, instrument_engine
 
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Which engine the request-scoped sessions come from:
+#   "sync"  → classic Session, every call is offloaded to the threadpool (default)
+#   "async" → AsyncSession on top of an async driver (asyncpg / aiosqlite)
+DATABASE_MODE = environ.get("DATABASE_MODE", "sync").lower()
+
+# Schema is managed by Alembic; set to "true" to let the app run create_all() on startup
+AUTO_CREATE_TABLES = environ.get("AUTO_CREATE_TABLES", "false").lower() == "true"
+
+
+# Connection pool tuning (shared by the sync and the async engine)
+#   DB_POOL_SIZE       → connections kept open permanently
+#   DB_MAX_OVERFLOW    → extra connections allowed under load (closed again when returned)
+#   DB_POOL_TIMEOUT    → seconds a request waits for a free connection before failing
+#   DB_POOL_RECYCLE    → seconds after which a connection is replaced (beats server/proxy idle timeouts)
+#   DB_POOL_PRE_PING   → test each connection on checkout, transparently replacing dead ones
+POOL_SETTINGS = {
+    "pool_size" : int(environ.get("DB_POOL_SIZE", "10")), 
+    "max_overflow" : int(environ.get("DB_MAX_OVERFLOW", "20")), 
+    "pool_timeout" : float(environ.get("DB_POOL_TIMEOUT", "10")), 
+    "pool_recycle" : int(environ.get("DB_POOL_RECYCLE", "1800")), 
+    "pool_pre_ping" : environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+}
+
+# Seconds allowed to open a brand-new connection to Postgres
+DB_CONNECT_TIMEOUT = int(environ.get("DB_CONNECT_TIMEOUT", "5"))
+
+# Checkout / lifetime counters, exposed on GET /admin/stats/db-pool
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
 
 #----------------------------FOR CONNECTING TO SQLITE-------------------------------------------#
 
@@ -33,6 +65,153 @@ url = URL.create(drivername = environ.get("POSTGRES_DRIVER", ""),
                  query = {"options" : f"-c search_path={environ.get("POSTGRES_SCHEMA_PROD", "")}"}
                  ).render_as_string(hide_password = False)
 
-engine = create_engine(url)
+sync_connect_args = {}
+if environ.get("POSTGRES_DRIVER", "").startswith("postgresql"):
+    sync_connect_args = {"connect_timeout" : DB_CONNECT_TIMEOUT}
+
+engine = create_engine(url, poolclass = InstrumentedQueuePool, connect_args = sync_connect_args, **POOL_SETTINGS)
+instrument_engine(engine, pool_metrics)
 
 SessionLocal = sessionmaker(bind = engine, autoflush = False, autocommit = False)
+
+
+#---------------------------ASYNC ENGINE (DATABASE_MODE=async)----------------------------------#
+
+# asyncpg does not understand the libpq "options" query parameter, so the schema
+# is handed over through server_settings instead.
+ASYNC_DRIVER = environ.get("POSTGRES_ASYNC_DRIVER", "postgresql+asyncpg")
+
+async_url = URL.create(drivername = ASYNC_DRIVER, 
+                       username = environ.get("POSTGRES_USER", ""), 
+                       password = environ.get("POSTGRES_PASSWORD", ""), 
+                       host = environ.get("POSTGRES_DATABASE_HOST", ""), 
+                       database = environ.get("POSTGRES_DATABASE", ""), 
+                       port = environ.get("POSTGRES_DATABASE_PORT_NO", "")
+                       ).render_as_string(hide_password = False)
+
+async_connect_args = {}
+if ASYNC_DRIVER.startswith("postgresql+asyncpg"):
+    async_connect_args = {"server_settings" : {"search_path" : environ.get("POSTGRES_SCHEMA_PROD", "")}, 
+                          "timeout" : DB_CONNECT_TIMEOUT}
+
+async_engine = None
+AsyncSessionLocal = None
+
+# The async driver is only imported when async mode is switched on,
+# so the default deployment does not need asyncpg installed.
+if DATABASE_MODE == "async":
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    
+    async_engine = create_async_engine(async_url, 
+                                       poolclass = InstrumentedAsyncAdaptedQueuePool, 
+                                       connect_args = async_connect_args, 
+                                       **POOL_SETTINGS)
+    instrument_engine(async_engine.sync_engine, async_pool_metrics)
+    
+    # expire_on_commit = False → attributes stay readable after commit without
+    # an implicit (and in async mode, illegal) lazy refresh.
+    AsyncSessionLocal = async_sessionmaker(bind = async_engine, autoflush = False, expire_on_commit = False)
+
+
+#---------------------------SYNC SESSION WITH AN AWAITABLE API----------------------------------#
+
+class ThreadedSession:
+    """
+    Wraps a regular (sync) Session and exposes the same awaitable API as AsyncSession.
+    
+    Every blocking call runs in Starlette's threadpool, so a slow query no longer
+    stalls the event loop. Routers therefore only need to be written once:
+    
+        todo = await db.get(Todos, todo_id)
+        await db.commit()
+    
+    works for both DATABASE_MODE=sync and DATABASE_MODE=async.
+    """
+    
+    def __init__(self, session : Session):
+        self.sync_session = session
+    
+    def add(self, instance):
+        self.sync_session.add(instance)
+    
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+    
+    def _execute_buffered(self, statement, params = None, **kwargs):
+        # Rows are fetched inside the worker thread so the caller never touches the cursor
+        result = self.sync_session.execute(statement, params, **kwargs)
+        if getattr(result, "returns_rows", True):
+            return result.freeze()()
+        return result
+    
+    async def execute(self, statement, params = None, **kwargs):
+        return await run_in_threadpool(self._execute_buffered, statement, params, **kwargs)
+    
+    async def scalar(self, statement, params = None, **kwargs):
+        return (await self.execute(statement, params, **kwargs)).scalar()
+    
+    async def scalars(self, statement, params = None, **kwargs):
+        return (await self.execute(statement, params, **kwargs)).scalars()
+    
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+    
+    async def delete(self, instance):
+        await run_in_threadpool(self.sync_session.delete, instance)
+    
+    async def flush(self):
+        await run_in_threadpool(self.sync_session.flush)
+    
+    async def begin_nested(self):
+        return ThreadedTransaction(await run_in_threadpool(self.sync_session.begin_nested))
+    
+    async def refresh(self, instance):
+        await run_in_threadpool(self.sync_session.refresh, instance)
+    
+    async def commit(self):
+        await run_in_threadpool(self.sync_session.commit)
+    
+    async def rollback(self):
+        await run_in_threadpool(self.sync_session.rollback)
+    
+    async def close(self):
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadedTransaction:
+    """Awaitable commit() / rollback() of a SessionTransaction (a SAVEPOINT from begin_nested())."""
+    
+    def __init__(self, transaction):
+        self.sync_transaction = transaction
+    
+    async def commit(self):
+        await run_in_threadpool(self.sync_transaction.commit)
+    
+    async def rollback(self):
+        await run_in_threadpool(self.sync_transaction.rollback)
+
+
+async def stream_partitions(db, statement, size : int):
+    """
+    Yields the rows of `statement` as lists of mappings, `size` rows at a time.
+    
+    yield_per turns on server-side cursors (stream_results), so only one batch is
+    held in memory no matter how large the table is. Works with both session types.
+    """
+    statement = statement.execution_options(yield_per = size)
+    
+    if isinstance(db, ThreadedSession):
+        result = await run_in_threadpool(db.sync_session.execute, statement)
+        try:
+            while True:
+                partition = await run_in_threadpool(result.mappings().fetchmany, size)
+                if not partition:
+                    break
+                yield partition
+        finally:
+            await run_in_threadpool(result.close)
+        return
+    
+    result = await db.stream(statement)
+    async for partition in result.mappings().partitions(size):
+        yield partition
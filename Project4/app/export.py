@@ -0,0 +1,74 @@
+# In-built packages (Standard Library modules)
+import io
+import csv
+import json
+from enum import Enum
+
+# External packages
+from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+
+# Our Own Imports
+from app.logger import get_logger
+from app.database import stream_partitions
+
+
+logger = get_logger(__file__)
+
+# Rows fetched from the server-side cursor (and written to the socket) per chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson : "application/x-ndjson", 
+    ExportFormat.csv : "text/csv"
+}
+
+
+async def _ndjson_chunks(db, statement):
+    async for partition in stream_partitions(db, statement, EXPORT_BATCH_SIZE):
+        # One chunk per batch → one write per 1000 rows instead of one per row
+        yield "".join(json.dumps(dict(row), default = str) + "\n" for row in partition)
+
+
+async def _csv_chunks(db, statement, column_names):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    writer.writerow(column_names)
+    yield buffer.getvalue()
+    
+    async for partition in stream_partitions(db, statement, EXPORT_BATCH_SIZE):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([row[name] for name in column_names] for row in partition)
+        yield buffer.getvalue()
+
+
+def export_response(db, model, export_format : ExportFormat, *criteria, hidden : frozenset = frozenset()):
+    """
+    Streams every row of `model` matching `criteria` as NDJSON or CSV.
+    
+    The first byte goes out as soon as the first batch is read, and memory stays
+    constant because rows never pile up in a list.
+    """
+    columns = [column for column in model.__table__.columns if column.key not in hidden]
+    column_names = [column.key for column in columns]
+    statement = select(*columns).where(*criteria).order_by(model.id)
+    
+    logger.info(f"Starting {export_format.value} export of '{model.__tablename__}'")
+    
+    if export_format == ExportFormat.csv:
+        body = _csv_chunks(db, statement, column_names)
+    else:
+        body = _ndjson_chunks(db, statement)
+    
+    filename = f"{model.__tablename__}.{export_format.value}"
+    return StreamingResponse(body, 
+                             media_type = MEDIA_TYPES[export_format], 
+                             headers = {"Content-Disposition" : f'attachment; filename="{filename}"'})
@@ -0,0 +1,168 @@
+# In-built packages (Standard Library modules)
+import asyncio
+import threading
+from functools import partial
+
+# External packages
+
+# Our Own Imports
+from app.logger import get_logger
+
+
+logger = get_logger(__file__)
+
+
+class GroupCommitter:
+    """
+    Write-behind batching of small write transactions (opt-in).
+    
+    Every write is an `operation(db)` coroutine function that issues its statements on
+    the session it is given and returns a result. With group commit switched off,
+    write() runs it on the request's own session and commits, exactly like before.
+    Switched on, operations from concurrent requests are queued and run together on
+    one session: each inside its own SAVEPOINT, then ONE commit for the whole batch.
+    A batch is flushed `interval` seconds after its first operation arrived, or as
+    soon as it holds `max_items`, so the commit (and its fsync) is paid once per batch
+    instead of once per request.
+    
+    Every caller awaits its own outcome. A failing operation (an IntegrityError, say)
+    only rolls back its savepoint and is re-raised in the request that submitted it,
+    so the usual exception handlers still map it. If the batch commit itself fails,
+    every operation of the batch gets that error. Batches are committed one at a time;
+    the next one keeps filling up in the meantime. If a flush is cancelled (shutdown),
+    the operations it had not answered yet fail instead of waiting forever.
+    """
+    
+    def __init__(self, session_factory, enabled : bool = False, interval : float = 0.005, max_items : int = 100):
+        self.session_factory = session_factory
+        self.enabled = enabled
+        self.interval = interval
+        self.max_items = max_items
+        
+        # Per-event-loop state, reset when a different loop shows up (TestClient runs one per request)
+        self._loop = None
+        self._batch = None
+        self._full = None
+        self._commit_lock = None
+        self._flush_tasks = set()
+        
+        # Counters (read by stats() from other threads)
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._failed_items = 0
+        self._failed_batches = 0
+        self._largest_batch = 0
+    
+    async def write(self, db, operation):
+        """Runs `operation` and commits it, through the group commit when enabled. Returns its result."""
+        if not self.enabled:
+            result = await operation(db)
+            await db.commit()
+            return result
+        return await self.submit(operation)
+    
+    async def submit(self, operation):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._batch = None
+            self._commit_lock = asyncio.Lock()
+        
+        if self._batch is None:
+            # First operation of a new batch → schedule its flush. The flush is a task of
+            # its own, so a cancelled request cannot strand the batch it joined.
+            self._batch, self._full = [], asyncio.Event()
+            task = loop.create_task(self._flush_batch(self._batch, self._full))
+            self._flush_tasks.add(task)
+            task.add_done_callback(partial(self._flush_done, self._batch))
+        
+        future = loop.create_future()
+        self._batch.append((operation, future))
+        
+        if len(self._batch) >= self.max_items:
+            # Full → closed right away, so writes arriving before its flush runs start the next batch
+            self._batch = None
+            self._full.set()
+        
+        return await future
+    
+    async def _flush_batch(self, batch : list, full : asyncio.Event):
+        try:
+            await asyncio.wait_for(full.wait(), self.interval)
+        except asyncio.TimeoutError:
+            pass
+        
+        if self._batch is batch:
+            self._batch = None
+        async with self._commit_lock:
+            await self._commit(batch)
+    
+    def _flush_done(self, batch : list, task : asyncio.Task):
+        # Runs even when the flush task was cancelled before it started
+        self._flush_tasks.discard(task)
+        if self._batch is batch:
+            self._batch = None
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Group commit was cancelled, the write may not have been committed"))
+    
+    async def _commit(self, batch : list):
+        outcomes = []
+        db = self.session_factory()
+        try:
+            try:
+                for operation, future in batch:
+                    savepoint = await db.begin_nested()
+                    try:
+                        result = await operation(db)
+                        await savepoint.commit()
+                        outcomes.append((future, result, None))
+                    except Exception as e:
+                        await savepoint.rollback()
+                        outcomes.append((future, None, e))
+                
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Group commit of {len(batch)} writes failed: {e}")
+                self._count(len(batch), len(batch), failed_batch = True)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            
+            failures = sum(1 for _, _, error in outcomes if error is not None)
+            self._count(len(batch), failures)
+            
+            # Outcomes are handed out only now: nothing is reported as written before the commit
+            for future, result, error in outcomes:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+        finally:
+            await db.close()
+    
+    def _count(self, items : int, failures : int, failed_batch : bool = False):
+        with self._lock:
+            self._batches += 1
+            self._items += items
+            self._failed_items += failures
+            self._failed_batches += failed_batch
+            self._largest_batch = max(self._largest_batch, items)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled" : self.enabled, 
+                "interval_ms" : self.interval * 1000, 
+                "max_items" : self.max_items, 
+                "batches" : self._batches, 
+                "items" : self._items, 
+                "failed_items" : self._failed_items, 
+                "failed_batches" : self._failed_batches, 
+                "largest_batch" : self._largest_batch, 
+                "average_batch" : round(self._items / self._batches, 2) if self._batches else 0.0
+            }
@@ -0,0 +1,114 @@
+# In-built packages (Standard Library modules)
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# External packages
+from starlette import status
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+# Our Own Imports
+from app.logger import get_logger
+
+
+logger = get_logger(__file__)
+
+
+def _lower_thread_priority():
+    """
+    Lets the event loop thread win the CPU over hashing workers when cores are scarce.
+    On Linux each thread has its own nice value; elsewhere this is a no-op.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+    except (AttributeError, OSError):
+        pass
+
+
+class PasswordHashingService:
+    """
+    Runs password hashing / verification outside the event loop.
+    
+    Argon2 burns tens of milliseconds of CPU per call. Calling it straight from an
+    `async def` route freezes every other in-flight request for that long, so a
+    login burst stalls the whole API. Here each call is handed to a dedicated,
+    bounded thread pool (argon2-cffi releases the GIL while hashing):
+    
+        hashed = await password_hasher.hash("secret")
+        ok     = await password_hasher.verify("secret", hashed)
+    
+    max_workers → how many hashes may run at the same time (0 = run inline, old behaviour)
+    max_queue   → how many calls may wait for a worker before new ones get HTTP 503
+                  (0 = unbounded)
+    """
+    
+    def __init__(self, context : CryptContext, max_workers : int = 2, max_queue : int = 0):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        
+        self._executor = None
+        if max_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "password-hash", 
+                                                initializer = _lower_thread_priority)
+        
+        # Counters (guarded by _lock because they are touched from worker threads)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._rejected = 0
+    
+    async def hash(self, password : str) -> str:
+        return await self._submit(self.context.hash, password)
+    
+    async def verify(self, password : str, hashed_password : str) -> bool:
+        return await self._submit(self.context.verify, password, hashed_password)
+    
+    async def _submit(self, func, *args):
+        if self._executor is None:
+            return self._run(func, *args, queued = False)
+        
+        with self._lock:
+            if self.max_queue and self._queued >= self.max_queue:
+                self._rejected += 1
+                logger.warning(f"Password hashing queue is full ({self._queued} waiting), rejecting request")
+                raise HTTPException(status_code = status.HTTP_503_SERVICE_UNAVAILABLE, 
+                                    detail = "Server is busy, please try again.")
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run, func, *args)
+    
+    def _run(self, func, *args, queued : bool = True):
+        with self._lock:
+            if queued:
+                self._queued -= 1
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+    
+    def stats(self) -> dict:
+        """Snapshot of the pool state (queue depth, running jobs, totals)."""
+        with self._lock:
+            return {
+                "max_workers" : self.max_workers, 
+                "max_queue" : self.max_queue, 
+                "queued" : self._queued, 
+                "running" : self._running, 
+                "peak_queued" : self._peak_queued, 
+                "completed" : self._completed, 
+                "rejected" : self._rejected
+            }
+    
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait = False, cancel_futures = True)
@@ -1,8 +1,12 @@
 # In-built packages (Standard Library modules)
 import os
+import copy
+import queue
+import atexit
 import logging
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler
 
 # External packages
 from colorlog import ColoredFormatter
@@ -18,6 +22,17 @@ LOG_DIR = Path("logs")
 # Create the directory if it doesn't exist
 LOG_DIR.mkdir(exist_ok = True)
 
+# LOG_QUEUE_MODE=true → request threads only enqueue records; a single background
+# thread formats them and writes them to the files/console in batches.
+LOG_QUEUE_MODE = os.environ.get("LOG_QUEUE_MODE", "false").lower() == "true"
+
+# Max records waiting in the queue. When it is full new records are dropped
+# (and counted) instead of blocking the request.
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+
+# Max records the writer thread handles before flushing the files once
+LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", "256"))
+
 
 # ------------------------------------------------------------
 # Helper function: extract only the filename from __file__
@@ -37,10 +52,26 @@ def _extract_module_name(file_path : str) -> str:
     return os.path.splitext(os.path.basename(file_path))[0]
 
 
+# ------------------------------------------------------------
+# Rotating file handler whose flush is driven by the queue writer
+# ------------------------------------------------------------
+class _BatchFlushRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler flushes (one write syscall) after every record.
+    In queue mode the writer thread calls flush_batch() once per batch instead.
+    """
+    
+    def flush(self):
+        pass
+    
+    def flush_batch(self):
+        super().flush()
+
+
 # ------------------------------------------------------------
 # Helper function: create a rotating JSONL log handler
 # ------------------------------------------------------------
-def _get_rotating_jsonl_handler(log_path : Path):
+def _get_rotating_jsonl_handler(log_path : Path, handler_class = RotatingFileHandler):
     """
     Creates a rotating log file handler that writes logs in JSON Lines format.
     
@@ -57,7 +88,7 @@ def _get_rotating_jsonl_handler(log_path : Path):
     """
     
     # Creates a file handler that rotates after 5 MB
-    handler = RotatingFileHandler(log_path, 
+    handler = handler_class(log_path, 
         maxBytes = 5 * 1024 * 1024,  # 5 MB
         backupCount = 5,             # keep 5 backups
         encoding = "utf-8"
@@ -118,6 +149,138 @@ def _get_colored_console_handler():
     return handler
 
 
+# ------------------------------------------------------------
+# Queue mode: enqueue on the request path, write on one thread
+# ------------------------------------------------------------
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks: when the queue is full the record is dropped and counted.
+    
+    Records stay in this process, so unlike QueueHandler.prepare() nothing is formatted
+    here: only the args are merged into the message (they may change after the call),
+    and exc_info stays on the record for _LogWriter's formatters.
+    """
+    
+    def __init__(self, log_queue : queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class _LogWriter(threading.Thread):
+    """
+    Background thread that drains the log queue.
+    
+    Each wake-up takes up to LOG_BATCH_SIZE records, routes every record to the
+    shared app.jsonl handler, its module's own handler and the console, and then
+    flushes the files once for the whole batch.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, log_queue : queue.Queue):
+        super().__init__(name = "log-writer", daemon = True)
+        self.queue = log_queue
+        self.app_handler = _get_rotating_jsonl_handler(LOG_DIR / "app.jsonl", _BatchFlushRotatingFileHandler)
+        self.console_handler = _get_colored_console_handler()
+        self.module_handlers = {}
+        self.written = 0
+    
+    def add_module(self, module_name : str):
+        if module_name not in self.module_handlers:
+            self.module_handlers[module_name] = _get_rotating_jsonl_handler(LOG_DIR / f"{module_name}.jsonl", 
+                                                                            _BatchFlushRotatingFileHandler)
+    
+    def _handle(self, record):
+        handlers = [self.app_handler, self.console_handler]
+        module_handler = self.module_handlers.get(record.name)
+        if module_handler is not None:
+            handlers.append(module_handler)
+        
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                    continue
+                self._handle(record)
+                self.written += 1
+            
+            for handler in [self.app_handler, *list(self.module_handlers.values())]:
+                handler.flush_batch()
+    
+    def stop(self):
+        if self.is_alive():
+            # put() (blocking) so the stop marker is never dropped
+            self.queue.put(self._STOP)
+            self.join(timeout = 5)
+        for handler in [self.app_handler, self.console_handler, *list(self.module_handlers.values())]:
+            handler.close()
+
+
+_log_queue = None
+_queue_handler = None
+_log_writer = None
+_queue_lock = threading.Lock()
+
+
+def _get_queue_handler(module_name : str) -> QueueHandler:
+    """Starts the writer thread on first use and registers the module's own log file."""
+    global _log_queue, _queue_handler, _log_writer
+    
+    with _queue_lock:
+        if _log_writer is None:
+            _log_queue = queue.Queue(maxsize = LOG_QUEUE_SIZE)
+            _queue_handler = _DroppingQueueHandler(_log_queue)
+            _log_writer = _LogWriter(_log_queue)
+            _log_writer.start()
+            
+            # Drain whatever is still queued when the interpreter exits
+            atexit.register(_log_writer.stop)
+        
+        _log_writer.add_module(module_name)
+    
+    return _queue_handler
+
+
+def log_queue_stats() -> dict:
+    """Queue depth / dropped / written counters for the queue mode."""
+    if _queue_handler is None:
+        return {"queue_mode" : False}
+    return {
+        "queue_mode" : True, 
+        "max_size" : LOG_QUEUE_SIZE, 
+        "queued" : _log_queue.qsize(), 
+        "dropped" : _queue_handler.dropped, 
+        "written" : _log_writer.written
+    }
+
+
 # ------------------------------------------------------------
 # Public API: the function developers will use
 # ------------------------------------------------------------
@@ -156,6 +319,11 @@ def get_logger(file_path : str):
     if logger.handlers:
         return logger
     
+    # Queue mode → the logger only enqueues; files and console are written by _LogWriter
+    if LOG_QUEUE_MODE:
+        logger.addHandler(_get_queue_handler(module_name))
+        return logger
+    
     # -------------------------------------
     # 1. Add central application log (app.jsonl)
     # -------------------------------------
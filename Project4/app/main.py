@@ -1,19 +1,26 @@
 # In-built packages (Standard Library modules)
+from os import environ
+from importlib.util import find_spec
 from contextlib import asynccontextmanager
 
 # External packages
 from sqlalchemy.exc import IntegrityError
-from fastapi.staticfiles import StaticFiles
 from fastapi import FastAPI, Request, status
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, PlainTextResponse, JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # Our Own Imports
 from .models import Base
-from .database import engine
-from app.logger import get_logger
+from .database import engine, async_engine, pool_metrics, async_pool_metrics, AUTO_CREATE_TABLES
+from app.logger import get_logger, log_queue_stats
+from app.config import password_hasher, token_cache, row_cache, todo_writes
+from app.metrics import registry, CallbackGauge, MetricsMiddleware, count_exceptions
+from app.sql_profiler import SQL_PROFILING, SQLProfilerMiddleware, profile_engine
 from app.routers import auth, todos, admin, users
+from app.static_assets import static_assets
+from app.templating import templates, streaming_environment, precompile_templates
+from app.compression import CompressionMiddleware
 from app.exceptions import http_exception_handler, validation_exception_handler, integrity_error_handler, generic_exception_handler
 
 # Create a module-specific logger (this log will be written into main.jsonl)
@@ -40,27 +47,50 @@ async def lifespan(app : FastAPI):
     # ------------------------------ STARTUP LOGIC ------------------------------
     logger.info("FastAPI application has started")
     
+    # The schema is owned by Alembic (`alembic upgrade head`).
+    # AUTO_CREATE_TABLES=true keeps the old create_all() shortcut for throw-away SQLite setups.
+    if AUTO_CREATE_TABLES:
+        logger.info("AUTO_CREATE_TABLES is on, creating missing tables")
+        Base.metadata.create_all(bind = engine)
+    
+    # Parse every template now instead of on the first request that needs it
+    logger.info(f"Precompiled {precompile_templates(templates.env)} templates "
+                f"(+ {precompile_templates(streaming_environment)} for streaming)")
+    
     # yield hands control over to FastAPI to start serving requests
     yield
     
     # ------------------------------ SHUTDOWN LOGIC -----------------------------
     logger.info("FastAPI application is shutting down")
+    
+    # Stop the password hashing worker threads
+    password_hasher.shutdown()
 
 
 # -----------------------------------------------------------------------------
 # Create FastAPI app with the custom lifespan manager
 # -----------------------------------------------------------------------------
-app = FastAPI(lifespan = lifespan)
+# orjson renders the response_model output several times faster than json.dumps.
+# It is optional (`pip install .[fast-json]`); ORJSON_RESPONSES=false forces the stdlib encoder.
+if environ.get("ORJSON_RESPONSES", "true").lower() == "true" and find_spec("orjson") is not None:
+    default_response_class = ORJSONResponse
+else:
+    default_response_class = JSONResponse
 
+app = FastAPI(lifespan = lifespan, default_response_class = default_response_class)
 
-# -----------------------------------------------------------------------------
-# Create database tables (if they don't already exist)
-# This executes once at startup.
-# -----------------------------------------------------------------------------
-Base.metadata.create_all(bind = engine)
-# Note:
-# In production, Alembic migrations should be used instead,
-# but for small apps or fast prototypes, this is acceptable.
+# gzip / brotli / zstd for JSON, HTML, CSV and NDJSON bodies (COMPRESSION_* settings in app/compression.py)
+app.add_middleware(CompressionMiddleware)
+
+# Per-route latency histograms, status-class counters and the in-flight gauge (see /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Opt-in (SQL_PROFILING=true): per-request statement count / DB time, Server-Timing header, query budget warnings
+if SQL_PROFILING:
+    profile_engine(engine)
+    if async_engine is not None:
+        profile_engine(async_engine.sync_engine)
+    app.add_middleware(SQLProfilerMiddleware)
 
 
 # -----------------------------------------------------------------------------
@@ -80,19 +110,54 @@ app.include_router(users.router)
 # -----------------------------------------------------------------------------
 
 # Handles DB constraint issues (duplicate username, foreign key errors, etc.)
-app.add_exception_handler(IntegrityError, integrity_error_handler)
+app.add_exception_handler(IntegrityError, count_exceptions(integrity_error_handler))
 
 # Handles HTTP errors like 404, 401, 403, etc.
-app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(StarletteHTTPException, count_exceptions(http_exception_handler))
 
 # Handles Pydantic validation errors (invalid request body)
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(RequestValidationError, count_exceptions(validation_exception_handler))
 
 # Catch-all for ANY unhandled exception (prevents app crashes)
-app.add_exception_handler(Exception, generic_exception_handler)
+app.add_exception_handler(Exception, count_exceptions(generic_exception_handler))
+
+
+# -----------------------------------------------------------------------------
+# Prometheus scrape endpoint
+# The component stats that the /admin/stats/* endpoints return are exported
+# as gauges too, read at scrape time.
+# -----------------------------------------------------------------------------
+def _component_stats() -> dict:
+    components = {
+        "password_hashing" : password_hasher.stats(), 
+        "token_cache" : token_cache.stats(), 
+        "row_cache" : row_cache.stats(), 
+        "group_commit" : todo_writes.stats(), 
+        "db_pool_sync" : pool_metrics.stats(engine.pool), 
+        "logging" : log_queue_stats()
+    }
+    if async_engine is not None:
+        components["db_pool_async"] = async_pool_metrics.stats(async_engine.sync_engine.pool)
+    
+    return {(component, stat) : float(value) 
+            for component, stats in components.items() 
+            for stat, value in stats.items() 
+            if isinstance(value, (int, float))}
+
+
+registry.register(CallbackGauge("app_component_stat", 
+                                "Password hashing, token/row cache, group commit, DB pool and logging stats", 
+                                ("component", "stat"), 
+                                _component_stats))
+
+
+@app.get("/metrics", include_in_schema = False)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type = "text/plain; version=0.0.4; charset=utf-8")
 
 
-app.mount("/static", StaticFiles(directory = "static"), name = "static")
+# Fingerprinted + precompressed assets (templates link them through static_url())
+app.mount("/static", static_assets, name = "static")
 
 @app.get("/")
 async def test(request : Request):
@@ -0,0 +1,228 @@
+# In-built packages (Standard Library modules)
+import time
+import bisect
+import threading
+from functools import wraps
+
+# External packages
+
+# Our Own Imports
+
+
+# Default latency buckets (seconds), same as the Prometheus client libraries
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_names : tuple, label_values : tuple, extra : str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value : float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = "untyped"
+    
+    def __init__(self, name : str, documentation : str, label_names : tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+    
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    """Monotonic counter: counter.inc("GET", "/todo/")"""
+    
+    type_name = "counter"
+    
+    def __init__(self, name, documentation, label_names = ()):
+        super().__init__(name, documentation, label_names)
+        self._values = {}
+    
+    def inc(self, *label_values, amount : float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+    
+    def value(self, *label_values) -> float:
+        return self._values.get(label_values, 0)
+    
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}" 
+                                for labels, value in items]
+
+
+class Gauge(Counter):
+    """Value that can go up and down: gauge.inc() / gauge.dec()"""
+    
+    type_name = "gauge"
+    
+    def dec(self, *label_values, amount : float = 1):
+        self.inc(*label_values, amount = -amount)
+    
+    def set(self, *label_values, value : float):
+        with self._lock:
+            self._values[label_values] = value
+
+
+class Histogram(_Metric):
+    """
+    Cumulative histogram: histogram.observe(0.042, "GET", "/todo/")
+    
+    One list of bucket counts per label set; observe() is a bisect + two additions.
+    """
+    
+    type_name = "histogram"
+    
+    def __init__(self, name, documentation, label_names = (), buckets = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+    
+    def observe(self, value : float, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # [per-bucket counts..., +Inf count], sum
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+    
+    def count(self, *label_values) -> int:
+        series = self._series.get(label_values)
+        return sum(series[0]) if series else 0
+    
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        
+        lines = self.header()
+        for labels, counts, total in items:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names, labels, f'le="{_format_value(upper_bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class CallbackGauge(_Metric):
+    """
+    Gauge whose values are read from a callback at scrape time, e.g. pool or cache stats.
+    The callback returns {label_values_tuple : value}.
+    """
+    
+    type_name = "gauge"
+    
+    def __init__(self, name, documentation, label_names, callback):
+        super().__init__(name, documentation, label_names)
+        self.callback = callback
+    
+    def render(self) -> list[str]:
+        return self.header() + [f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}" 
+                                for labels, value in self.callback().items()]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+    
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+    
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.register(Histogram("http_request_duration_seconds", 
+                                              "HTTP request latency by route template", 
+                                              ("method", "route")))
+REQUESTS_TOTAL = registry.register(Counter("http_requests_total", 
+                                           "HTTP requests by route template and status class", 
+                                           ("method", "route", "status_class")))
+REQUESTS_IN_FLIGHT = registry.register(Gauge("http_requests_in_flight", 
+                                             "HTTP requests currently being served"))
+EXCEPTIONS_HANDLED = registry.register(Counter("http_exceptions_handled_total", 
+                                               "Exceptions turned into error responses, by exception handler", 
+                                               ("handler", "exception")))
+
+
+def route_template(scope) -> str:
+    """
+    Label for a request: the route template (/todo/read_todo/{todo_id}), never the raw
+    path, so the number of series stays bounded.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Mounted apps (StaticFiles) only leave their mount point in root_path
+    if scope.get("root_path"):
+        return scope["root_path"] + "/{path}"
+    return "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware overhead) that feeds the request metrics."""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_FLIGHT.dec()
+            
+            method, route = scope["method"], route_template(scope)
+            REQUEST_LATENCY.observe(elapsed, method, route)
+            REQUESTS_TOTAL.inc(method, route, f"{status_code // 100}xx")
+
+
+def count_exceptions(handler):
+    """Wraps an exception handler so every call is counted per handler and exception type."""
+    
+    @wraps(handler)
+    async def wrapper(request, exc):
+        EXCEPTIONS_HANDLED.inc(handler.__name__, type(exc).__name__)
+        return await handler(request, exc)
+    
+    return wrapper
@@ -3,13 +3,16 @@ from typing import Annotated
 
 # External packages
 from sqlalchemy.orm import mapped_column, DeclarativeBase, Mapped
-from sqlalchemy import Boolean, String, VARCHAR, Integer, ForeignKey
+from sqlalchemy import Boolean, String, VARCHAR, Integer, ForeignKey, Index
 
 # Our Own Imports
 
 
 int_pk = Annotated[int, mapped_column(Integer, primary_key = True, index = True)]
 
+# Columns of Users that must never be sent back to a client
+USER_HIDDEN_FIELDS = frozenset({"hashed_password"})
+
 class Base(DeclarativeBase):
     pass
 
@@ -28,6 +31,12 @@ class Users(Base):
 
 class Todos(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        # Per-user list split by complete / ordered by priority (todo page, GET /todo/)
+        Index("ix_todos_owner_id_complete_priority", "owner_id", "complete", "priority"), 
+        # Keyset pagination of one user's todos: WHERE owner_id = ? AND id > ? ORDER BY id
+        Index("ix_todos_owner_id_id", "owner_id", "id"), 
+    )
     
     id : Mapped[int_pk]
     title : Mapped[str] = mapped_column(String(255))
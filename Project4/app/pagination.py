@@ -0,0 +1,84 @@
+# In-built packages (Standard Library modules)
+from typing import Annotated, Optional
+
+# External packages
+from sqlalchemy import select
+from starlette import status
+from fastapi import Depends, HTTPException, Query
+
+# Our Own Imports
+
+
+# Page size used when the client does not send ?limit=, and the hard upper bound
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PageParams:
+    """
+    Query parameters shared by every paginated list endpoint.
+    
+    cursor → id of the last row of the previous page (keyset pagination, no OFFSET scan)
+    limit  → rows per page, capped at MAX_PAGE_SIZE so memory per request stays bounded
+    fields → optional comma separated projection, e.g. ?fields=id,title
+    """
+    
+    def __init__(self, 
+                 cursor : Optional[int] = Query(None, ge = 0, description = "`next_cursor` value returned by the previous page"), 
+                 limit : int = Query(DEFAULT_PAGE_SIZE, gt = 0, le = MAX_PAGE_SIZE, description = "Number of rows per page"), 
+                 fields : Optional[str] = Query(None, description = "Comma separated list of columns to return")):
+        self.cursor = cursor
+        self.limit = limit
+        self.fields = fields
+
+
+page_dependency = Annotated[PageParams, Depends(PageParams)]
+
+
+def select_columns(model, fields : Optional[str], hidden : frozenset = frozenset()):
+    """
+    Resolves ?fields= into a list of column attributes of `model`.
+    
+    - No fields → every column except the hidden ones.
+    - `id` is always included because it is the pagination key.
+    - Unknown (or hidden) names → HTTP 400.
+    """
+    available = [column.key for column in model.__table__.columns if column.key not in hidden]
+    
+    if not fields:
+        return [getattr(model, name) for name in available]
+    
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise HTTPException(status_code = status.HTTP_400_BAD_REQUEST, 
+                            detail = f"Unknown field(s): {', '.join(unknown)}. Allowed fields: {', '.join(available)}")
+    
+    if "id" not in requested:
+        requested.insert(0, "id")
+    
+    # dict.fromkeys → drop duplicates but keep the client's order
+    return [getattr(model, name) for name in dict.fromkeys(requested)]
+
+
+def page_statement(model, page : PageParams, *criteria, hidden : frozenset = frozenset()):
+    """
+    Keyset-paginated SELECT of one page. Only the selected columns are loaded (plain
+    rows, no ORM objects), and one extra row is fetched to know whether another page exists.
+    """
+    statement = select(*select_columns(model, page.fields, hidden)).where(*criteria)
+    
+    if page.cursor is not None:
+        statement = statement.where(model.id > page.cursor)
+    
+    return statement.order_by(model.id).limit(page.limit + 1)
+
+
+async def fetch_page(db, model, page : PageParams, *criteria, hidden : frozenset = frozenset()):
+    """Runs page_statement() and returns {"items" : [...], "next_cursor" : id | None}."""
+    rows = (await db.execute(page_statement(model, page, *criteria, hidden = hidden))).mappings().all()
+    
+    has_more = len(rows) > page.limit
+    items = [dict(row) for row in rows[:page.limit]]
+    
+    return {"items" : items, "next_cursor" : items[-1]["id"] if has_more else None}
@@ -0,0 +1,126 @@
+# In-built packages (Standard Library modules)
+import time
+import threading
+
+# External packages
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Our Own Imports
+
+
+class PoolMetrics:
+    """
+    Counters describing how a connection pool is doing.
+    
+    - checkout wait  → time spent inside pool.connect() (queueing + connecting)
+    - timeouts       → checkouts that gave up after pool_timeout seconds
+    - lifetime       → how long a DBAPI connection lived before it was closed
+                       (recycled, invalidated or dropped as overflow)
+    Live numbers (in use / idle / overflow) are read from the pool itself.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.checkout_timeouts = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.connection_lifetime_total = 0.0
+        self.connection_lifetime_max = 0.0
+        self.invalidations = 0
+    
+    def record_checkout(self, waited : float):
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+    
+    def record_timeout(self):
+        with self._lock:
+            self.checkout_timeouts += 1
+    
+    def on_connect(self, dbapi_connection, connection_record):
+        connection_record.info["created_at"] = time.monotonic()
+        with self._lock:
+            self.connections_opened += 1
+    
+    def on_close(self, dbapi_connection, connection_record):
+        created_at = connection_record.info.pop("created_at", None)
+        with self._lock:
+            self.connections_closed += 1
+            if created_at is not None:
+                lifetime = time.monotonic() - created_at
+                self.connection_lifetime_total += lifetime
+                self.connection_lifetime_max = max(self.connection_lifetime_max, lifetime)
+    
+    def on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+    
+    def stats(self, pool) -> dict:
+        with self._lock:
+            snapshot = {
+                "checkouts" : self.checkouts, 
+                "checkout_wait_avg_ms" : round(self.checkout_wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0, 
+                "checkout_wait_max_ms" : round(self.checkout_wait_max * 1000, 3), 
+                "checkout_timeouts" : self.checkout_timeouts, 
+                "connections_opened" : self.connections_opened, 
+                "connections_closed" : self.connections_closed, 
+                "connection_lifetime_avg_s" : round(self.connection_lifetime_total / self.connections_closed, 3) if self.connections_closed else 0.0, 
+                "connection_lifetime_max_s" : round(self.connection_lifetime_max, 3), 
+                "invalidations" : self.invalidations
+            }
+        
+        if isinstance(pool, QueuePool):
+            snapshot.update({
+                "pool_size" : pool.size(), 
+                "max_overflow" : pool._max_overflow, 
+                "in_use" : pool.checkedout(), 
+                "idle" : pool.checkedin(), 
+                # QueuePool.overflow() is negative until the pool is full
+                "overflow" : max(0, pool.overflow())
+            })
+        return snapshot
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout; `metrics` is carried over when the pool is recreated (dispose())."""
+    
+    metrics : PoolMetrics = None
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+    
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine, metrics : PoolMetrics):
+    """Hooks `metrics` into the pool of a (sync) Engine. Pass async_engine.sync_engine for async."""
+    engine.pool.metrics = metrics
+    event.listen(engine, "connect", metrics.on_connect)
+    event.listen(engine, "close", metrics.on_close)
+    event.listen(engine, "invalidate", metrics.on_invalidate)
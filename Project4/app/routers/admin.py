@@ -1,27 +1,45 @@
 # In-built packages (Standard Library modules)
 
 # External packages
+from sqlalchemy import delete, insert, select, update
 from starlette import status
 from sqlalchemy.exc import IntegrityError
-from fastapi import HTTPException, Path, APIRouter
+from fastapi import HTTPException, Path, Query, APIRouter
 
 # Our Own Imports
-from app.models import Users
-from app.schemas import User_Update_Request_Body, User_Request_Body
-from app.config import user_dependency, db_dependency,bcrypt_context
+from app.models import Users, Todos, USER_HIDDEN_FIELDS
+from app.logger import log_queue_stats
+from app.database import engine, async_engine, pool_metrics, async_pool_metrics
+from app.export import ExportFormat, export_response
+from app.pagination import page_dependency, fetch_page
+from app.schemas import User_Update_Request_Body, User_Request_Body, UserPage
+from app.config import user_dependency, db_dependency, password_hasher, token_cache, row_cache, todo_writes
 
 router = APIRouter(prefix = "/admin", tags = ["admin"])
 
 
-@router.get("/users/", status_code = status.HTTP_200_OK)
-async def read_all(user : user_dependency, db : db_dependency):
+@router.get("/users/", status_code = status.HTTP_200_OK, response_model = UserPage, response_model_exclude_unset = True)
+async def read_all(user : user_dependency, db : db_dependency, page : page_dependency):
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
     if user.get("user_role") != "admin":
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
     
-    return db.query(Users).all()
+    return await fetch_page(db, Users, page, hidden = USER_HIDDEN_FIELDS)
+
+
+@router.get("/users/export", status_code = status.HTTP_200_OK)
+async def export_users(user : user_dependency, 
+                       db : db_dependency, 
+                       export_format : ExportFormat = Query(ExportFormat.ndjson, alias = "format", description = "ndjson or csv")):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    return export_response(db, Users, export_format, hidden = USER_HIDDEN_FIELDS)
 
 
 @router.post("/user/", status_code = status.HTTP_201_CREATED)
@@ -32,22 +50,23 @@ async def create_user(user : user_dependency, db : db_dependency, user_request :
     if user.get("user_role") != "admin":
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
     
-    user_model_object = Users(email = user_request.email, 
-                              username = user_request.username, 
-                              first_name = user_request.first_name, 
-                              last_name = user_request.last_name, 
-                              hashed_password = bcrypt_context.hash(user_request.password), 
-                              is_active = True, 
-                              role = user_request.role, 
-                              phone_number = user_request.phone_number)
+    hashed_password = await password_hasher.hash(user_request.password)
+    user_values = {"email" : user_request.email, 
+                   "username" : user_request.username, 
+                   "first_name" : user_request.first_name, 
+                   "last_name" : user_request.last_name, 
+                   "hashed_password" : hashed_password, 
+                   "is_active" : True, 
+                   "role" : user_request.role, 
+                   "phone_number" : user_request.phone_number}
     
     try:
-        db.add(user_model_object)
-        db.commit()
-        db.refresh(user_model_object)
-        return {"message" : "User created successfully", "id" : user_model_object.id}
+        # INSERT ... RETURNING id → no refresh round trip after the commit
+        user_id = await db.scalar(insert(Users).values(**user_values).returning(Users.id))
+        await db.commit()
+        return {"message" : "User created successfully", "id" : user_id}
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         raise e  
 
 
@@ -64,21 +83,21 @@ async def update_user(user : user_dependency,
     if user.get("user_role") != "admin":
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
     
-    # Fetch user
-    user_model_object = db.get(Users, user_id)
+    # Update only provided fields: UPDATE ... RETURNING id, which also tells whether the user exists
+    update_data = user_request.model_dump(exclude_unset = True)
+    if update_data:
+        statement = update(Users).where(Users.id == user_id).values(**update_data).returning(Users.id)
+    else:
+        statement = select(Users.id).where(Users.id == user_id)
     
-    if not user_model_object:
+    if await db.scalar(statement) is None:
         raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "User Not Found.")
     
-    # Update only provided fields
-    update_data = user_request.model_dump(exclude_unset = True)
-    for field, value in update_data.items():
-        setattr(user_model_object, field, value)
+    await db.commit()
     
-    db.commit()
-    db.refresh(user_model_object)
+    await row_cache.invalidate_user(user_id)
     
-    return {"message" : "User details updated successfully", "id" : user_model_object.id}
+    return {"message" : "User details updated successfully", "id" : user_id}
 
 
 @router.delete("/user/{user_id}", status_code = status.HTTP_200_OK)
@@ -93,12 +112,84 @@ async def delete_user(user : user_dependency,
     if user.get("user_role") != "admin":
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
     
-    # Fetch user
-    user_model_object = db.get(Users, user_id)
+    # The user's todos go first and explicitly, so their ids come back for the cache
+    # (and nothing depends on the database enforcing ON DELETE CASCADE)
+    todo_ids = (await db.scalars(delete(Todos).where(Todos.owner_id == user_id).returning(Todos.id))).all()
+    deleted_id = await db.scalar(delete(Users).where(Users.id == user_id).returning(Users.id))
     
-    if user_model_object is not None:
-        db.query(Users).filter(Users.id == user_id).delete()
-        db.commit()
-        return {"message" : "User details deleted successfully", "id" : user_model_object.id}
-    else:
-        raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "User ID Not Found")
\ No newline at end of file
+    if deleted_id is None:
+        await db.rollback()
+        raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "User ID Not Found")
+    
+    await db.commit()
+    await row_cache.invalidate_user(user_id, todo_ids)
+    return {"message" : "User details deleted successfully", "id" : user_id}
+
+
+@router.get("/stats/password-hashing", status_code = status.HTTP_200_OK)
+async def password_hashing_stats(user : user_dependency):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    return password_hasher.stats()
+
+
+@router.get("/stats/token-cache", status_code = status.HTTP_200_OK)
+async def token_cache_stats(user : user_dependency):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    return token_cache.stats()
+
+
+@router.get("/stats/db-pool", status_code = status.HTTP_200_OK)
+async def db_pool_stats(user : user_dependency):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    pools = {"sync" : pool_metrics.stats(engine.pool)}
+    if async_engine is not None:
+        pools["async"] = async_pool_metrics.stats(async_engine.sync_engine.pool)
+    return pools
+
+
+@router.get("/stats/logging", status_code = status.HTTP_200_OK)
+async def logging_stats(user : user_dependency):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    return log_queue_stats()
+
+
+@router.get("/stats/row-cache", status_code = status.HTTP_200_OK)
+async def row_cache_stats(user : user_dependency):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    return row_cache.stats()
+
+
+@router.get("/stats/group-commit", status_code = status.HTTP_200_OK)
+async def group_commit_stats(user : user_dependency):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    if user.get("user_role") != "admin":
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied - Admin Privilege Required")
+    
+    return todo_writes.stats()
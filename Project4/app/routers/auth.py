@@ -1,21 +1,22 @@
 # In-built packages (Standard Library modules)
-from os import environ
 from typing import Annotated
 from dotenv import load_dotenv
 from datetime import timedelta, datetime, timezone
 
 # External packages
 from jose import jwt
+from sqlalchemy import select
 from starlette import status
-from fastapi.templating import Jinja2Templates
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 # Our Own Imports
-from app.models import Users
-from app.schemas import Token
-from app.config import ALGORITHM
-from app.config import db_dependency, bcrypt_context
+from app.models import Users, USER_HIDDEN_FIELDS
+from app.pagination import page_dependency, fetch_page
+from app.templating import templates
+from app.schemas import Token, UserPage
+from app.config import ALGORITHM, SECRET_KEY
+from app.config import db_dependency, password_hasher
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,37 +24,48 @@ load_dotenv()
 router = APIRouter(prefix = "/auth", tags = ["auth"])
 
 
-def authenticate_user(username : str, password : str, db_instance : db_dependency):
-    user = db_instance.query(Users).filter(Users.username == username).first()
-    if not user:
-        return False
-    if not bcrypt_context.verify(password, user.hashed_password):
+async def get_credentials(username : str, db_instance : db_dependency):
+    """
+    id, username, role and password hash of the user as a plain Row (nothing stays
+    attached to the session), or None. The caller owns the session and decides when
+    to hand its connection back, ideally before the (slow) hash check.
+    """
+    statement = select(Users.id, Users.username, Users.role, Users.hashed_password).where(Users.username == username)
+    return (await db_instance.execute(statement)).first()
+
+
+async def authenticate_user(credentials, password : str):
+    """The credentials from get_credentials() if `password` matches their hash, otherwise False."""
+    if credentials is None or not await password_hasher.verify(password, credentials.hashed_password):
         return False
-    return user
+    return credentials
 
 
 def create_access_token(username : str, user_id : int, user_role : str, expires_delta : timedelta):
     encode = {"sub" : username, "id" : user_id, "user_role"  : user_role}
     expires = datetime.now(timezone.utc) + expires_delta
     encode.update({"exp" : expires})
-    return jwt.encode(claims = encode, key = environ.get("SECRET_KEY", ""), algorithm = ALGORITHM)
+    return jwt.encode(claims = encode, key = SECRET_KEY, algorithm = ALGORITHM)
 
 
-@router.get("/users", status_code = status.HTTP_200_OK)
-async def get_user(db : db_dependency):
-    return db.query(Users).all()
+@router.get("/users", status_code = status.HTTP_200_OK, response_model = UserPage, response_model_exclude_unset = True)
+async def get_user(db : db_dependency, page : page_dependency):
+    return await fetch_page(db, Users, page, hidden = USER_HIDDEN_FIELDS)
 
 
 @router.post("/token", response_model = Token)
 async def login_for_access_token(form_data : Annotated[OAuth2PasswordRequestForm, Depends()], db : db_dependency):
-    user = authenticate_user(form_data.username, form_data.password, db)
+    credentials = await get_credentials(form_data.username, db)
+    # Hand the pooled connection back before the hash check, the route needs no more queries
+    await db.close()
+    
+    user = await authenticate_user(credentials, form_data.password)
     if not user:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Could not validate user.")
     else:
         token = create_access_token(user.username, user.id, user.role, timedelta(minutes = 20))
         return {"access_token" : token, "token_type" : "bearer"}
 
-templates = Jinja2Templates(directory = "templates")
 
 @router.get("/login-page")
 async def render_login_page(request : Request):
@@ -1,61 +1,139 @@
 # In-built packages (Standard Library modules)
+from typing import Annotated, Optional
 
 # External packages
+from sqlalchemy import select, insert, update, delete, bindparam, tuple_
 from starlette import status
 from fastapi import  APIRouter
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from fastapi import HTTPException, Path, Request
+from fastapi import Body, Depends, HTTPException, Path, Query, Request, Response
+from pydantic import Field
 
 # Our Own Imports
 from app.models import Todos
-from app.schemas import TodoRequest
-from app.config import get_current_user, user_dependency, db_dependency
+from app.schemas import TodoRequest, TodoBulkUpdateRequest, TodoOut, TodoPage
+from app.export import ExportFormat, export_response
+from app.pagination import PageParams, page_dependency, fetch_page, page_statement
+from app.conditional import make_etag, etag_matches, not_modified, set_etag
+from app.templating import templates, StreamedRows, StreamingTemplateResponse
+from app.config import get_current_user, user_dependency, db_dependency, row_cache, todo_writes
 
 router = APIRouter(prefix = "/todo", tags = ["todo"])
 
+# Upper bound on the number of items accepted by one /todo/bulk call
+MAX_BULK_ITEMS = 500
 
-@router.get("/", status_code = status.HTTP_200_OK)
-async def read_all(user : user_dependency, db : db_dependency):
+# Rows rendered server-side by /todo/todo-page; base.js fetches the rest while the user scrolls
+TODO_PAGE_SIZE = 25
+TODO_PAGE_FIELDS = "id,title,complete"
+
+
+class TodoFilters:
+    """?complete= and ?priority= of the todo page, turned into WHERE clauses."""
+    
+    def __init__(self, 
+                 complete : Optional[bool] = Query(None, description = "Only complete (true) or open (false) todos"), 
+                 priority : Optional[int] = Query(None, gt = 0, lt = 6, description = "Only todos with this priority")):
+        self.complete = complete
+        self.priority = priority
+    
+    def criteria(self) -> list:
+        criteria = []
+        if self.complete is not None:
+            criteria.append(Todos.complete == self.complete)
+        if self.priority is not None:
+            criteria.append(Todos.priority == self.priority)
+        return criteria
+
+
+todo_filter_dependency = Annotated[TodoFilters, Depends(TodoFilters)]
+
+
+@router.get("/", status_code = status.HTTP_200_OK, response_model = TodoPage, response_model_exclude_unset = True)
+async def read_all(user : user_dependency, 
+                   db : db_dependency, 
+                   page : page_dependency, 
+                   request : Request, 
+                   response : Response):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    # The version token changes whenever one of the listed todos is written, so an
+    # unchanged (version, page) pair can be answered with 304 before any query runs.
+    # It is read BEFORE the query: a write racing with it costs a 200, never a stale 304.
+    owner_id = user.get("id") if user.get("user_role") != "admin" else None
+    version = await row_cache.get_version(owner_id)
+    etag = make_etag("todos", owner_id, version, page.cursor, page.limit, page.fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    
+    if owner_id is not None:
+        return await fetch_page(db, Todos, page, Todos.owner_id == owner_id)
+    else:
+        return await fetch_page(db, Todos, page)
+
+
+@router.get("/export", status_code = status.HTTP_200_OK)
+async def export_todos(user : user_dependency, 
+                       db : db_dependency, 
+                       export_format : ExportFormat = Query(ExportFormat.ndjson, alias = "format", description = "ndjson or csv")):
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
     if user.get("user_role") != "admin":
-        return db.query(Todos).filter(Todos.owner_id == user.get("id")).all()
+        return export_response(db, Todos, export_format, Todos.owner_id == user.get("id"))
     else:
-        return db.query(Todos).all()
+        return export_response(db, Todos, export_format)
 
 
-@router.get("/read_todo/{todo_id}", status_code = status.HTTP_200_OK)
+@router.get("/read_todo/{todo_id}", status_code = status.HTTP_200_OK, response_model = TodoOut)
 async def read_todo(user : user_dependency, 
                     db : db_dependency, 
+                    request : Request, 
+                    response : Response, 
                     todo_id : int = Path(gt = 0, description = "Primary key of the entry in TODO Table.")):
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
-    todo = db.get(Todos, todo_id)
+    todo = await row_cache.get_todo(db, todo_id)
     if not todo:
         raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "Todo Not Found.")
     
-    if user.get("user_role") != "admin" and todo.owner_id != user.get("id"):
+    if user.get("user_role") != "admin" and todo["owner_id"] != user.get("id"):
         raise HTTPException(status_code = status.HTTP_403_FORBIDDEN, detail = "You are not allowed to view this todo.")
     
+    # Row hash of the (usually cached) row → a 304 skips validation and serialization
+    etag = make_etag("todo", todo)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    
     return todo
 
 
+async def _missing_or_forbidden(db, todo_id : int, action : str) -> HTTPException:
+    """
+    Error for a single-todo write whose WHERE matched nothing: the todo is either gone
+    (404) or someone else's (403). Only this failure path pays for the extra lookup.
+    """
+    if await db.scalar(select(Todos.id).where(Todos.id == todo_id)) is None:
+        return HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "Todo Not Found.")
+    return HTTPException(status_code = status.HTTP_403_FORBIDDEN, detail = f"You are not allowed to {action} this todo.")
+
+
 @router.post("/create_todo/", status_code = status.HTTP_201_CREATED)
 async def create_todo(user : user_dependency, db : db_dependency, todo_request : TodoRequest):
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
-    todo = Todos(**todo_request.model_dump(), owner_id = user.get("id"))
-    
-    db.add(todo)
-    db.commit()
+    # INSERT ... RETURNING id → the new id comes back with the insert, no refresh needed
+    statement = insert(Todos).values(**todo_request.model_dump(), owner_id = user.get("id")).returning(Todos.id)
+    todo_id = await todo_writes.write(db, lambda session : session.scalar(statement))
     
-    db.refresh(todo)  # IMPORTANT → loads the assigned ID
+    await row_cache.invalidate_todos(owner_ids = [user.get("id")])
     
-    return {"message" : "Todo item created successfully", "id" : todo.id}
+    return {"message" : "Todo item created successfully", "id" : todo_id}
 
 
 @router.put("/update_todo/{todo_id}", status_code = status.HTTP_200_OK)
@@ -66,22 +144,18 @@ async def update_todo(user : user_dependency,
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
-    todo = db.get(Todos, todo_id)
-    
-    if not todo:
-        raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "Todo Not Found.")
-    
-    if user.get("user_role") != "admin" and todo.owner_id != user.get("id"):
-        raise HTTPException(status_code = status.HTTP_403_FORBIDDEN, detail = "You are not allowed to update this todo.")
-    
-    for field, value in todo_request.model_dump().items():
-        setattr(todo, field, value)
+    # UPDATE ... WHERE id = ? [AND owner_id = ?] RETURNING owner_id → ownership check and write in one statement
+    statement = update(Todos).where(Todos.id == todo_id).values(**todo_request.model_dump()).returning(Todos.owner_id)
+    if user.get("user_role") != "admin":
+        statement = statement.where(Todos.owner_id == user.get("id"))
     
-    db.commit()
+    owner_id = await todo_writes.write(db, lambda session : session.scalar(statement))
+    if owner_id is None:
+        raise await _missing_or_forbidden(db, todo_id, "update")
     
-    db.refresh(todo)  # IMPORTANT → loads the assigned ID
+    await row_cache.invalidate_todos([todo_id], [owner_id])
     
-    return {"message" : "Todo item details updated successfully", "id" : todo.id}
+    return {"message" : "Todo item details updated successfully", "id" : todo_id}
 
 
 @router.delete("/delete_todo/{todo_id}", status_code = status.HTTP_200_OK)
@@ -91,22 +165,112 @@ async def delete_todo(user : user_dependency,
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
-    todo = db.get(Todos, todo_id)
+    # DELETE ... WHERE id = ? [AND owner_id = ?] RETURNING owner_id
+    statement = delete(Todos).where(Todos.id == todo_id).returning(Todos.owner_id)
+    if user.get("user_role") != "admin":
+        statement = statement.where(Todos.owner_id == user.get("id"))
     
-    if not todo:
-        raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "Todo Not Found.")
+    owner_id = await todo_writes.write(db, lambda session : session.scalar(statement))
+    if owner_id is None:
+        raise await _missing_or_forbidden(db, todo_id, "delete")
     
-    if user.get("user_role") == "admin":
-        pass
-    elif todo.owner_id != user.get("id"):
-        raise HTTPException(status_code = status.HTTP_403_FORBIDDEN, detail = "You are not allowed to delete this todo.")
+    await row_cache.invalidate_todos([todo_id], [owner_id])
     
-    db.delete(todo)
-    db.commit()
+    return {"message" : "Todo deleted successfully", "id" : todo_id}
+
+
+@router.post("/bulk", status_code = status.HTTP_201_CREATED)
+async def bulk_create_todos(user : user_dependency, 
+                            db : db_dependency, 
+                            todo_requests : Annotated[list[TodoRequest], Body(min_length = 1, max_length = MAX_BULK_ITEMS)]):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    rows = [{**todo_request.model_dump(), "owner_id" : user.get("id")} for todo_request in todo_requests]
+    
+    # One executemany INSERT ... RETURNING id, in request order, inside one transaction
+    result = await db.execute(insert(Todos).returning(Todos.id, sort_by_parameter_order = True), rows)
+    created_ids = result.scalars().all()
+    await db.commit()
     
-    return {"message" : "Todo deleted successfully", "id" : todo.id}
+    await row_cache.invalidate_todos(owner_ids = [user.get("id")])
+    
+    return {
+        "message" : f"{len(created_ids)} todo items created successfully", 
+        "results" : [{"id" : todo_id, "status_code" : status.HTTP_201_CREATED} for todo_id in created_ids]
+    }
 
-templates = Jinja2Templates(directory = "templates")
+
+async def _check_bulk_ownership(user : dict, db, todo_ids : list[int], action : str):
+    """
+    Looks up the owners of every requested todo in ONE query and returns
+    ({id the user may touch : its owner_id}, {id : per-item error result}).
+    
+    The rows stay locked (SELECT ... FOR UPDATE) until the caller commits, and the
+    caller's write is also filtered on the owners returned here, so a todo that
+    changes owner after this check is never written.
+    """
+    statement = select(Todos.id, Todos.owner_id).where(Todos.id.in_(todo_ids)).with_for_update()
+    owners = dict((await db.execute(statement)).all())
+    
+    allowed, errors = {}, {}
+    for todo_id in todo_ids:
+        if todo_id not in owners:
+            errors[todo_id] = {"id" : todo_id, "status_code" : status.HTTP_404_NOT_FOUND, "detail" : "Todo Not Found."}
+        elif user.get("user_role") != "admin" and owners[todo_id] != user.get("id"):
+            errors[todo_id] = {"id" : todo_id, "status_code" : status.HTTP_403_FORBIDDEN, 
+                               "detail" : f"You are not allowed to {action} this todo."}
+        else:
+            allowed[todo_id] = owners[todo_id]
+    
+    return allowed, errors
+
+
+@router.put("/bulk", status_code = status.HTTP_200_OK)
+async def bulk_update_todos(user : user_dependency, 
+                            db : db_dependency, 
+                            todo_requests : Annotated[list[TodoBulkUpdateRequest], Body(min_length = 1, max_length = MAX_BULK_ITEMS)]):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    todo_ids = [todo_request.id for todo_request in todo_requests]
+    allowed, errors = await _check_bulk_ownership(user, db, todo_ids, "update")
+    
+    rows = [{**todo_request.model_dump(), "checked_owner_id" : allowed[todo_request.id]} 
+            for todo_request in todo_requests if todo_request.id in allowed]
+    if rows:
+        # ORM bulk UPDATE by primary key → a single executemany, only where the owner is still the checked one
+        statement = update(Todos).where(Todos.owner_id == bindparam("checked_owner_id"))
+        await db.execute(statement, rows, execution_options = {"synchronize_session" : None})
+        await db.commit()
+        await row_cache.invalidate_todos(allowed.keys(), allowed.values())
+    
+    return {
+        "message" : f"{len(rows)} todo items updated successfully", 
+        "results" : [errors.get(todo_id, {"id" : todo_id, "status_code" : status.HTTP_200_OK}) for todo_id in todo_ids]
+    }
+
+
+@router.delete("/bulk", status_code = status.HTTP_200_OK)
+async def bulk_delete_todos(user : user_dependency, 
+                            db : db_dependency, 
+                            todo_ids : Annotated[list[Annotated[int, Field(gt = 0)]], Body(min_length = 1, max_length = MAX_BULK_ITEMS)]):
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    allowed, errors = await _check_bulk_ownership(user, db, todo_ids, "delete")
+    
+    deleted = 0
+    if allowed:
+        statement = delete(Todos).where(tuple_(Todos.id, Todos.owner_id).in_(list(allowed.items())))
+        deleted = (await db.execute(statement)).rowcount
+        await db.commit()
+        await row_cache.invalidate_todos(allowed.keys(), allowed.values())
+    
+    return {
+        "message" : f"{deleted} todo items deleted successfully", 
+        "results" : [errors.get(todo_id, {"id" : todo_id, "status_code" : status.HTTP_200_OK}) for todo_id in todo_ids]
+    }
 
 
 def redirect_to_login():
@@ -116,17 +280,46 @@ def redirect_to_login():
 
 
 @router.get("/todo-page")
-async def render_todo_page(request : Request, db : db_dependency):
+async def render_todo_page(request : Request, db : db_dependency, filters : todo_filter_dependency):
     try:
         user = await get_current_user(request.cookies.get("access_token"))
         if user is None:
             return redirect_to_login()
-        todos = db.query(Todos).filter(Todos.owner_id == user.get("id")).all()
-        return templates.TemplateResponse("todo.html", {"request" : request, "todos" : todos, "user" : user})
+        
+        # Only the first page is rendered here, the browser asks /todo-page/items for the rest.
+        # The rows are read while the page streams, after the layout head has been sent.
+        page = PageParams(cursor = None, limit = TODO_PAGE_SIZE, fields = TODO_PAGE_FIELDS)
+        statement = page_statement(Todos, page, Todos.owner_id == user.get("id"), *filters.criteria())
+        
+        return StreamingTemplateResponse("todo.html", {"request" : request, 
+                                                       "todos" : StreamedRows(db, statement, limit = page.limit), 
+                                                       "filters" : filters, 
+                                                       "page_size" : TODO_PAGE_SIZE, 
+                                                       "user" : user})
     except Exception as e:
         return redirect_to_login()
 
 
+@router.get("/todo-page/items", status_code = status.HTTP_200_OK, response_model = TodoPage, response_model_exclude_unset = True)
+async def read_todo_page_items(user : user_dependency, 
+                               db : db_dependency, 
+                               page : page_dependency, 
+                               filters : todo_filter_dependency, 
+                               request : Request, 
+                               response : Response):
+    """Further pages of the todo page: the user's own todos, filtered like the page itself."""
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
+    
+    version = await row_cache.get_version(user.get("id"))
+    etag = make_etag("todo-page", user.get("id"), version, page.cursor, page.limit, page.fields, filters.complete, filters.priority)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    
+    return await fetch_page(db, Todos, page, Todos.owner_id == user.get("id"), *filters.criteria())
+
+
 @router.get("/register-page")
 async def render_register_page(request : Request):
     return templates.TemplateResponse("register.html", {"request" : request})
@@ -149,7 +342,7 @@ async def render_edit_todo_page(request : Request, db : db_dependency, todo_id :
         user = await get_current_user(request.cookies.get("access_token"))
         if user is None:
             return redirect_to_login()
-        todo = db.get(Todos, todo_id)
+        todo = await row_cache.get_todo(db, todo_id)
         return templates.TemplateResponse("edit-todo.html", {"request" : request, "todo" : todo, "user" : user})
     except Exception as e:
         return redirect_to_login()
@@ -1,42 +1,45 @@
 # In-built packages (Standard Library modules)
+from typing import Optional
 
 # External packages
+from sqlalchemy import select, update
 from starlette import status
 from fastapi import APIRouter, HTTPException, Path
 
 # Our Own Imports
 from app.models import Users
-from app.routers.auth import authenticate_user
-from app.config import db_dependency, bcrypt_context, user_dependency
-from app.schemas import ChangePassword, User_Update_Request_Body, User_Request_Body
+from app.routers.auth import get_credentials, authenticate_user
+from app.config import db_dependency, password_hasher, user_dependency, row_cache
+from app.schemas import ChangePassword, User_Update_Request_Body, User_Request_Body, UserOut
 
 
 router = APIRouter(prefix = "/users", tags = ["users"])
 
 @router.post("/", status_code = status.HTTP_201_CREATED)
 async def create_user(db : db_dependency, user_request : User_Request_Body):
+    hashed_password = await password_hasher.hash(user_request.password)
     user_model_object = Users(email = user_request.email, 
                               username = user_request.username, 
                               first_name = user_request.first_name, 
                               last_name = user_request.last_name, 
-                              hashed_password = bcrypt_context.hash(user_request.password), 
+                              hashed_password = hashed_password, 
                               is_active = True, 
                               role = user_request.role, 
                               phone_number = user_request.phone_number
                               )
     
     db.add(user_model_object)
-    db.commit()
+    await db.commit()
     
     return {"message" : "User created successfully"}
 
 
-@router.get("/get_user", status_code = status.HTTP_200_OK)
+@router.get("/get_user", status_code = status.HTTP_200_OK, response_model = Optional[UserOut])
 async def get_current_user_details(user : user_dependency, db : db_dependency):
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
-    return db.get(Users, user.get("id"))
+    return await row_cache.get_user(db, user.get("id"))
 
 
 @router.post("/change_password", status_code = status.HTTP_200_OK)
@@ -44,16 +47,22 @@ async def change_password(user : user_dependency, db : db_dependency, change_pas
     if user is None:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Authentication Failed")
     
-    user = authenticate_user(user.get("username"), change_password_payload.old_password, db)
+    credentials = await get_credentials(user.get("username"), db)
+    # Hand the pooled connection back during the hash checks; the UPDATE below checks out a new one
+    await db.close()
+    
+    user = await authenticate_user(credentials, change_password_payload.old_password)
     
     if not user:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Could not validate user.")
     else:
         if change_password_payload.new_password == change_password_payload.confirm_new_password:
-            user.hashed_password = bcrypt_context.hash(change_password_payload.confirm_new_password)
-            db.add(user)
-            db.commit()
-            return {"message" : "Password updated successfully.", "id" : user.id}
+            user_id = user.id
+            hashed_password = await password_hasher.hash(change_password_payload.confirm_new_password)
+            await db.execute(update(Users).where(Users.id == user_id).values(hashed_password = hashed_password))
+            await db.commit()
+            await row_cache.invalidate_user(user_id)
+            return {"message" : "Password updated successfully.", "id" : user_id}
         else:
             raise HTTPException(status_code = status.HTTP_400_BAD_REQUEST, detail = "New passwords do not match.")
 
@@ -71,17 +80,18 @@ async def update_user(user : user_dependency,
     if user.get("id") != user_id:
         raise HTTPException(status_code = status.HTTP_401_UNAUTHORIZED, detail = "Access Denied. You can only make changes to your user account.")
     
-    # 3. Fetch user
-    user_obj = db.get(Users, user_id)
-    if not user_obj:
+    # 3. Apply partial update in one UPDATE ... RETURNING id (no row → the user does not exist)
+    update_data = user_request.model_dump(exclude_unset = True)
+    if update_data:
+        statement = update(Users).where(Users.id == user_id).values(**update_data).returning(Users.id)
+    else:
+        statement = select(Users.id).where(Users.id == user_id)
+    
+    if await db.scalar(statement) is None:
         raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "User Not Found.")
     
-    # 4. Apply partial update (automatic field mapping)
-    update_data = user_request.model_dump(exclude_unset = True)
-    for field, value in update_data.items():
-        setattr(user_obj, field, value)
+    await db.commit()
     
-    db.commit()
-    db.refresh(user_obj)  # IMPORTANT → loads the assigned ID
+    await row_cache.invalidate_user(user_id)
     
-    return {"message" : "User details updated successfully", "id" : user_obj.id}
\ No newline at end of file
+    return {"message" : "User details updated successfully", "id" : user_id}
\ No newline at end of file
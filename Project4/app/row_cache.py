@@ -0,0 +1,264 @@
+# In-built packages (Standard Library modules)
+import json
+import time
+import threading
+from abc import ABC, abstractmethod
+from uuid import uuid4
+from collections import OrderedDict
+
+# External packages
+from sqlalchemy import inspect
+from starlette.concurrency import run_in_threadpool
+
+# Our Own Imports
+from app.models import Todos, Users, USER_HIDDEN_FIELDS
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# Every backend stores opaque bytes under string keys with a TTL. The shared
+# backend is optional and can be anything that implements the same three
+# methods (a Redis client wrapper, memcached, ...).
+# ---------------------------------------------------------------------------
+class CacheBackend(ABC):
+    """Interface of a cache backend (values are serialized rows, i.e. bytes)."""
+    
+    @abstractmethod
+    def get(self, key : str) -> bytes | None:
+        """Stored value, or None if the key is missing or expired."""
+    
+    @abstractmethod
+    def set(self, key : str, value : bytes, ttl : float):
+        """Stores `value` for `ttl` seconds."""
+    
+    @abstractmethod
+    def delete(self, *keys : str):
+        """Drops the keys; missing keys are ignored."""
+
+
+class LRUBackend(CacheBackend):
+    """In-process LRU with per-entry expiry. Thread-safe, no I/O, so it is called inline."""
+    
+    def __init__(self, max_size : int = 10_000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value, ttl):
+        if self.max_size <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last = False)
+    
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Shared backend on top of redis-py (optional dependency: `pip install .[cache]`).
+    Calls block on the network, so RowCache runs them in the threadpool.
+    """
+    
+    def __init__(self, url : str, prefix : str = "project4:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("ROW_CACHE_URL is set but the 'redis' package is not installed (pip install .[cache])") from e
+        
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+    
+    def get(self, key):
+        return self._client.get(self.prefix + key)
+    
+    def set(self, key, value, ttl):
+        self._client.set(self.prefix + key, value, px = max(1, int(ttl * 1000)))
+    
+    def delete(self, *keys):
+        if keys:
+            self._client.delete(*[self.prefix + key for key in keys])
+
+
+# ---------------------------------------------------------------------------
+# Row cache
+# ---------------------------------------------------------------------------
+def row_to_dict(row, hidden : frozenset = frozenset()) -> dict:
+    """Column values of an ORM object (what FastAPI would have serialized anyway), minus `hidden`."""
+    return {attribute.key : getattr(row, attribute.key) for attribute in inspect(row).mapper.column_attrs 
+            if attribute.key not in hidden}
+
+
+def todo_key(todo_id : int) -> str:
+    return f"todo:{todo_id}"
+
+
+def user_key(user_id : int) -> str:
+    return f"user:{user_id}"
+
+
+def version_key(owner_id : int | None) -> str:
+    """Version of one owner's todos, or of all todos (owner_id None, what admins list)."""
+    return f"version:owner:{owner_id}" if owner_id is not None else "version:all"
+
+
+class RowCache:
+    """
+    Read-through cache of Todos / Users rows by id.
+    
+    Lookups go local LRU → shared backend (if configured) → database, filling the
+    tiers on the way back. Values are the rows' column dicts serialized as JSON,
+    so cached reads never touch a Session.
+    
+    The write routes call the invalidate_* methods AFTER their commit. A reader that
+    raced with a writer can still put the old row back; `ttl` bounds how long that
+    (and any write that bypasses the app) can be served from the shared backend. An
+    invalidation only reaches the in-process LRU of the process that made the write,
+    so local copies are always kept for the shorter `local_ttl`: without a shared
+    backend, other workers see a write after at most that long.
+    
+    It also hands out version tokens for the ETags of todo lists: a random token per
+    owner that the todo invalidations delete, so the next read mints a new one.
+    In the shared backend versions live for `version_ttl`, far longer than rows, since
+    they are tiny and every new token costs each polling client one full response.
+    Like rows, a process trusts its own copy only for `local_ttl`: without a shared
+    backend every worker mints its own tokens, and one worker's write must not leave
+    the others answering 304 with their old token for longer than that.
+    """
+    
+    def __init__(self, max_size : int = 10_000, ttl : float = 60, shared : CacheBackend | None = None, local_ttl : float = 5, 
+                 version_ttl : float = 3600):
+        self.enabled = max_size > 0
+        self.ttl = ttl
+        self.version_ttl = version_ttl
+        self.local = LRUBackend(max_size)
+        self.shared = shared
+        self.local_ttl = min(local_ttl, ttl)
+        self._lock = threading.Lock()
+        self.counters = {"local_hits" : 0, "shared_hits" : 0, "misses" : 0, "invalidations" : 0}
+    
+    def _count(self, name : str, amount : int = 1):
+        with self._lock:
+            self.counters[name] += amount
+    
+    async def _get(self, key : str):
+        value = self.local.get(key)
+        if value is not None:
+            self._count("local_hits")
+            return json.loads(value)
+        
+        if self.shared is not None:
+            value = await run_in_threadpool(self.shared.get, key)
+            if value is not None:
+                self._count("shared_hits")
+                self.local.set(key, value, self.local_ttl)
+                return json.loads(value)
+        
+        self._count("misses")
+        return None
+    
+    async def _set(self, key : str, data, ttl : float | None = None):
+        ttl = ttl or self.ttl
+        value = json.dumps(data).encode("utf-8")
+        self.local.set(key, value, min(ttl, self.local_ttl))
+        if self.shared is not None:
+            await run_in_threadpool(self.shared.set, key, value, ttl)
+    
+    async def _read_through(self, key : str, load):
+        if not self.enabled:
+            return await load()
+        
+        data = await self._get(key)
+        if data is None:
+            data = await load()
+            if data is not None:
+                await self._set(key, data)
+        return data
+    
+    async def get_todo(self, db, todo_id : int) -> dict | None:
+        async def load():
+            todo = await db.get(Todos, todo_id)
+            return row_to_dict(todo) if todo is not None else None
+        return await self._read_through(todo_key(todo_id), load)
+    
+    async def get_user(self, db, user_id : int) -> dict | None:
+        async def load():
+            user = await db.get(Users, user_id)
+            # Password hashes never leave the database, not even into the (possibly shared) cache
+            return row_to_dict(user, USER_HIDDEN_FIELDS) if user is not None else None
+        return await self._read_through(user_key(user_id), load)
+    
+    async def get_version(self, owner_id : int | None) -> str:
+        """
+        Current version token of an owner's todos (None → all todos). Never touches the database.
+        _set keeps the local copy for at most `local_ttl`, so a stale token expires quickly.
+        """
+        version = await self._get(version_key(owner_id)) if self.enabled else None
+        if version is None:
+            version = uuid4().hex
+            if self.enabled:
+                await self._set(version_key(owner_id), version, self.version_ttl)
+        return version
+    
+    async def invalidate(self, *keys : str):
+        if not self.enabled or not keys:
+            return
+        
+        self._count("invalidations", len(keys))
+        self.local.delete(*keys)
+        if self.shared is not None:
+            await run_in_threadpool(self.shared.delete, *keys)
+    
+    async def invalidate_todos(self, todo_ids = (), owner_ids = ()):
+        owner_ids = set(owner_ids)
+        await self.invalidate(*[todo_key(todo_id) for todo_id in todo_ids], 
+                              *[version_key(owner_id) for owner_id in owner_ids], 
+                              version_key(None))
+    
+    async def invalidate_user(self, user_id : int, todo_ids = ()):
+        await self.invalidate(user_key(user_id), version_key(user_id), version_key(None), 
+                              *[todo_key(todo_id) for todo_id in todo_ids])
+    
+    def clear(self):
+        self.local.clear()
+    
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["local_hits"] + counters["shared_hits"] + counters["misses"]
+        hits = counters["local_hits"] + counters["shared_hits"]
+        return {
+            "enabled" : self.enabled, 
+            "shared_backend" : type(self.shared).__name__ if self.shared is not None else None, 
+            "max_size" : self.local.max_size, 
+            "size" : len(self.local), 
+            **counters, 
+            "hit_ratio" : round(hits / lookups, 4) if lookups else 0.0
+        }
@@ -19,6 +19,10 @@ class TodoRequest(BaseModel):
     complete : bool
 
 
+class TodoBulkUpdateRequest(TodoRequest):
+    id : int = Field(gt = 0, description = "Primary key of the entry in TODO Table.")
+
+
 class ChangePassword(BaseModel):
     old_password : str
     new_password : str
@@ -74,4 +78,67 @@ class User_Update_Request_Body(BaseModel):
                 "phone_number" : "1234567890"
             }
         }
-    }
\ No newline at end of file
+    }
+
+# ---------------------------------------------------------------------------
+# Response models
+# Declared as response_model on the read routes, so FastAPI validates the ORM
+# objects / rows with pydantic-core (from_attributes) instead of walking them
+# with jsonable_encoder. Users never expose hashed_password.
+# ---------------------------------------------------------------------------
+class TodoOut(BaseModel):
+    id : int
+    title : str
+    description : str
+    priority : int
+    complete : bool
+    owner_id : int
+    
+    model_config = {"from_attributes" : True}
+
+
+class UserOut(BaseModel):
+    id : int
+    email : str
+    username : str
+    first_name : str
+    last_name : str
+    is_active : bool
+    role : str
+    phone_number : str
+    
+    model_config = {"from_attributes" : True}
+
+
+class TodoFieldsOut(BaseModel):
+    """A todo projected with ?fields= (id is always there, the rest only when requested)."""
+    id : int
+    title : Optional[str] = None
+    description : Optional[str] = None
+    priority : Optional[int] = None
+    complete : Optional[bool] = None
+    owner_id : Optional[int] = None
+
+
+class UserFieldsOut(BaseModel):
+    """A user projected with ?fields= (id is always there, the rest only when requested)."""
+    id : int
+    email : Optional[str] = None
+    username : Optional[str] = None
+    first_name : Optional[str] = None
+    last_name : Optional[str] = None
+    is_active : Optional[bool] = None
+    role : Optional[str] = None
+    phone_number : Optional[str] = None
+
+
+# Paginated list responses; routes use response_model_exclude_unset so a
+# projected item only carries the fields that were selected
+class TodoPage(BaseModel):
+    items : list[TodoFieldsOut]
+    next_cursor : Optional[int] = None
+
+
+class UserPage(BaseModel):
+    items : list[UserFieldsOut]
+    next_cursor : Optional[int] = None
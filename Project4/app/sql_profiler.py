@@ -0,0 +1,142 @@
+# In-built packages (Standard Library modules)
+import time
+from os import environ
+from contextvars import ContextVar
+
+# External packages
+from sqlalchemy import event
+
+# Our Own Imports
+from app.logger import get_logger
+from app.metrics import route_template
+
+
+# Create module-specific logger (uses this file's name internally)
+logger = get_logger(__file__)
+
+# Opt-in: SQL_PROFILING=true registers the cursor events and the middleware
+SQL_PROFILING = environ.get("SQL_PROFILING", "false").lower() == "true"
+
+# A request issuing more statements than this is logged as a warning
+SQL_QUERY_BUDGET = int(environ.get("SQL_QUERY_BUDGET", "10"))
+
+# The same statement text running this often in one request smells like an N+1 loop
+SQL_REPEAT_THRESHOLD = int(environ.get("SQL_REPEAT_THRESHOLD", "5"))
+
+# How many of the slowest statements are kept per request
+SQL_SLOWEST_STATEMENTS = int(environ.get("SQL_SLOWEST_STATEMENTS", "3"))
+
+
+class RequestProfile:
+    """
+    SQL statements issued while serving one request.
+    
+    Statements are aggregated by SQL text (count, total and max duration), so a
+    request running the same SELECT 500 times costs one entry, not 500.
+    """
+    
+    def __init__(self):
+        self.query_count = 0
+        self.total_seconds = 0.0
+        self.statements = {}
+    
+    def record(self, statement : str, seconds : float):
+        self.query_count += 1
+        self.total_seconds += seconds
+        
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+    
+    def slowest(self, limit : int = SQL_SLOWEST_STATEMENTS) -> list[dict]:
+        ordered = sorted(self.statements.items(), key = lambda item : item[1][2], reverse = True)
+        return [{"statement" : statement, "count" : count, "total_ms" : round(total * 1000, 3), "max_ms" : round(longest * 1000, 3)}
+                for statement, (count, total, longest) in ordered[:limit]]
+    
+    def repeated(self, threshold : int = SQL_REPEAT_THRESHOLD) -> list[dict]:
+        return [{"statement" : statement, "count" : count}
+                for statement, (count, _, _) in self.statements.items() if count >= threshold]
+    
+    def summary(self) -> dict:
+        return {"query_count" : self.query_count, 
+                "db_time_ms" : round(self.total_seconds * 1000, 3), 
+                "slowest" : self.slowest()}
+    
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_seconds * 1000:.3f};desc="{self.query_count} queries"'
+
+
+# The profile of the request being served. Threadpool calls (ThreadedSession) run in a
+# copy of the context, which still points at the same RequestProfile object.
+_current_profile : ContextVar[RequestProfile | None] = ContextVar("sql_request_profile", default = None)
+
+
+# The start time lives on the statement's execution context, not on the (pooled) connection:
+# a failing statement never reaches after_cursor_execute, and its context is simply dropped
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._sql_profiler_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = context._sql_profiler_started
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record(statement, time.perf_counter() - started)
+
+
+def profile_engine(engine):
+    """Hooks the profiler into an Engine (pass async_engine.sync_engine for the async one)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLProfilerMiddleware:
+    """
+    Pure ASGI middleware: collects the statements of each request into a RequestProfile,
+    exposes it as request.state.sql_profile, adds a Server-Timing header and warns when
+    the route goes over SQL_QUERY_BUDGET or repeats a statement SQL_REPEAT_THRESHOLD times.
+    
+    Statements issued after the response headers went out (streaming bodies, the
+    session close in get_db) still count towards the log line, not the header.
+    """
+    
+    def __init__(self, app, query_budget : int = SQL_QUERY_BUDGET):
+        self.app = app
+        self.query_budget = query_budget
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        profile = RequestProfile()
+        scope.setdefault("state", {})["sql_profile"] = profile
+        token = _current_profile.set(profile)
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", profile.server_timing().encode())]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            self._report(scope, profile)
+    
+    def _report(self, scope, profile : RequestProfile):
+        route = f"{scope['method']} {route_template(scope)}"
+        
+        if profile.query_count > self.query_budget:
+            logger.warning(f"{route} issued {profile.query_count} SQL statements (budget {self.query_budget}) "
+                           f"in {profile.total_seconds * 1000:.1f} ms, slowest: {profile.slowest()}")
+        
+        for repeat in profile.repeated():
+            logger.warning(f"{route} ran the same statement {repeat['count']} times (possible N+1): {repeat['statement']}")
+        
+        logger.debug(f"{route} SQL profile: {profile.summary()}")
@@ -0,0 +1,161 @@
+# In-built packages (Standard Library modules)
+import gzip
+import hashlib
+import mimetypes
+from os import environ
+from pathlib import Path
+
+# External packages
+from jinja2 import pass_context
+from starlette import status
+from starlette.responses import Response
+
+# Our Own Imports
+from app.logger import get_logger
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Create module-specific logger (uses this file's name internally)
+logger = get_logger(__file__)
+
+# Fingerprinted URLs never change content, so browsers may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Plain (un-fingerprinted) URLs keep working but must be revalidated
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# Only text-like assets are worth compressing (images / fonts already are)
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+# Brotli at 11 is slow to build but it runs once per file at startup
+BROTLI_QUALITY = int(environ.get("STATIC_BROTLI_QUALITY", "11"))
+
+
+class Asset:
+    """One static file with its fingerprint and its precompressed bodies ({"br" : ..., "gzip" : ..., "identity" : ...})."""
+    
+    __slots__ = ("path", "fingerprinted_path", "media_type", "digest", "bodies")
+    
+    def __init__(self, path : str, content : bytes):
+        self.path = path
+        self.digest = hashlib.sha256(content).hexdigest()[:12]
+        
+        # css/bootstrap.css → css/bootstrap.<digest>.css
+        stem, dot, suffix = path.rpartition(".")
+        self.fingerprinted_path = f"{stem}.{self.digest}.{suffix}" if dot and "/" not in suffix else f"{path}.{self.digest}"
+        
+        self.media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self.bodies = {"identity" : content}
+        
+        if self.media_type.startswith(COMPRESSIBLE_TYPES):
+            self._add_encoding("gzip", gzip.compress(content, compresslevel = 9, mtime = 0))
+            if brotli is not None:
+                self._add_encoding("br", brotli.compress(content, quality = BROTLI_QUALITY))
+    
+    def _add_encoding(self, encoding : str, body : bytes):
+        # Tiny files can come out bigger than they went in
+        if len(body) < len(self.bodies["identity"]):
+            self.bodies[encoding] = body
+    
+    def etag(self, encoding : str) -> str:
+        return f'"{self.digest}-{encoding}"'
+
+
+def accepted_encodings(accept_encoding : str) -> set[str]:
+    """Codings the client accepts (q > 0) from an Accept-Encoding header."""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        if coding:
+            accepted.add(coding.strip())
+    return accepted
+
+
+def choose_encoding(asset : Asset, accept_encoding : str) -> str:
+    accepted = accepted_encodings(accept_encoding)
+    for encoding in ("br", "gzip"):
+        if encoding in asset.bodies and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
+
+
+class StaticAssets:
+    """
+    Replacement for StaticFiles (mount it the same way).
+    
+    Reads every file under `directory` once, fingerprints it by content hash and keeps
+    gzip / brotli (when the `brotli` package is installed) copies in memory. Each
+    request gets the best encoding its Accept-Encoding allows. Fingerprinted URLs are
+    sent with an immutable Cache-Control; the plain URLs still work but revalidate.
+    
+    Templates get their URLs from static_url(), registered as a Jinja global.
+    """
+    
+    def __init__(self, directory : str | Path):
+        self.directory = Path(directory)
+        self.assets = {}
+        self.by_fingerprint = {}
+        
+        for file_path in sorted(self.directory.rglob("*")):
+            if file_path.is_file():
+                asset = Asset(file_path.relative_to(self.directory).as_posix(), file_path.read_bytes())
+                self.assets[asset.path] = asset
+                self.by_fingerprint[asset.fingerprinted_path] = asset
+        
+        logger.info(f"Fingerprinted {len(self.assets)} static assets from '{self.directory}'")
+    
+    def fingerprinted(self, path : str) -> str:
+        """Fingerprinted path of an asset, or the path itself for unknown files."""
+        asset = self.assets.get(path.lstrip("/"))
+        return asset.fingerprinted_path if asset is not None else path.lstrip("/")
+    
+    async def __call__(self, scope, receive, send):
+        # Mount leaves the full path in scope["path"] and its own prefix in root_path
+        path = scope["path"].removeprefix(scope.get("root_path", "")).lstrip("/")
+        
+        if scope["method"] not in ("GET", "HEAD"):
+            response = Response(status_code = status.HTTP_405_METHOD_NOT_ALLOWED, headers = {"Allow" : "GET, HEAD"})
+        elif path in self.by_fingerprint:
+            response = self._respond(scope, self.by_fingerprint[path], IMMUTABLE_CACHE_CONTROL)
+        elif path in self.assets:
+            response = self._respond(scope, self.assets[path], REVALIDATE_CACHE_CONTROL)
+        else:
+            response = Response("Not Found", status_code = status.HTTP_404_NOT_FOUND, media_type = "text/plain")
+        
+        await response(scope, receive, send)
+    
+    def _respond(self, scope, asset : Asset, cache_control : str) -> Response:
+        headers = {key.decode("latin-1") : value.decode("latin-1") for key, value in scope["headers"]}
+        encoding = choose_encoding(asset, headers.get("accept-encoding", ""))
+        
+        response_headers = {"Cache-Control" : cache_control, "ETag" : asset.etag(encoding), "Vary" : "Accept-Encoding"}
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        
+        if asset.etag(encoding) in [tag.strip().removeprefix("W/") for tag in headers.get("if-none-match", "").split(",")]:
+            return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = response_headers)
+        
+        body = asset.bodies[encoding]
+        if scope["method"] == "HEAD":
+            response_headers["Content-Length"] = str(len(body))
+            body = b""
+        return Response(body, media_type = asset.media_type, headers = response_headers)
+
+
+static_assets = StaticAssets(environ.get("STATIC_DIRECTORY", "static"))
+
+
+@pass_context
+def static_url(context, path : str) -> str:
+    """Jinja helper: {{ static_url('css/base.css') }} → http://host/static/css/base.<hash>.css"""
+    return str(context["request"].url_for("static", path = static_assets.fingerprinted(path)))
@@ -0,0 +1,235 @@
+# In-built packages (Standard Library modules)
+import os
+import stat
+import inspect
+from os import environ
+from pathlib import Path
+
+# External packages
+from jinja2 import nodes
+from jinja2.ext import Extension
+from starlette.responses import Response
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+# Our Own Imports
+from app.logger import get_logger
+from app.database import stream_partitions
+from app.row_cache import LRUBackend
+from app.static_assets import static_url
+
+
+# Create module-specific logger (uses this file's name internally)
+logger = get_logger(__file__)
+
+TEMPLATE_DIRECTORY = environ.get("TEMPLATE_DIRECTORY", "templates")
+
+# Re-check template files for changes on every render (development only)
+TEMPLATE_AUTO_RELOAD = environ.get("TEMPLATE_AUTO_RELOAD", "false").lower() == "true"
+
+# Compiled templates are kept here across restarts ("" switches the bytecode cache off). Unset → Jinja's
+# per-user directory in the temp dir, which it creates with 0700 permissions and checks the owner of
+TEMPLATE_CACHE_DIR = environ.get("TEMPLATE_CACHE_DIR")
+
+# {% cache %} blocks (layout head / navbar); off → the blocks simply render every time
+TEMPLATE_FRAGMENT_CACHE = environ.get("TEMPLATE_FRAGMENT_CACHE", "true").lower() == "true"
+TEMPLATE_FRAGMENT_TTL = float(environ.get("TEMPLATE_FRAGMENT_TTL", "300"))
+
+# Streamed pages: bytes of HTML per write, and rows per yield_per batch
+TEMPLATE_STREAM_CHUNK_SIZE = int(environ.get("TEMPLATE_STREAM_CHUNK_SIZE", "16384"))
+TEMPLATE_STREAM_BATCH_SIZE = int(environ.get("TEMPLATE_STREAM_BATCH_SIZE", "100"))
+
+
+class FragmentCacheExtension(Extension):
+    """
+    {% cache "navbar", user is not none %} ... {% endcache %}
+    
+    Renders the block once per distinct key and serves the stored HTML afterwards,
+    until `fragment_cache_ttl` runs out. Everything the block depends on must be part
+    of the key.
+    """
+    
+    tags = {"cache"}
+    
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache = LRUBackend(max_size = 1024), 
+                           fragment_cache_enabled = TEMPLATE_FRAGMENT_CACHE, 
+                           fragment_cache_ttl = TEMPLATE_FRAGMENT_TTL)
+    
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        
+        key_parts = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            key_parts.append(parser.parse_expression())
+        
+        body = parser.parse_statements(("name:endcache",), drop_needle = True)
+        return nodes.CallBlock(self.call_method("_cache_support", [nodes.List(key_parts)]), [], [], body).set_lineno(lineno)
+    
+    def _cache_support(self, key_parts, caller):
+        if not self.environment.fragment_cache_enabled:
+            return caller()
+        
+        key = "fragment:" + repr(tuple(str(part) for part in key_parts))
+        html = self.environment.fragment_cache.get(key)
+        if html is not None:
+            return html
+        
+        html = caller()
+        if inspect.isawaitable(html):
+            # Async environment → the body is a coroutine, Jinja awaits whatever we return
+            return self._store_async(key, html)
+        self._store(key, html)
+        return html
+    
+    async def _store_async(self, key, pending_html):
+        html = await pending_html
+        self._store(key, html)
+        return html
+    
+    def _store(self, key, html):
+        self.environment.fragment_cache.set(key, html, self.environment.fragment_cache_ttl)
+
+
+def _private_cache_dir(cache_dir : str) -> str:
+    """
+    Creates `cache_dir` (0700) if needed and refuses one another user could write to,
+    since the bytecode cache loads (marshal) code from it.
+    """
+    path = Path(cache_dir)
+    path.mkdir(mode = stat.S_IRWXU, parents = True, exist_ok = True)
+    
+    path_stat = path.lstat()
+    if (not stat.S_ISDIR(path_stat.st_mode) or path_stat.st_uid != os.getuid() 
+            or path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        raise RuntimeError(f"Template cache directory {cache_dir} must be a directory owned by this user "
+                           "and not writable by group / others")
+    return cache_dir
+
+
+def create_environment(directory : str = TEMPLATE_DIRECTORY, cache_dir : str | None = TEMPLATE_CACHE_DIR, 
+                       auto_reload : bool = TEMPLATE_AUTO_RELOAD, enable_async : bool = False) -> Environment:
+    bytecode_cache = None
+    if cache_dir != "":
+        if cache_dir is not None:
+            cache_dir = _private_cache_dir(cache_dir)
+        # Async templates compile to different code, so they get their own cache files
+        pattern = "__jinja2_async_%s.cache" if enable_async else "__jinja2_%s.cache"
+        bytecode_cache = FileSystemBytecodeCache(cache_dir, pattern)
+    
+    environment = Environment(loader = FileSystemLoader(directory), 
+                              autoescape = True, 
+                              auto_reload = auto_reload, 
+                              bytecode_cache = bytecode_cache, 
+                              enable_async = enable_async, 
+                              extensions = [FragmentCacheExtension])
+    environment.globals["static_url"] = static_url
+    return environment
+
+
+def precompile_templates(environment : Environment) -> int:
+    """Compiles every template up front (filling the bytecode cache), so no request pays for parsing."""
+    names = environment.list_templates(extensions = ["html"])
+    for name in names:
+        environment.get_template(name)
+    return len(names)
+
+
+# ---------------------------------------------------------------------------
+# Streamed rendering
+# ---------------------------------------------------------------------------
+class StreamedRows:
+    """
+    Rows of `statement` for a streamed template: {% for row in rows %} iterates a
+    yield_per cursor, so only `batch_size` rows are in memory at a time.
+    
+    Before every batch is fetched, the HTML rendered so far is sent, which is what
+    gets the page head to the browser while the database is still working.
+    With `limit`, iteration stops after that many rows and `has_more` tells whether
+    the statement had another one (fetch limit + 1 rows for that).
+    """
+    
+    def __init__(self, db, statement, limit : int | None = None, batch_size : int = TEMPLATE_STREAM_BATCH_SIZE):
+        self.db = db
+        self.statement = statement
+        self.limit = limit
+        self.batch_size = batch_size
+        self.last_row = None
+        self.has_more = False
+        self.flush = None
+    
+    async def __aiter__(self):
+        partitions = stream_partitions(self.db, self.statement, self.batch_size)
+        count = 0
+        try:
+            while True:
+                if self.flush is not None:
+                    await self.flush()
+                
+                partition = await anext(partitions, None)
+                if partition is None:
+                    return
+                
+                for row in partition:
+                    if self.limit is not None and count == self.limit:
+                        self.has_more = True
+                        return
+                    count += 1
+                    self.last_row = row
+                    yield row
+        finally:
+            await partitions.aclose()
+
+
+class StreamingTemplateResponse(Response):
+    """
+    HTML response rendered with Jinja's generate_async() while it is being sent.
+    
+    Output is written in `chunk_size` pieces, and every StreamedRows in the context
+    flushes whatever is pending before it touches the database. The status line and
+    headers go out first, so an error halfway through can only abort the connection.
+    """
+    
+    media_type = "text/html"
+    
+    def __init__(self, name : str, context : dict, status_code : int = 200, headers : dict | None = None, 
+                 chunk_size : int = TEMPLATE_STREAM_CHUNK_SIZE):
+        self.template = streaming_environment.get_template(name)
+        self.context = context
+        self.chunk_size = chunk_size
+        self.status_code = status_code
+        self.background = None
+        self.init_headers(headers)
+    
+    async def __call__(self, scope, receive, send):
+        pending = []
+        pending_size = 0
+        
+        async def flush(more_body : bool = True):
+            nonlocal pending, pending_size
+            if pending or not more_body:
+                body = "".join(pending).encode(self.charset)
+                pending, pending_size = [], 0
+                await send({"type" : "http.response.body", "body" : body, "more_body" : more_body})
+        
+        for value in self.context.values():
+            if isinstance(value, StreamedRows):
+                value.flush = flush
+        
+        await send({"type" : "http.response.start", "status" : self.status_code, "headers" : self.raw_headers})
+        
+        async for piece in self.template.generate_async(self.context):
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= self.chunk_size:
+                await flush()
+        
+        await flush(more_body = False)
+
+
+# The one template environment every router renders with
+templates = Jinja2Templates(env = create_environment())
+
+# Same templates compiled for generate_async(), used by StreamingTemplateResponse
+streaming_environment = create_environment(enable_async = True)
@@ -0,0 +1,81 @@
+# In-built packages (Standard Library modules)
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+# External packages
+
+# Our Own Imports
+
+
+class VerifiedTokenCache:
+    """
+    In-process LRU cache of JWTs whose signature has already been verified.
+    
+    Key   → SHA-256 digest of the raw token (the token itself is never stored)
+    Value → the user info dict built from its claims + the token's `exp`
+    
+    An entry is only served while `exp` is still in the future, so a cached token
+    expires at exactly the same moment as the JWT itself. When the cache is full
+    the least recently used entry is evicted.
+    """
+    
+    def __init__(self, max_size : int = 10_000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _key(token : str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+    
+    def get(self, token : str):
+        if self.max_size <= 0:
+            return None
+        
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return claims
+    
+    def put(self, token : str, claims : dict, expires_at):
+        # Tokens without an expiry are never cached (they would live forever)
+        if self.max_size <= 0 or expires_at is None:
+            return
+        
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last = False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "max_size" : self.max_size, 
+                "size" : len(self._entries), 
+                "hits" : self.hits, 
+                "misses" : self.misses, 
+                "hit_ratio" : round(self.hits / lookups, 4) if lookups else 0.0
+            }
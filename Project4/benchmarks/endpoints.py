@@ -0,0 +1,260 @@
+"""
+Endpoint load-test.
+
+Seeds --users users with --todos todos each, then drives every scenario below at a
+fixed concurrency and prints req/s plus p50/p95/p99 per scenario as JSON. Save the
+output of two commits and pass one of them as --baseline to get the relative change.
+
+    login            POST   /auth/token
+    list_todos       GET    /todo/
+    read_todo        GET    /todo/read_todo/{id}
+    create_todo      POST   /todo/create_todo/
+    update_todo      PUT    /todo/update_todo/{id}
+    delete_todo      DELETE /todo/delete_todo/{id}     (deletes the todos made by create_todo)
+    todo_page        GET    /todo/todo-page
+    edit_todo_page   GET    /todo/edit-todo-page/{id}
+
+Usage (from the Project4 directory):
+    
+    python -m benchmarks.endpoints --output before.json
+    python -m benchmarks.endpoints --baseline before.json --output after.json
+    python -m benchmarks.endpoints --scenarios read_todo list_todos --concurrency 64
+
+By default the app runs in-process (httpx ASGITransport) against a throw-away SQLite
+file. Export the usual POSTGRES_* variables to seed a disposable Postgres instead, and
+add --base-url http://127.0.0.1:8000 to drive a uvicorn server using that same database.
+"""
+# In-built packages (Standard Library modules)
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from uuid import uuid4
+from pathlib import Path
+from datetime import timedelta
+from dataclasses import dataclass, field
+
+# External packages
+import httpx
+from sqlalchemy import insert, select
+
+# Our Own Imports
+from benchmarks.harness import use_sqlite_database, summarize, git_revision, compare
+
+use_sqlite_database()
+
+from app.main import app                                   # noqa: E402 (env must be set first)
+from app.models import Base, Users, Todos                  # noqa: E402
+from app.database import engine, SessionLocal, DATABASE_MODE   # noqa: E402
+from app.config import bcrypt_context, password_hasher     # noqa: E402
+from app.routers.auth import create_access_token           # noqa: E402
+
+PASSWORD = "bench_password"
+
+
+@dataclass
+class SeededUser:
+    id : int
+    username : str
+    token : str
+    todo_ids : list[int] = field(default_factory = list)
+
+
+def seed(users : int, todos_per_user : int) -> list[SeededUser]:
+    """Bulk-inserts the users and their todos, and issues one bearer token per user."""
+    Base.metadata.create_all(bind = engine)
+    
+    # One hash for everybody: seeding 1000 users should not take 1000 hashes
+    hashed_password = bcrypt_context.hash(PASSWORD)
+    run_tag = uuid4().hex[:8]
+    
+    with SessionLocal() as db:
+        user_rows = [{"email" : f"bench_{run_tag}_{i}@example.com", "username" : f"bench_{run_tag}_{i}", 
+                      "first_name" : "Bench", "last_name" : "User", "hashed_password" : hashed_password, 
+                      "is_active" : True, "role" : "user", "phone_number" : "0000000000"} for i in range(users)]
+        user_ids = db.scalars(insert(Users).returning(Users.id, sort_by_parameter_order = True), user_rows).all()
+        
+        todo_rows = [{"title" : f"Benchmark todo {n}", "description" : "Seeded by benchmarks.endpoints", 
+                      "priority" : n % 5 + 1, "complete" : n % 3 == 0, "owner_id" : user_id}
+                     for user_id in user_ids for n in range(todos_per_user)]
+        if todo_rows:
+            db.execute(insert(Todos), todo_rows)
+        db.commit()
+        
+        seeded = {user_id : SeededUser(user_id, row["username"], 
+                                       create_access_token(row["username"], user_id, "user", timedelta(hours = 2)))
+                  for user_id, row in zip(user_ids, user_rows)}
+        for todo_id, owner_id in db.execute(select(Todos.id, Todos.owner_id).where(Todos.owner_id.in_(user_ids))):
+            seeded[owner_id].todo_ids.append(todo_id)
+    
+    return list(seeded.values())
+
+
+# -----------------------------------------------------------------------------
+# Scenarios: one request each, given the client, a per-worker RNG and the
+# shared run state
+# -----------------------------------------------------------------------------
+def _auth(user : SeededUser) -> dict:
+    return {"Authorization" : f"Bearer {user.token}"}
+
+
+def _todo_payload(rng : random.Random) -> dict:
+    return {"title" : "Benchmark write", "description" : "Written by benchmarks.endpoints", 
+            "priority" : rng.randint(1, 5), "complete" : rng.random() < 0.5}
+
+
+async def login(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.post("/auth/token", data = {"username" : user.username, "password" : PASSWORD})
+
+
+async def list_todos(client, rng, state):
+    return await client.get("/todo/", headers = _auth(rng.choice(state.users)))
+
+
+async def read_todo(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.get(f"/todo/read_todo/{rng.choice(user.todo_ids)}", headers = _auth(user))
+
+
+async def create_todo(client, rng, state):
+    user = rng.choice(state.users)
+    response = await client.post("/todo/create_todo/", json = _todo_payload(rng), headers = _auth(user))
+    if response.status_code == 201:
+        state.created.append((user, response.json()["id"]))
+    return response
+
+
+async def update_todo(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.put(f"/todo/update_todo/{rng.choice(user.todo_ids)}", json = _todo_payload(rng), 
+                            headers = _auth(user))
+
+
+async def delete_todo(client, rng, state):
+    user, todo_id = state.created.pop()
+    return await client.delete(f"/todo/delete_todo/{todo_id}", headers = _auth(user))
+
+
+async def todo_page(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.get("/todo/todo-page", headers = {"Cookie" : f"access_token={user.token}"})
+
+
+async def edit_todo_page(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.get(f"/todo/edit-todo-page/{rng.choice(user.todo_ids)}", 
+                            headers = {"Cookie" : f"access_token={user.token}"})
+
+
+SCENARIOS = {
+    "login" : login, 
+    "list_todos" : list_todos, 
+    "read_todo" : read_todo, 
+    "create_todo" : create_todo, 
+    "update_todo" : update_todo, 
+    "delete_todo" : delete_todo, 
+    "todo_page" : todo_page, 
+    "edit_todo_page" : edit_todo_page
+}
+
+
+@dataclass
+class RunState:
+    users : list[SeededUser]
+    created : list = field(default_factory = list)
+
+
+async def run_scenario(client, scenario, state : RunState, requests : int, concurrency : int, seed : int) -> dict:
+    """Runs `requests` calls of one scenario through `concurrency` workers that share one request budget."""
+    budget = iter(range(requests))
+    samples, errors = [], 0
+    
+    async def worker(worker_id : int):
+        nonlocal errors
+        rng = random.Random(seed * 1000 + worker_id)
+        for _ in budget:
+            started = time.perf_counter()
+            response = await scenario(client, rng, state)
+            samples.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+    
+    started = time.perf_counter()
+    await asyncio.gather(*[worker(worker_id) for worker_id in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    
+    return {
+        "requests" : len(samples), 
+        "errors" : errors, 
+        "duration_s" : round(elapsed, 3), 
+        "requests_per_second" : round(len(samples) / elapsed, 2) if elapsed else 0.0, 
+        "latency" : summarize(samples)
+    }
+
+
+async def run(args) -> dict:
+    state = RunState(seed(args.users, args.todos))
+    if args.todos == 0:
+        # read/update/edit pick from the seeded todos
+        args.scenarios = [name for name in args.scenarios if name not in ("read_todo", "update_todo", "edit_todo_page")]
+    
+    if args.base_url:
+        client = httpx.AsyncClient(base_url = args.base_url, timeout = 60, 
+                                   limits = httpx.Limits(max_connections = args.concurrency))
+    else:
+        client = httpx.AsyncClient(transport = httpx.ASGITransport(app = app), base_url = "http://benchmark", timeout = 60)
+    
+    results = {}
+    async with client:
+        for index, name in enumerate(args.scenarios):
+            requests = args.login_requests if name == "login" else args.requests
+            if name == "delete_todo":
+                # Can only delete what create_todo made (warm-up included)
+                requests = min(requests, max(0, len(state.created) - args.warmup))
+            
+            if args.warmup:
+                await run_scenario(client, SCENARIOS[name], state, min(args.warmup, requests), args.concurrency, args.seed)
+            results[name] = await run_scenario(client, SCENARIOS[name], state, requests, args.concurrency, 
+                                               args.seed + index)
+    
+    return {
+        "benchmark" : "endpoints", 
+        "git_revision" : git_revision(), 
+        "python" : sys.version.split()[0], 
+        "database" : engine.url.get_backend_name(), 
+        "database_mode" : DATABASE_MODE, 
+        "target" : args.base_url or "in-process", 
+        "config" : {"users" : args.users, "todos_per_user" : args.todos, "concurrency" : args.concurrency, 
+                    "requests" : args.requests, "login_requests" : args.login_requests, "warmup" : args.warmup, 
+                    "seed" : args.seed}, 
+        "scenarios" : results
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type = int, default = 20, help = "Users to seed")
+    parser.add_argument("--todos", type = int, default = 50, help = "Todos to seed per user")
+    parser.add_argument("--concurrency", type = int, default = 16, help = "Concurrent clients per scenario")
+    parser.add_argument("--requests", type = int, default = 500, help = "Measured requests per scenario")
+    parser.add_argument("--login-requests", type = int, default = 50, help = "Measured requests for the (slow) login scenario")
+    parser.add_argument("--warmup", type = int, default = 20, help = "Unmeasured requests before each scenario")
+    parser.add_argument("--seed", type = int, default = 42, help = "RNG seed, keeps the request mix identical between runs")
+    parser.add_argument("--scenarios", nargs = "+", choices = list(SCENARIOS), default = list(SCENARIOS))
+    parser.add_argument("--base-url", help = "Drive a running server instead of the in-process app")
+    parser.add_argument("--output", type = Path, help = "Also write the JSON result to this file")
+    parser.add_argument("--baseline", type = Path, help = "Earlier result file to compare against")
+    args = parser.parse_args()
+    
+    results = asyncio.run(run(args))
+    if args.baseline:
+        results["comparison"] = compare(args.baseline, results)
+    
+    report = json.dumps(results, indent = 2)
+    print(report)
+    if args.output:
+        args.output.write_text(report + "\n")
+    password_hasher.shutdown()
@@ -0,0 +1,88 @@
+# In-built packages (Standard Library modules)
+import os
+import json
+import tempfile
+import subprocess
+import statistics
+from pathlib import Path
+
+# External packages
+
+# Our Own Imports
+
+
+# Default on-disk SQLite file used by every benchmark (recreated on each run)
+BENCH_DATABASE = Path(tempfile.gettempdir()) / "project4_benchmarks.db"
+
+
+def use_sqlite_database(db_path : Path = BENCH_DATABASE):
+    """
+    Points app.database at a throw-away SQLite file.
+    
+    Must be called BEFORE anything from `app` is imported, because the engine
+    is created from environment variables at import time. Values that are
+    already set (e.g. a disposable Postgres) win over these defaults.
+    """
+    if db_path.exists():
+        db_path.unlink()
+    
+    os.environ.setdefault("POSTGRES_DRIVER", "sqlite")
+    os.environ.setdefault("POSTGRES_DATABASE", str(db_path.resolve()))
+    os.environ.setdefault("POSTGRES_DATABASE_PORT_NO", "0")
+    os.environ.setdefault("POSTGRES_ASYNC_DRIVER", "sqlite+aiosqlite")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+
+def percentile(samples : list[float], pct : float) -> float:
+    """Nearest-rank percentile (pct in 0-100) of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples : list[float]) -> dict:
+    """Latency summary in milliseconds for a list of durations given in seconds."""
+    millis = [sample * 1000 for sample in samples]
+    return {
+        "count" : len(millis), 
+        "mean_ms" : round(statistics.fmean(millis), 3) if millis else 0.0, 
+        "p50_ms" : round(percentile(millis, 50), 3), 
+        "p95_ms" : round(percentile(millis, 95), 3), 
+        "p99_ms" : round(percentile(millis, 99), 3), 
+        "max_ms" : round(max(millis), 3) if millis else 0.0
+    }
+
+
+def git_revision() -> str:
+    """Short commit hash of the working tree (with a "-dirty" suffix), so result files can be matched to commits."""
+    try:
+        revision = subprocess.run(["git", "describe", "--always", "--dirty"], capture_output = True, text = True, 
+                                  check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = "unknown"
+    return revision
+
+
+def compare(baseline_path : Path, results : dict) -> dict:
+    """
+    Relative change of throughput and tail latency against an earlier result file
+    of the same benchmark ({"scenario" : {"requests_per_second_change_pct" : ..., "p99_change_pct" : ...}}).
+    """
+    baseline = json.loads(Path(baseline_path).read_text())
+    
+    def change(old : float, new : float) -> float | None:
+        return round((new - old) / old * 100, 1) if old else None
+    
+    deltas = {}
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        deltas[name] = {
+            "requests_per_second_change_pct" : change(previous["requests_per_second"], current["requests_per_second"]), 
+            "p50_change_pct" : change(previous["latency"]["p50_ms"], current["latency"]["p50_ms"]), 
+            "p99_change_pct" : change(previous["latency"]["p99_ms"], current["latency"]["p99_ms"])
+        }
+    return {"baseline_revision" : baseline.get("git_revision"), "scenarios" : deltas}
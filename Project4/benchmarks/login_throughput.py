@@ -0,0 +1,101 @@
+"""
+Login-burst benchmark.
+
+Hammers POST /auth/token from many concurrent clients while a single probe keeps
+calling GET /todo/, and reports the probe latency with and without the login load.
+With password hashing off the event loop the probe p99 should stay flat.
+
+Usage (from the Project4 directory):
+
+    python -m benchmarks.login_throughput --duration 5 --concurrency 32
+    PASSWORD_HASH_WORKERS=0 python -m benchmarks.login_throughput   # old inline hashing
+"""
+# In-built packages (Standard Library modules)
+import json
+import time
+import asyncio
+import argparse
+from datetime import timedelta
+
+# External packages
+import httpx
+
+# Our Own Imports
+from benchmarks.harness import use_sqlite_database, summarize
+
+use_sqlite_database()
+
+from app.main import app                                   # noqa: E402 (env must be set first)
+from app.models import Base, Users                         # noqa: E402
+from app.database import engine, SessionLocal              # noqa: E402
+from app.config import bcrypt_context, password_hasher     # noqa: E402
+from app.routers.auth import create_access_token           # noqa: E402
+
+USERNAME = "bench_user"
+PASSWORD = "bench_password"
+
+
+def seed_user() -> str:
+    """Creates the login user and returns a bearer token for the probe."""
+    Base.metadata.create_all(bind = engine)
+    with SessionLocal() as db:
+        user = Users(email = "bench@example.com", username = USERNAME, first_name = "Bench", last_name = "User", 
+                     hashed_password = bcrypt_context.hash(PASSWORD), is_active = True, role = "user", 
+                     phone_number = "0000000000")
+        db.add(user)
+        db.commit()
+        return create_access_token(user.username, user.id, user.role, timedelta(minutes = 30))
+
+
+async def probe(client : httpx.AsyncClient, token : str, stop_at : float) -> list[float]:
+    samples = []
+    headers = {"Authorization" : f"Bearer {token}"}
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        response = await client.get("/todo/", headers = headers)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.text
+        await asyncio.sleep(0.005)
+    return samples
+
+
+async def hammer_logins(client : httpx.AsyncClient, stop_at : float) -> int:
+    logins = 0
+    while time.perf_counter() < stop_at:
+        response = await client.post("/auth/token", data = {"username" : USERNAME, "password" : PASSWORD})
+        if response.status_code == 200:
+            logins += 1
+    return logins
+
+
+async def run(duration : float, concurrency : int) -> dict:
+    token = seed_user()
+    transport = httpx.ASGITransport(app = app)
+    async with httpx.AsyncClient(transport = transport, base_url = "http://benchmark") as client:
+        baseline = await probe(client, token, time.perf_counter() + duration)
+        
+        stop_at = time.perf_counter() + duration
+        results = await asyncio.gather(probe(client, token, stop_at), 
+                                       *[hammer_logins(client, stop_at) for _ in range(concurrency)])
+    
+    under_load, logins = results[0], sum(results[1:])
+    return {
+        "benchmark" : "login_throughput", 
+        "password_hash_workers" : password_hasher.max_workers, 
+        "login_concurrency" : concurrency, 
+        "duration_s" : duration, 
+        "logins_per_second" : round(logins / duration, 2), 
+        "todo_probe_idle" : summarize(baseline), 
+        "todo_probe_under_login_load" : summarize(under_load), 
+        "password_hasher" : password_hasher.stats()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type = float, default = 5.0, help = "Seconds per phase")
+    parser.add_argument("--concurrency", type = int, default = 32, help = "Concurrent login clients")
+    args = parser.parse_args()
+    
+    print(json.dumps(asyncio.run(run(args.duration, args.concurrency)), indent = 2))
+    password_hasher.shutdown()
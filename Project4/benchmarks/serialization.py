@@ -0,0 +1,103 @@
+"""
+Serialization microbenchmark.
+
+Measures what it costs to turn 1,000 Todos / Users ORM objects into a JSON body:
+    
+    jsonable_encoder     → no response_model: FastAPI walks every object with jsonable_encoder
+    response_model       → TodoOut / UserOut (from_attributes) validated by pydantic-core, json.dumps body
+    response_model_orjson → same, rendered by ORJSONResponse (the default when orjson is installed)
+    dump_json            → pydantic-core straight to JSON bytes (lower bound)
+
+Usage (from the Project4 directory):
+    
+    python -m benchmarks.serialization --rows 1000 --repeat 20
+"""
+# In-built packages (Standard Library modules)
+import json
+import time
+import argparse
+import statistics
+
+# External packages
+from pydantic import TypeAdapter
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+# Our Own Imports
+from benchmarks.harness import use_sqlite_database
+
+use_sqlite_database()
+
+from app.models import Todos, Users                        # noqa: E402 (env must be set first)
+from app.schemas import TodoOut, UserOut                   # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_rows(rows : int) -> dict:
+    todos = [Todos(id = n, title = f"Todo number {n}", description = "Serialization benchmark row", 
+                   priority = n % 5 + 1, complete = n % 2 == 0, owner_id = n % 50 + 1) for n in range(1, rows + 1)]
+    users = [Users(id = n, email = f"user{n}@example.com", username = f"user{n}", first_name = "Bench", 
+                   last_name = "User", hashed_password = "$argon2id$not-a-real-hash", is_active = True, 
+                   role = "user", phone_number = "0000000000") for n in range(1, rows + 1)]
+    return {"todos" : (todos, TodoOut), "users" : (users, UserOut)}
+
+
+def strategies(schema) -> dict:
+    adapter = TypeAdapter(list[schema])
+    
+    def as_response_model(objects):
+        return adapter.dump_python(adapter.validate_python(objects, from_attributes = True), mode = "json")
+    
+    variants = {
+        "jsonable_encoder" : lambda objects : JSONResponse(jsonable_encoder(objects)).body, 
+        "response_model" : lambda objects : JSONResponse(as_response_model(objects)).body, 
+        "dump_json" : lambda objects : adapter.dump_json(adapter.validate_python(objects, from_attributes = True))
+    }
+    if orjson is not None:
+        variants["response_model_orjson"] = lambda objects : ORJSONResponse(as_response_model(objects)).body
+    return variants
+
+
+def measure(function, objects, repeat : int) -> float:
+    """Median wall time of one call, in milliseconds."""
+    function(objects)  # warm-up (schema / encoder caches)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(objects)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def run(rows : int, repeat : int) -> dict:
+    results = {}
+    for name, (objects, schema) in make_rows(rows).items():
+        variants = strategies(schema)
+        
+        # Every variant must produce the same document (apart from hashed_password, which
+        # only the jsonable_encoder path leaks)
+        reference = json.loads(variants["dump_json"](objects))
+        for variant in variants.values():
+            assert [{key : row[key] for key in reference[0]} for row in json.loads(variant(objects))] == reference
+        
+        timings = {variant : measure(function, objects, repeat) for variant, function in variants.items()}
+        baseline = timings["jsonable_encoder"]
+        results[name] = {
+            variant : {"ms_per_1k_rows" : round(millis * 1000 / rows, 3), "speedup" : round(baseline / millis, 2)}
+            for variant, millis in timings.items()
+        }
+    
+    return {"benchmark" : "serialization", "rows" : rows, "repeat" : repeat, "orjson" : orjson is not None, "results" : results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type = int, default = 1000, help = "ORM objects per call")
+    parser.add_argument("--repeat", type = int, default = 20, help = "Timed calls per variant")
+    args = parser.parse_args()
+    
+    print(json.dumps(run(args.rows, args.repeat), indent = 2))
@@ -0,0 +1,197 @@
+"""
+Statements-per-request benchmark of the write routes.
+
+Runs every write scenario below --requests times, one request at a time, with the
+SQL profiler switched on, and reads the statement count of each request from its
+Server-Timing header (db;dur=...;desc="N queries"). Prints the count (mean / min /
+max) and the latency per scenario as JSON.
+
+    create_todo        POST   /todo/create_todo/
+    update_todo        PUT    /todo/update_todo/{id}
+    delete_todo        DELETE /todo/delete_todo/{id}
+    update_user        PUT    /users/user/{id}
+    admin_create_user  POST   /admin/user/
+    admin_update_user  PUT    /admin/user/{id}
+    admin_delete_user  DELETE /admin/user/{id}         (deletes the users made by admin_create_user)
+
+Usage (from the Project4 directory):
+    
+    python -m benchmarks.write_statements --requests 200
+    python -m benchmarks.write_statements --output after.json
+"""
+# In-built packages (Standard Library modules)
+import os
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+from uuid import uuid4
+from pathlib import Path
+from datetime import timedelta
+from dataclasses import dataclass, field
+
+# External packages
+import httpx
+
+# Our Own Imports
+from benchmarks.harness import use_sqlite_database, summarize, git_revision
+
+use_sqlite_database()
+os.environ.setdefault("SQL_PROFILING", "true")
+
+from app.main import app                                   # noqa: E402 (env must be set first)
+from app.database import engine, DATABASE_MODE             # noqa: E402
+from app.config import password_hasher                     # noqa: E402
+from app.routers.auth import create_access_token           # noqa: E402
+from benchmarks.endpoints import RunState, seed            # noqa: E402
+
+STATEMENT_COUNT = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class WriteState(RunState):
+    admin_token : str = ""
+    created_users : list = field(default_factory = list)
+
+
+def _auth(token : str) -> dict:
+    return {"Authorization" : f"Bearer {token}"}
+
+
+def _todo_payload(rng : random.Random) -> dict:
+    return {"title" : "Benchmark write", "description" : "Written by benchmarks.write_statements", 
+            "priority" : rng.randint(1, 5), "complete" : rng.random() < 0.5}
+
+
+def _user_payload() -> dict:
+    tag = uuid4().hex[:12]
+    return {"email" : f"write_{tag}@example.com", "username" : f"write_{tag}", "first_name" : "Write", 
+            "last_name" : "Bench", "password" : "bench_password", "role" : "user", "phone_number" : "0000000000"}
+
+
+async def create_todo(client, rng, state):
+    user = rng.choice(state.users)
+    response = await client.post("/todo/create_todo/", json = _todo_payload(rng), headers = _auth(user.token))
+    state.created.append((user, response.json().get("id")))
+    return response
+
+
+async def update_todo(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.put(f"/todo/update_todo/{rng.choice(user.todo_ids)}", json = _todo_payload(rng), 
+                            headers = _auth(user.token))
+
+
+async def delete_todo(client, rng, state):
+    user, todo_id = state.created.pop()
+    return await client.delete(f"/todo/delete_todo/{todo_id}", headers = _auth(user.token))
+
+
+async def update_user(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.put(f"/users/user/{user.id}", json = {"first_name" : f"Bench{rng.randint(0, 999)}"}, 
+                            headers = _auth(user.token))
+
+
+async def admin_create_user(client, rng, state):
+    response = await client.post("/admin/user/", json = _user_payload(), headers = _auth(state.admin_token))
+    state.created_users.append(response.json().get("id"))
+    return response
+
+
+async def admin_update_user(client, rng, state):
+    user = rng.choice(state.users)
+    return await client.put(f"/admin/user/{user.id}", json = {"last_name" : f"User{rng.randint(0, 999)}"}, 
+                            headers = _auth(state.admin_token))
+
+
+async def admin_delete_user(client, rng, state):
+    return await client.delete(f"/admin/user/{state.created_users.pop()}", headers = _auth(state.admin_token))
+
+
+SCENARIOS = {
+    "create_todo" : create_todo, 
+    "update_todo" : update_todo, 
+    "delete_todo" : delete_todo, 
+    "update_user" : update_user, 
+    "admin_create_user" : admin_create_user, 
+    "admin_update_user" : admin_update_user, 
+    "admin_delete_user" : admin_delete_user
+}
+
+
+async def run_scenario(client, scenario, state : WriteState, requests : int, rng : random.Random) -> dict:
+    counts, samples, errors = [], [], 0
+    
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await scenario(client, rng, state)
+        samples.append(time.perf_counter() - started)
+        
+        if response.status_code >= 400:
+            errors += 1
+        match = STATEMENT_COUNT.search(response.headers.get("server-timing", ""))
+        if match:
+            counts.append(int(match.group(1)))
+    
+    return {
+        "requests" : requests, 
+        "errors" : errors, 
+        "statements_per_request" : {
+            "mean" : round(statistics.fmean(counts), 2) if counts else None, 
+            "min" : min(counts, default = None), 
+            "max" : max(counts, default = None)
+        }, 
+        "latency" : summarize(samples)
+    }
+
+
+async def run(args) -> dict:
+    # Admin routes only look at the role claim of the token
+    state = WriteState(seed(args.users, args.todos), 
+                       admin_token = create_access_token("bench_admin", 0, "admin", timedelta(hours = 2)))
+    
+    rng = random.Random(args.seed)
+    results = {}
+    client = httpx.AsyncClient(transport = httpx.ASGITransport(app = app), base_url = "http://benchmark", timeout = 60)
+    async with client:
+        for name in args.scenarios:
+            requests = args.requests
+            if name == "delete_todo":
+                requests = min(requests, len(state.created))
+            elif name == "admin_delete_user":
+                requests = min(requests, len(state.created_users))
+            results[name] = await run_scenario(client, SCENARIOS[name], state, requests, rng)
+    
+    return {
+        "benchmark" : "write_statements", 
+        "git_revision" : git_revision(), 
+        "python" : sys.version.split()[0], 
+        "database" : engine.url.get_backend_name(), 
+        "database_mode" : DATABASE_MODE, 
+        "config" : {"users" : args.users, "todos_per_user" : args.todos, "requests" : args.requests, "seed" : args.seed}, 
+        "scenarios" : results
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type = int, default = 20, help = "Users to seed")
+    parser.add_argument("--todos", type = int, default = 20, help = "Todos to seed per user")
+    parser.add_argument("--requests", type = int, default = 100, help = "Requests per scenario")
+    parser.add_argument("--seed", type = int, default = 42, help = "RNG seed, keeps the request mix identical between runs")
+    parser.add_argument("--scenarios", nargs = "+", choices = list(SCENARIOS), default = list(SCENARIOS))
+    parser.add_argument("--output", type = Path, help = "Also write the JSON result to this file")
+    args = parser.parse_args()
+    
+    results = asyncio.run(run(args))
+    
+    report = json.dumps(results, indent = 2)
+    print(report)
+    if args.output:
+        args.output.write_text(report + "\n")
+    password_hasher.shutdown()
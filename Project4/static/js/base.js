@@ -122,6 +122,103 @@ if (editTodoForm) {
 
 }
 
+// Todo Page JS (filters + infinite scroll)
+const todoRows = document.getElementById('todoRows');
+if (todoRows) {
+    const todoFilterForm = document.getElementById('todoFilterForm');
+    const todoSentinel = document.getElementById('todoSentinel');
+    let nextCursor = todoSentinel.dataset.nextCursor;
+    let loadingTodos = false;
+
+    // Reload the page with the chosen filters (empty selects are left out of the URL)
+    todoFilterForm.addEventListener('change', function () {
+        const params = new URLSearchParams();
+        for (const [key, value] of new FormData(todoFilterForm).entries()) {
+            if (value !== '') {
+                params.append(key, value);
+            }
+        }
+        window.location.search = params.toString();
+    });
+
+    function appendTodoRow(todo) {
+        const row = document.createElement('tr');
+        row.className = todo.complete ? 'pointer alert alert-success' : 'pointer';
+
+        const index = document.createElement('td');
+        index.textContent = todoRows.rows.length + 1;
+
+        const title = document.createElement('td');
+        title.textContent = todo.title;
+        if (todo.complete) {
+            title.className = 'strike-through-td';
+        }
+
+        const actions = document.createElement('td');
+        const editButton = document.createElement('button');
+        editButton.type = 'button';
+        editButton.className = 'btn btn-info';
+        editButton.textContent = 'Edit';
+        editButton.addEventListener('click', function () {
+            window.location.href = `/todo/edit-todo-page/${todo.id}`;
+        });
+        actions.appendChild(editButton);
+
+        row.append(index, title, actions);
+        todoRows.appendChild(row);
+    }
+
+    async function loadMoreTodos() {
+        if (loadingTodos || !nextCursor) {
+            return;
+        }
+        loadingTodos = true;
+
+        // Same filters as the server-rendered page, continuing after its last row
+        const params = new URLSearchParams(window.location.search);
+        params.set('cursor', nextCursor);
+        params.set('limit', todoRows.dataset.limit);
+        params.set('fields', 'id,title,complete');
+
+        try {
+            const response = await fetch(`/todo/todo-page/items?${params.toString()}`, {
+                headers: {
+                    'Authorization': `Bearer ${getCookie('access_token')}`
+                }
+            });
+
+            if (!response.ok) {
+                throw new Error(`Loading todos failed with status ${response.status}`);
+            }
+
+            const page = await response.json();
+            page.items.forEach(appendTodoRow);
+            nextCursor = page.next_cursor;
+        } catch (error) {
+            console.error('Error:', error);
+            nextCursor = null;
+        } finally {
+            loadingTodos = false;
+        }
+
+        todoObserver.unobserve(todoSentinel);
+        if (nextCursor) {
+            // Observing again re-checks the sentinel, so a page that still fits the screen loads the next one
+            todoObserver.observe(todoSentinel);
+        }
+    }
+
+    const todoObserver = new IntersectionObserver(function (entries) {
+        if (entries.some(entry => entry.isIntersecting)) {
+            loadMoreTodos();
+        }
+    }, { rootMargin: '200px' });
+
+    if (nextCursor) {
+        todoObserver.observe(todoSentinel);
+    }
+}
+
 // Login JS
 const loginForm = document.getElementById('loginForm');
 if (loginForm) {
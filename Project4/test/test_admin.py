@@ -1,4 +1,5 @@
 # In-built packages (Standard Library modules)
+import json
 
 # External packages
 from fastapi import status
@@ -17,7 +18,7 @@ def test_read_all_users(test_user):
     assert response.status_code == status.HTTP_200_OK
     
     # Remove unpredictable "id" before comparison
-    data = response.json()
+    data = response.json()["items"]
     for item in data:
         item.pop("id", None)
         item.pop("hashed_password", None)
@@ -190,4 +191,24 @@ def test_delete_user_not_found(test_user):
             "message" : "User ID Not Found", 
             "path" : f"http://testserver/admin/user/{created_id + 1}"
             }
-        }
\ No newline at end of file
+        }
+
+
+# ============================================== TEST #7 ====================================================== #
+def test_read_all_users_never_exposes_password_hash(test_user):
+    response = client.get("/admin/users", params = {"fields" : "username,hashed_password"})
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "hashed_password" not in client.get("/admin/users").json()["items"][0]
+
+
+# ============================================== TEST #8 ====================================================== #
+def test_export_users_ndjson(test_user):
+    response = client.get("/admin/users/export")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["username"] for row in rows] == ["Wolverine1310"]
+    assert "hashed_password" not in rows[0]
@@ -1,4 +1,5 @@
 # In-built packages (Standard Library modules)
+import time
 from os import environ
 from dotenv import load_dotenv
 from datetime import timedelta, datetime, timezone
@@ -9,9 +10,11 @@ from jose import jwt
 from fastapi import HTTPException, status
 
 # Our Own Imports
-from app.config import ALGORITHM, get_current_user
+from app.database import ThreadedSession
+from app.token_cache import VerifiedTokenCache
+from app.config import ALGORITHM, get_current_user, token_cache
 from test.utils import TestingSessionLocal, client, test_user
-from app.routers.auth import authenticate_user, create_access_token
+from app.routers.auth import get_credentials, authenticate_user, create_access_token
 
 # Load environment variables from .env file
 load_dotenv()
@@ -31,7 +34,7 @@ def test_read_all_authenticated_users(test_user):
     assert response.status_code == status.HTTP_200_OK
     
     # Remove unpredictable "id" before comparison
-    data = response.json()
+    data = response.json()["items"]
     for item in data:
         item.pop("id", None)
         item.pop("hashed_password", None)
@@ -51,20 +54,28 @@ def test_read_all_authenticated_users(test_user):
 
 
 # ============================================== TEST #2 ====================================================== #
-def test_authenticate_user(test_user):
+@pytest.mark.asyncio
+async def test_authenticate_user(test_user):
     user_name = test_user.username
 
     
-    with TestingSessionLocal() as db:
-        authenticated_user = authenticate_user(user_name, "abcdefgh", db)
+    with TestingSessionLocal() as session:
+        db = ThreadedSession(session)
+        
+        credentials = await get_credentials(user_name, db)
+        authenticated_user = await authenticate_user(credentials, "abcdefgh")
         assert authenticated_user is not None
         assert authenticated_user.username == user_name
         
-        non_existent_user = authenticate_user("Wrong_User_Name", "abcdefgh", db)
+        non_existent_user = await authenticate_user(await get_credentials("Wrong_User_Name", db), "abcdefgh")
         assert non_existent_user is False
         
-        wrong_password_user = authenticate_user(user_name, "Wrong_password", db)
+        wrong_password_user = await authenticate_user(credentials, "Wrong_password")
         assert wrong_password_user is False
+        
+        # Nothing of the user stays in the session, which remains open for the caller
+        assert not session.identity_map
+        assert session.in_transaction()
 
 
 # ============================================== TEST #3 ====================================================== #
@@ -111,3 +122,35 @@ async def test_get_current_user_missing_payload(test_user):
     assert exception_info.value.detail == "Could not validate user."
 
 
+# ============================================== TEST #6 ====================================================== #
+@pytest.mark.asyncio
+async def test_get_current_user_served_from_token_cache(test_user):
+    token_cache.clear()
+    token = create_access_token(test_user.username, test_user.id, test_user.role, timedelta(minutes = 20))
+    
+    misses_before = token_cache.misses
+    first = await get_current_user(token)
+    assert token_cache.misses == misses_before + 1
+    
+    hits_before = token_cache.hits
+    second = await get_current_user(token)
+    assert token_cache.hits == hits_before + 1
+    
+    assert first == second == {"username" : test_user.username, "id" : test_user.id, "user_role" : test_user.role}
+
+
+# ============================================== TEST #7 ====================================================== #
+def test_token_cache_entry_expires_with_token():
+    cache = VerifiedTokenCache(max_size = 2)
+    
+    cache.put("expired-token", {"id" : 1}, time.time() - 1)
+    cache.put("live-token", {"id" : 2}, time.time() + 60)
+    
+    assert cache.get("expired-token") is None
+    assert cache.get("live-token") == {"id" : 2}
+    
+    # LRU eviction once max_size is exceeded
+    cache.put("token-3", {"id" : 3}, time.time() + 60)
+    cache.put("token-4", {"id" : 4}, time.time() + 60)
+    assert cache.get("live-token") is None
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,100 @@
+# In-built packages (Standard Library modules)
+import json
+
+# External packages
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+# Our Own Imports
+from app.compression import CompressionMiddleware, COMPRESSION_SAVED_BYTES, ENCODERS
+from test.utils import client, test_user_and_todo
+
+
+def create_todos(count : int):
+    payload = [{"title" : f"Compressible todo {n}", "description" : "Repeated text compresses well", 
+                "priority" : 3, "complete" : False} for n in range(count)]
+    assert client.post("/todo/bulk", json = payload).status_code == status.HTTP_201_CREATED
+
+
+@pytest.fixture
+def compressed_client():
+    demo_app = FastAPI()
+    demo_app.add_middleware(CompressionMiddleware, minimum_size = 100, encodings = ["br", "zstd", "gzip"])
+    
+    @demo_app.get("/text")
+    def text(size : int):
+        return PlainTextResponse("a" * size)
+    
+    @demo_app.get("/stream")
+    def stream():
+        return StreamingResponse((f"line {n}\n" for n in range(1000)), media_type = "text/plain")
+    
+    @demo_app.get("/image")
+    def image():
+        return PlainTextResponse("x" * 1000, media_type = "image/png")
+    
+    return TestClient(demo_app)
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_todo_list_is_gzipped_and_keeps_conditional_get(test_user_and_todo):
+    create_todos(30)
+    saved_before = COMPRESSION_SAVED_BYTES.value("gzip")
+    
+    response = client.get("/todo/", headers = {"Accept-Encoding" : "gzip"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()["items"]) == 31
+    assert COMPRESSION_SAVED_BYTES.value("gzip") > saved_before
+    
+    # Compressed bytes differ from the identity body → weak ETag, still good for If-None-Match
+    etag = response.headers["etag"]
+    assert etag.startswith("W/")
+    response = client.get("/todo/", headers = {"Accept-Encoding" : "gzip", "If-None-Match" : etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_small_and_unlisted_responses_are_not_compressed(compressed_client):
+    response = compressed_client.get("/text?size=50", headers = {"Accept-Encoding" : "gzip"})
+    assert "content-encoding" not in response.headers
+    
+    response = compressed_client.get("/image", headers = {"Accept-Encoding" : "gzip"})
+    assert "content-encoding" not in response.headers
+    
+    response = compressed_client.get("/text?size=5000", headers = {"Accept-Encoding" : "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "a" * 5000
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_streaming_body_is_compressed_per_chunk(compressed_client):
+    response = compressed_client.get("/stream", headers = {"Accept-Encoding" : "gzip"})
+    
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "".join(f"line {n}\n" for n in range(1000))
+
+
+# ============================================== TEST #4 ====================================================== #
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_optional_encodings_are_preferred_when_installed(compressed_client, encoding):
+    if encoding not in ENCODERS:
+        pytest.skip(f"{encoding} package not installed")
+    
+    response = compressed_client.get("/text?size=5000", headers = {"Accept-Encoding" : f"gzip, {encoding}"})
+    assert response.headers["content-encoding"] == encoding
+    assert int(response.headers["content-length"]) < 5000
+
+
+# ============================================== TEST #5 ====================================================== #
+def test_ndjson_export_stream_is_compressed(test_user_and_todo):
+    create_todos(5)
+    
+    response = client.get("/todo/export", headers = {"Accept-Encoding" : "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    titles = [json.loads(line)["title"] for line in response.text.splitlines()]
+    assert titles == ["FASTAPI COURSE - Udemy"] + [f"Compressible todo {n}" for n in range(5)]
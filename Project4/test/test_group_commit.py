@@ -0,0 +1,137 @@
+# In-built packages (Standard Library modules)
+import asyncio
+
+# External packages
+from fastapi import status
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+# Our Own Imports
+from app.routers import todos
+from app.models import Todos, Users
+from app.database import ThreadedSession
+from app.group_commit import GroupCommitter
+from test.utils import client, TestingSessionLocal, test_user_and_todo
+
+
+def _committer(**kwargs) -> GroupCommitter:
+    return GroupCommitter(lambda : ThreadedSession(TestingSessionLocal()), enabled = True, **kwargs)
+
+
+def _insert_todo(owner_id : int, title : str):
+    statement = insert(Todos).values(title = title, description = "Group commit", priority = 1, complete = False, 
+                                     owner_id = owner_id).returning(Todos.id)
+    return lambda session : session.scalar(statement)
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_concurrent_writes_share_one_commit(test_user_and_todo):
+    committer = _committer(interval = 0.05)
+    owner_id = test_user_and_todo.owner_id
+    
+    async def write_all():
+        return await asyncio.gather(*[committer.submit(_insert_todo(owner_id, f"Grouped {n}")) for n in range(5)])
+    
+    todo_ids = asyncio.run(write_all())
+    
+    assert committer.stats()["batches"] == 1
+    assert committer.stats()["items"] == 5
+    with TestingSessionLocal() as db:
+        titles = db.scalars(select(Todos.title).where(Todos.id.in_(todo_ids)).order_by(Todos.id)).all()
+    assert titles == [f"Grouped {n}" for n in range(5)]
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_failing_write_only_fails_its_own_caller(test_user_and_todo):
+    committer = _committer(interval = 0.05)
+    owner_id = test_user_and_todo.owner_id
+    
+    duplicate_user = insert(Users).values(email = "siddharthwolverine@gmail.com", username = "Wolverine1310", 
+                                          first_name = "Dup", last_name = "User", hashed_password = "x", 
+                                          role = "Normal User", phone_number = "0")
+    
+    async def write_all():
+        return await asyncio.gather(committer.submit(_insert_todo(owner_id, "Before the failure")), 
+                                    committer.submit(lambda session : session.execute(duplicate_user)), 
+                                    committer.submit(_insert_todo(owner_id, "After the failure")), 
+                                    return_exceptions = True)
+    
+    first, failed, last = asyncio.run(write_all())
+    
+    assert isinstance(failed, IntegrityError)
+    assert committer.stats()["failed_items"] == 1
+    with TestingSessionLocal() as db:
+        assert db.get(Todos, first).title == "Before the failure"
+        assert db.get(Todos, last).title == "After the failure"
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_full_batch_is_flushed_before_the_interval(test_user_and_todo):
+    committer = _committer(interval = 30, max_items = 3)
+    owner_id = test_user_and_todo.owner_id
+    
+    async def write_all():
+        writes = asyncio.gather(*[committer.submit(_insert_todo(owner_id, f"Full batch {n}")) for n in range(3)])
+        return await asyncio.wait_for(writes, timeout = 5)
+    
+    assert len(asyncio.run(write_all())) == 3
+    assert committer.stats()["largest_batch"] == 3
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_todo_routes_go_through_the_group_commit(test_user_and_todo, monkeypatch):
+    committer = _committer(interval = 0.001)
+    monkeypatch.setattr(todos, "todo_writes", committer)
+    
+    payload = {"title" : "Written behind", "description" : "Through the group commit", "priority" : 2, "complete" : False}
+    response = client.post("/todo/create_todo/", json = payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    todo_id = response.json()["id"]
+    
+    response = client.put(f"/todo/update_todo/{todo_id}", json = {**payload, "complete" : True})
+    assert response.status_code == status.HTTP_200_OK
+    
+    response = client.delete("/todo/delete_todo/999999")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    assert committer.stats()["items"] == 3
+    with TestingSessionLocal() as db:
+        assert db.get(Todos, todo_id).complete is True
+
+
+# ============================================== TEST #5 ====================================================== #
+def test_batches_never_exceed_max_items(test_user_and_todo):
+    committer = _committer(interval = 0.05, max_items = 2)
+    owner_id = test_user_and_todo.owner_id
+    
+    async def write_all():
+        return await asyncio.gather(*[committer.submit(_insert_todo(owner_id, f"Capped {n}")) for n in range(5)])
+    
+    assert len(asyncio.run(write_all())) == 5
+    assert committer.stats()["largest_batch"] == 2
+    assert committer.stats()["batches"] == 3
+    
+    # A batch of one is full as soon as it starts, so it does not wait for the interval
+    single = _committer(interval = 30, max_items = 1)
+    
+    async def write_one():
+        return await asyncio.wait_for(single.submit(_insert_todo(owner_id, "Alone")), timeout = 5)
+    
+    assert asyncio.run(write_one()) is not None
+
+
+# ============================================== TEST #6 ====================================================== #
+def test_cancelled_flush_fails_its_writes(test_user_and_todo):
+    committer = _committer(interval = 30)
+    owner_id = test_user_and_todo.owner_id
+    
+    async def write_and_cancel():
+        writes = asyncio.gather(*[committer.submit(_insert_todo(owner_id, f"Cancelled {n}")) for n in range(2)], 
+                                return_exceptions = True)
+        await asyncio.sleep(0)
+        for task in list(committer._flush_tasks):
+            task.cancel()
+        return await asyncio.wait_for(writes, timeout = 5)
+    
+    results = asyncio.run(write_and_cancel())
+    assert all(isinstance(result, RuntimeError) for result in results)
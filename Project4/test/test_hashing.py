@@ -0,0 +1,76 @@
+# In-built packages (Standard Library modules)
+import asyncio
+import threading
+
+# External packages
+import pytest
+from fastapi import HTTPException, status
+
+# Our Own Imports
+from app.hashing import PasswordHashingService
+from test.utils import client, test_user, bcrypt_context
+
+
+# ============================================== TEST #1 ====================================================== #
+@pytest.mark.asyncio
+async def test_hash_and_verify_in_worker_pool():
+    hasher = PasswordHashingService(bcrypt_context, max_workers = 1)
+    
+    hashed = await hasher.hash("Sid1310@")
+    
+    assert await hasher.verify("Sid1310@", hashed) is True
+    assert await hasher.verify("Wrong_password", hashed) is False
+    assert hasher.stats()["completed"] == 3
+    assert hasher.stats()["queued"] == 0
+    
+    hasher.shutdown()
+
+
+# ============================================== TEST #2 ====================================================== #
+class BlockingContext:
+    """Stand-in for CryptContext whose hash() waits until the test releases it."""
+    
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+    
+    def hash(self, password):
+        self.started.set()
+        self.release.wait(timeout = 5)
+        return f"hashed-{password}"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_503():
+    context = BlockingContext()
+    hasher = PasswordHashingService(context, max_workers = 1, max_queue = 1)
+    
+    # The first call occupies the only worker ...
+    first = asyncio.ensure_future(hasher.hash("first"))
+    await asyncio.to_thread(context.started.wait, 5)
+    
+    # ... the second one fills the queue ...
+    second = asyncio.ensure_future(hasher.hash("second"))
+    await asyncio.sleep(0)
+    assert hasher.stats()["queued"] == 1
+    
+    # ... and the third one is turned away
+    with pytest.raises(HTTPException) as exception_info:
+        await hasher.hash("third")
+    
+    assert exception_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert hasher.stats()["rejected"] == 1
+    
+    context.release.set()
+    assert await asyncio.gather(first, second) == ["hashed-first", "hashed-second"]
+    hasher.shutdown()
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_password_hashing_stats(test_user):
+    response = client.get("/admin/stats/password-hashing")
+    assert response.status_code == status.HTTP_200_OK
+    
+    data = response.json()
+    for key in ("max_workers", "max_queue", "queued", "running", "peak_queued", "completed", "rejected"):
+        assert key in data
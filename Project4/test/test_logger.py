@@ -0,0 +1,75 @@
+# In-built packages (Standard Library modules)
+import sys
+import json
+import queue
+import logging
+
+# External packages
+
+# Our Own Imports
+from app import logger as app_logger
+
+
+def _make_record(name : str, message : str, level : int = logging.INFO):
+    return logging.LogRecord(name = name, level = level, pathname = __file__, lineno = 1, 
+                             msg = message, args = None, exc_info = None)
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_queue_handler_drops_instead_of_blocking():
+    handler = app_logger._DroppingQueueHandler(queue.Queue(maxsize = 1))
+    
+    handler.handle(_make_record("users", "first"))
+    handler.handle(_make_record("users", "second"))  # queue is full → dropped, no blocking
+    
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_log_writer_routes_records_to_app_and_module_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_logger, "LOG_DIR", tmp_path)
+    
+    log_queue = queue.Queue()
+    handler = app_logger._DroppingQueueHandler(log_queue)
+    writer = app_logger._LogWriter(log_queue)
+    writer.add_module("users")
+    writer.start()
+    
+    handler.handle(_make_record("users", "user created"))
+    handler.handle(_make_record("todos", "todo created", logging.DEBUG))
+    writer.stop()
+    
+    app_lines = [json.loads(line)["message"] for line in (tmp_path / "app.jsonl").read_text().splitlines()]
+    users_lines = [json.loads(line)["message"] for line in (tmp_path / "users.jsonl").read_text().splitlines()]
+    
+    assert app_lines == ["user created", "todo created"]
+    assert users_lines == ["user created"]
+    assert writer.written == 2
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_queue_handler_leaves_formatting_to_the_writer(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_logger, "LOG_DIR", tmp_path)
+    
+    log_queue = queue.Queue()
+    handler = app_logger._DroppingQueueHandler(log_queue)
+    handler.format = None  # any formatting on the request path would fail here
+    writer = app_logger._LogWriter(log_queue)
+    
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(name = "users", level = logging.ERROR, pathname = __file__, lineno = 1, 
+                                   msg = "user %s failed", args = ("alice",), exc_info = sys.exc_info())
+    handler.handle(record)
+    
+    queued = log_queue.get_nowait()
+    assert (queued.msg, queued.args) == ("user alice failed", None)
+    assert queued.exc_info[0] is ValueError
+    
+    writer._handle(queued)
+    writer.stop()
+    line = json.loads((tmp_path / "app.jsonl").read_text())
+    assert line["message"] == "user alice failed"
+    assert "ValueError: boom" in line["exc_info"]
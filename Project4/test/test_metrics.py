@@ -0,0 +1,63 @@
+# In-built packages (Standard Library modules)
+
+# External packages
+from fastapi import status
+
+# Our Own Imports
+from app.metrics import Histogram, REQUEST_LATENCY, REQUESTS_TOTAL, EXCEPTIONS_HANDLED
+from test.utils import client, test_user, test_user_and_todo
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("demo_seconds", "Demo histogram", ("route",), buckets = (0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5.0, "/a")
+    
+    lines = histogram.render()
+    assert "# TYPE demo_seconds histogram" in lines
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{route="/a"} 3' in lines
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_requests_are_labelled_by_route_template(test_user_and_todo):
+    todo = test_user_and_todo
+    before = REQUEST_LATENCY.count("GET", "/todo/read_todo/{todo_id}")
+    ok_before = REQUESTS_TOTAL.value("GET", "/todo/read_todo/{todo_id}", "2xx")
+    missing_before = REQUESTS_TOTAL.value("GET", "/todo/read_todo/{todo_id}", "4xx")
+    
+    assert client.get(f"/todo/read_todo/{todo.id}").status_code == status.HTTP_200_OK
+    assert client.get("/todo/read_todo/999").status_code == status.HTTP_404_NOT_FOUND
+    
+    assert REQUEST_LATENCY.count("GET", "/todo/read_todo/{todo_id}") == before + 2
+    assert REQUESTS_TOTAL.value("GET", "/todo/read_todo/{todo_id}", "2xx") == ok_before + 1
+    assert REQUESTS_TOTAL.value("GET", "/todo/read_todo/{todo_id}", "4xx") == missing_before + 1
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_exception_handlers_are_counted(test_user):
+    before = EXCEPTIONS_HANDLED.value("validation_exception_handler", "RequestValidationError")
+    
+    response = client.post("/todo/create_todo/", json = {"title" : "x"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    
+    assert EXCEPTIONS_HANDLED.value("validation_exception_handler", "RequestValidationError") == before + 1
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_metrics_endpoint_exposition_format(test_user):
+    client.get("/todo/")
+    response = client.get("/metrics")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",route="/todo/",status_class="2xx"}' in body
+    assert "http_requests_in_flight" in body
+    assert 'app_component_stat{component="token_cache",stat="hits"}' in body
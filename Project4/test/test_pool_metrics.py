@@ -0,0 +1,52 @@
+# In-built packages (Standard Library modules)
+
+# External packages
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+# Our Own Imports
+from app.pool_metrics import PoolMetrics, InstrumentedQueuePool, instrument_engine
+from test.utils import client, test_user
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_pool_metrics_track_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass = InstrumentedQueuePool, 
+                           pool_size = 1, max_overflow = 0, pool_timeout = 0.1)
+    metrics = PoolMetrics()
+    instrument_engine(engine, metrics)
+    
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        
+        stats = metrics.stats(engine.pool)
+        assert stats["in_use"] == 1
+        assert stats["checkouts"] == 1
+        
+        # The only connection is busy → the second checkout times out
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+    
+    stats = metrics.stats(engine.pool)
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+    assert stats["checkout_timeouts"] == 1
+    assert stats["connections_opened"] == 1
+    
+    # dispose() closes the pooled connection and records its lifetime
+    engine.dispose()
+    stats = metrics.stats(engine.pool)
+    assert stats["connections_closed"] == 1
+    assert stats["connection_lifetime_max_s"] >= 0
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_db_pool_stats_endpoint(test_user):
+    response = client.get("/admin/stats/db-pool")
+    assert response.status_code == status.HTTP_200_OK
+    
+    sync_stats = response.json()["sync"]
+    for key in ("pool_size", "max_overflow", "in_use", "overflow", "checkout_wait_avg_ms", "connection_lifetime_avg_s"):
+        assert key in sync_stats
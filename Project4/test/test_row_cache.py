@@ -0,0 +1,151 @@
+# In-built packages (Standard Library modules)
+import time
+
+# External packages
+import pytest
+from fastapi import status
+from sqlalchemy import update
+
+# Our Own Imports
+from app.config import row_cache
+from app.models import Todos
+from app.database import ThreadedSession
+from app.row_cache import RowCache, LRUBackend, todo_key, user_key
+from test.utils import client, TestingSessionLocal, test_user, test_user_and_todo
+
+
+class FakeSharedBackend(LRUBackend):
+    """
+    Stand-in for a shared backend in tests: an unbounded dict-backed store that
+    records every call, so tests can assert what reached the "network".
+    """
+    
+    def __init__(self):
+        super().__init__(max_size = 1_000_000)
+        self.calls = []
+    
+    def get(self, key):
+        self.calls.append(("get", key))
+        return super().get(key)
+    
+    def set(self, key, value, ttl):
+        self.calls.append(("set", key))
+        super().set(key, value, ttl)
+    
+    def delete(self, *keys):
+        self.calls.append(("delete", *keys))
+        super().delete(*keys)
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_read_todo_is_served_from_cache_until_updated(test_user_and_todo):
+    todo = test_user_and_todo
+    hits_before = row_cache.counters["local_hits"]
+    
+    assert client.get(f"/todo/read_todo/{todo.id}").json()["title"] == "FASTAPI COURSE - Udemy"
+    assert client.get(f"/todo/read_todo/{todo.id}").json()["title"] == "FASTAPI COURSE - Udemy"
+    assert row_cache.counters["local_hits"] == hits_before + 1
+    
+    payload = {"title" : "Changed title", "description" : "Changed description", "priority" : 2, "complete" : True}
+    assert client.put(f"/todo/update_todo/{todo.id}", json = payload).status_code == status.HTTP_200_OK
+    
+    # The update invalidated the entry → the next read sees the new row
+    response = client.get(f"/todo/read_todo/{todo.id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Changed title"
+    assert response.json()["complete"] is True
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_owner_version_is_invalidated_by_writes(test_user):
+    payload = {"title" : "First todo", "description" : "Versioned list", "priority" : 1, "complete" : False}
+    first_id = client.post("/todo/create_todo/", json = payload).json()["id"]
+    
+    etag = client.get("/todo/").headers["etag"]
+    assert client.get("/todo/", headers = {"If-None-Match" : etag}).status_code == status.HTTP_304_NOT_MODIFIED
+    
+    # Bulk delete + single create both drop the owner's version → a full response again
+    client.request("DELETE", "/todo/bulk", json = [first_id])
+    client.post("/todo/create_todo/", json = {**payload, "title" : "Second todo"})
+    
+    response = client.get("/todo/", headers = {"If-None-Match" : etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert [todo["title"] for todo in response.json()["items"]] == ["Second todo"]
+
+
+# ============================================== TEST #3 ====================================================== #
+@pytest.mark.asyncio
+async def test_shared_backend_is_read_through_and_invalidated(test_user_and_todo):
+    todo = test_user_and_todo
+    shared = FakeSharedBackend()
+    
+    # Two caches sharing one backend ≈ two app processes behind one Redis
+    first_process = RowCache(max_size = 100, shared = shared)
+    second_process = RowCache(max_size = 100, shared = shared)
+    
+    db = ThreadedSession(TestingSessionLocal())
+    try:
+        assert (await first_process.get_todo(db, todo.id))["title"] == "FASTAPI COURSE - Udemy"
+        assert ("set", todo_key(todo.id)) in shared.calls
+        
+        # Second process misses locally, hits the shared backend, never loads from the DB
+        assert (await second_process.get_todo(db, todo.id))["title"] == "FASTAPI COURSE - Udemy"
+        assert second_process.stats()["shared_hits"] == 1
+        assert second_process.stats()["misses"] == 0
+        
+        await first_process.invalidate_todos([todo.id], [todo.owner_id])
+        assert shared.get(todo_key(todo.id)) is None
+    finally:
+        await db.close()
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_row_cache_stats_endpoint(test_user):
+    response = client.get("/admin/stats/row-cache")
+    assert response.status_code == status.HTTP_200_OK
+    for key in ("enabled", "size", "local_hits", "shared_hits", "misses", "invalidations", "hit_ratio"):
+        assert key in response.json()
+
+
+# ============================================== TEST #5 ====================================================== #
+@pytest.mark.asyncio
+async def test_cached_user_has_no_password_hash(test_user):
+    shared = FakeSharedBackend()
+    cache = RowCache(max_size = 100, shared = shared)
+    
+    db = ThreadedSession(TestingSessionLocal())
+    try:
+        user = await cache.get_user(db, test_user.id)
+    finally:
+        await db.close()
+    
+    assert user["username"] == test_user.username
+    assert "hashed_password" not in user
+    assert b"hashed_password" not in shared.get(user_key(test_user.id))
+
+
+# ============================================== TEST #6 ====================================================== #
+@pytest.mark.asyncio
+async def test_write_in_one_process_reaches_the_other_without_shared_backend(test_user_and_todo):
+    todo = test_user_and_todo
+    
+    # Two caches without a shared backend on one database ≈ two app workers
+    first_process = RowCache(max_size = 100, local_ttl = 0.2)
+    second_process = RowCache(max_size = 100, local_ttl = 0.2)
+    
+    db = ThreadedSession(TestingSessionLocal())
+    try:
+        version = await first_process.get_version(todo.owner_id)
+        assert (await first_process.get_todo(db, todo.id))["title"] == "FASTAPI COURSE - Udemy"
+        
+        # The second process serves a write: it updates the row and invalidates its own cache only
+        await db.execute(update(Todos).where(Todos.id == todo.id).values(title = "Written elsewhere"))
+        await db.commit()
+        await second_process.invalidate_todos([todo.id], [todo.owner_id])
+        
+        # The first one keeps its copies for at most local_ttl
+        time.sleep(0.3)
+        assert await first_process.get_version(todo.owner_id) != version
+        assert (await first_process.get_todo(db, todo.id))["title"] == "Written elsewhere"
+    finally:
+        await db.close()
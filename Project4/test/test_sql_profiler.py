@@ -0,0 +1,71 @@
+# In-built packages (Standard Library modules)
+
+# External packages
+import pytest
+from fastapi import FastAPI, Request, status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+# Our Own Imports
+from app import sql_profiler
+from app.sql_profiler import SQLProfilerMiddleware, profile_engine
+
+
+@pytest.fixture
+def profiled_client(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profiler.db'}")
+    profile_engine(engine)
+    
+    profiled_app = FastAPI()
+    profiled_app.add_middleware(SQLProfilerMiddleware, query_budget = 3)
+    
+    # Sync endpoint → runs in the threadpool, like the ThreadedSession calls
+    @profiled_app.get("/queries/{count}")
+    def run_queries(count : int, request : Request):
+        with engine.connect() as connection:
+            for _ in range(count):
+                connection.execute(text("SELECT 1"))
+        return request.state.sql_profile.summary()
+    
+    yield TestClient(profiled_app)
+    engine.dispose()
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_profile_counts_statements_and_sets_server_timing(profiled_client):
+    response = profiled_client.get("/queries/2")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["query_count"] == 2
+    assert response.json()["slowest"][0]["statement"] == "SELECT 1"
+    assert response.json()["slowest"][0]["count"] == 2
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="2 queries"' in response.headers["server-timing"]
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_query_budget_and_repeated_statements_are_logged(profiled_client, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(sql_profiler.logger, "warning", warnings.append)
+    
+    profiled_client.get("/queries/2")
+    assert warnings == []
+    
+    profiled_client.get("/queries/6")
+    assert any("issued 6 SQL statements (budget 3)" in warning for warning in warnings)
+    assert any("GET /queries/{count}" in warning and "possible N+1" in warning for warning in warnings)
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_failing_statements_leave_nothing_on_the_connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'failing.db'}", pool_size = 1)
+    profile_engine(engine)
+    
+    with engine.connect() as connection:
+        for _ in range(5):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+        assert not any(key.startswith("sql_profiler") for key in connection.info)
+    engine.dispose()
@@ -0,0 +1,63 @@
+# In-built packages (Standard Library modules)
+import re
+from pathlib import Path
+
+# External packages
+from fastapi import status
+
+# Our Own Imports
+from app.static_assets import Asset, choose_encoding, static_assets
+from test.utils import client
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_pages_link_fingerprinted_assets():
+    response = client.get("/auth/login-page")
+    assert response.status_code == status.HTTP_200_OK
+    
+    fingerprinted = static_assets.assets["css/bootstrap.css"].fingerprinted_path
+    assert re.fullmatch(r"css/bootstrap\.[0-9a-f]{12}\.css", fingerprinted)
+    assert f"/static/{fingerprinted}" in response.text
+    assert "/static/css/bootstrap.css" not in response.text
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_fingerprinted_asset_is_precompressed_and_immutable():
+    fingerprinted = static_assets.assets["css/bootstrap.css"].fingerprinted_path
+    response = client.get(f"/static/{fingerprinted}", headers = {"Accept-Encoding" : "gzip"})
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"].startswith("text/css")
+    assert int(response.headers["content-length"]) < Path("static/css/bootstrap.css").stat().st_size
+    
+    # httpx decodes gzip transparently
+    assert response.content == Path("static/css/bootstrap.css").read_bytes()
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_plain_asset_url_revalidates():
+    response = client.get("/static/js/base.js", headers = {"Accept-Encoding" : "identity"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["cache-control"] == "public, no-cache"
+    assert "content-encoding" not in response.headers
+    
+    response = client.get("/static/js/base.js", headers = {"Accept-Encoding" : "identity", 
+                                                            "If-None-Match" : response.headers["etag"]})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    assert client.get("/static/js/missing.js").status_code == status.HTTP_404_NOT_FOUND
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_choose_encoding_honours_accept_encoding():
+    asset = Asset("css/demo.css", b"body { color : red; }\n" * 100)
+    asset.bodies["br"] = b"pretend-brotli"
+    
+    assert choose_encoding(asset, "gzip, deflate, br") == "br"
+    assert choose_encoding(asset, "gzip, br;q=0") == "gzip"
+    assert choose_encoding(asset, "*") == "br"
+    assert choose_encoding(asset, "") == "identity"
+    assert choose_encoding(asset, "gzip;q=0") == "identity"
@@ -0,0 +1,100 @@
+# In-built packages (Standard Library modules)
+import os
+import asyncio
+
+# External packages
+import pytest
+from fastapi import status
+from jinja2 import DictLoader
+from sqlalchemy import select
+
+# Our Own Imports
+from app import templating
+from app.models import Todos
+from app.routers import auth, todos
+from app.database import ThreadedSession
+from app.templating import templates, create_environment, precompile_templates, StreamedRows, StreamingTemplateResponse
+from test.utils import client, TestingSessionLocal, test_user_and_todo
+
+
+# ============================================== TEST #1 ====================================================== #
+def test_routers_share_one_environment():
+    assert auth.templates is templates
+    assert todos.templates is templates
+    assert templates.env.auto_reload is False
+
+
+# ============================================== TEST #2 ====================================================== #
+def test_precompile_fills_the_bytecode_cache(tmp_path):
+    environment = create_environment(cache_dir = str(tmp_path))
+    
+    compiled = precompile_templates(environment)
+    
+    assert compiled == len(environment.list_templates(extensions = ["html"]))
+    assert len(list(tmp_path.iterdir())) == compiled
+
+
+# ============================================== TEST #3 ====================================================== #
+def test_fragment_cache_renders_each_key_once():
+    environment = create_environment(cache_dir = "")
+    environment.loader = DictLoader({"page.html" : '{% cache "greeting", lang %}{{ counter.pop() }}{% endcache %}'})
+    page = environment.get_template("page.html")
+    
+    counter = [3, 2, 1]
+    assert page.render(lang = "en", counter = counter) == "1"
+    assert page.render(lang = "en", counter = counter) == "1"      # served from the fragment cache
+    assert page.render(lang = "de", counter = counter) == "2"      # new key → rendered again
+    
+    environment.fragment_cache_enabled = False
+    assert page.render(lang = "en", counter = counter) == "3"
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_pages_render_with_cached_layout_fragments():
+    first = client.get("/auth/login-page")
+    second = client.get("/auth/login-page")
+    
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert first.text == second.text
+    assert "Todo App" in second.text
+
+
+# ============================================== TEST #5 ====================================================== #
+def test_streamed_template_sends_the_head_before_the_rows(test_user_and_todo, monkeypatch):
+    environment = create_environment(cache_dir = "", enable_async = True)
+    environment.loader = DictLoader({"page.html" : "<head></head>{% for row in rows %}<p>{{ row.title }}</p>{% endfor %}"})
+    monkeypatch.setattr(templating, "streaming_environment", environment)
+    
+    messages = []
+    
+    async def send(message):
+        messages.append(message)
+    
+    async def render():
+        db = ThreadedSession(TestingSessionLocal())
+        rows = StreamedRows(db, select(Todos.title).order_by(Todos.id), batch_size = 1)
+        try:
+            await StreamingTemplateResponse("page.html", {"rows" : rows})({"type" : "http"}, None, send)
+        finally:
+            await db.close()
+    
+    asyncio.run(render())
+    
+    assert messages[0]["type"] == "http.response.start"
+    assert [message["body"] for message in messages[1:]] == [b"<head></head>", b"<p>FASTAPI COURSE - Udemy</p>", b""]
+    assert messages[-1]["more_body"] is False
+
+
+# ============================================== TEST #6 ====================================================== #
+def test_bytecode_cache_refuses_a_directory_others_can_write(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    
+    with pytest.raises(RuntimeError):
+        create_environment(cache_dir = str(shared))
+    
+    # Created by us → 0700; unset → Jinja's own per-user directory
+    create_environment(cache_dir = str(tmp_path / "private"))
+    assert (tmp_path / "private").stat().st_mode & 0o777 == 0o700
+    assert create_environment(cache_dir = None).bytecode_cache.directory.endswith(f"_jinja2-cache-{os.getuid()}")
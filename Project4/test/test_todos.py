@@ -1,11 +1,19 @@
 # In-built packages (Standard Library modules)
+import io
+import csv
+import json
+from datetime import timedelta
 
 # External packages
+import pytest
 from fastapi import status
+from sqlalchemy import event, update
 
 # Our Own Imports
-from app.models import Todos
-from test.utils import client, TestingSessionLocal, test_user, test_user_and_todo
+from app.routers import todos
+from app.routers.auth import create_access_token
+from app.models import Todos, Users
+from test.utils import client, engine, TestingSessionLocal, test_user, test_user_and_todo
 
 
 # ============================================== TEST #1 ====================================================== #
@@ -14,7 +22,7 @@ def test_read_all_todos(test_user_and_todo):
     assert response.status_code == status.HTTP_200_OK
     
     # Remove unpredictable fields
-    data = response.json()
+    data = response.json()["items"]
     for item in data:
         item.pop("id", None)
         item.pop("owner_id", None)
@@ -205,4 +213,309 @@ def test_delete_todo_not_found(test_user_and_todo):
             "message" : "Todo Not Found.", 
             "path" : f"http://testserver/todo/delete_todo/{non_existent_id}"
             }
-        }
\ No newline at end of file
+        }
+
+
+# ============================================== TEST #9 ====================================================== #
+def test_read_all_todos_keyset_pagination(test_user_and_todo):
+    payload = {
+        "title" : "Learn Pytest", 
+        "description" : "Write unit tests for todo creation", 
+        "priority" : 3, 
+        "complete" : False 
+    }
+    second_id = client.post("/todo/create_todo/", json = payload).json()["id"]
+    
+    # Page 1 → only the fixture todo, plus a cursor pointing at it
+    first_page = client.get("/todo/", params = {"limit" : 1}).json()
+    assert [item["id"] for item in first_page["items"]] == [test_user_and_todo.id]
+    assert first_page["next_cursor"] == test_user_and_todo.id
+    
+    # Page 2 → the todo created above, and no further pages
+    second_page = client.get("/todo/", params = {"limit" : 1, "cursor" : first_page["next_cursor"]}).json()
+    assert [item["id"] for item in second_page["items"]] == [second_id]
+    assert second_page["next_cursor"] is None
+
+
+# ============================================== TEST #10 ===================================================== #
+def test_read_all_todos_field_projection(test_user_and_todo):
+    response = client.get("/todo/", params = {"fields" : "title,priority"})
+    assert response.status_code == status.HTTP_200_OK
+    
+    # "id" is always returned because it is the pagination key
+    assert response.json()["items"] == [{
+        "id" : test_user_and_todo.id, 
+        "title" : "FASTAPI COURSE - Udemy", 
+        "priority" : 5
+    }]
+
+
+# ============================================== TEST #11 ===================================================== #
+def test_read_all_todos_unknown_field(test_user_and_todo):
+    response = client.get("/todo/", params = {"fields" : "title,password"})
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["error"]["message"].startswith("Unknown field(s): password.")
+
+
+# ============================================== TEST #12 ===================================================== #
+def test_export_todos_ndjson(test_user_and_todo):
+    response = client.get("/todo/export")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == [{
+        "id" : test_user_and_todo.id, 
+        "title" : "FASTAPI COURSE - Udemy", 
+        "description" : "Complete FASTAPI Course by December 2025", 
+        "priority" : 5, 
+        "complete" : False, 
+        "owner_id" : test_user_and_todo.owner_id
+    }]
+
+
+# ============================================== TEST #13 ===================================================== #
+def test_export_todos_csv(test_user_and_todo):
+    response = client.get("/todo/export", params = {"format" : "csv"})
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["title"] == "FASTAPI COURSE - Udemy"
+    assert rows[0]["id"] == str(test_user_and_todo.id)
+
+
+# ============================================== TEST #14 ===================================================== #
+def test_bulk_create_todos(test_user):
+    payload = [
+        {"title" : "Learn Pytest", "description" : "Write unit tests", "priority" : 3, "complete" : False}, 
+        {"title" : "Learn Alembic", "description" : "Write a migration", "priority" : 2, "complete" : True}
+    ]
+    
+    response = client.post("/todo/bulk", json = payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    
+    data = response.json()
+    assert data["message"] == "2 todo items created successfully"
+    assert [result["status_code"] for result in data["results"]] == [201, 201]
+    
+    # Ids come back in request order
+    with TestingSessionLocal() as db:
+        for result, item in zip(data["results"], payload):
+            saved_todo = db.get(Todos, result["id"])
+            assert saved_todo.title == item["title"]
+            assert saved_todo.owner_id == test_user.id
+
+
+# ============================================== TEST #15 ===================================================== #
+def test_bulk_update_todos_reports_per_item_results(test_user_and_todo):
+    todo_id = test_user_and_todo.id
+    payload = [
+        {"id" : todo_id, "title" : "Learn Pytest", "description" : "Write unit tests", "priority" : 1, "complete" : True}, 
+        {"id" : todo_id + 1, "title" : "Missing todo", "description" : "Does not exist", "priority" : 1, "complete" : True}
+    ]
+    
+    response = client.put("/todo/bulk", json = payload)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "message" : "1 todo items updated successfully", 
+        "results" : [
+            {"id" : todo_id, "status_code" : 200}, 
+            {"id" : todo_id + 1, "status_code" : 404, "detail" : "Todo Not Found."}
+        ]
+    }
+    
+    with TestingSessionLocal() as db:
+        updated_todo = db.get(Todos, todo_id)
+        assert updated_todo.title == "Learn Pytest"
+        assert updated_todo.complete is True
+
+
+# ============================================== TEST #16 ===================================================== #
+def test_bulk_delete_todos_checks_ownership(test_user_and_todo):
+    # A todo that belongs to somebody else
+    with TestingSessionLocal() as db:
+        other_user = Users(email = "other@gmail.com", username = "OtherUser", first_name = "Other", last_name = "User", 
+                           hashed_password = "abcdefgh", role = "Normal User", phone_number = "1234567890")
+        db.add(other_user)
+        db.flush()
+        other_todo = Todos(title = "Not yours", description = "Owned by another user", priority = 1, 
+                           complete = False, owner_id = other_user.id)
+        db.add(other_todo)
+        db.commit()
+        other_todo_id = other_todo.id
+    
+    response = client.request("DELETE", "/todo/bulk", json = [test_user_and_todo.id, other_todo_id])
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"] == [
+        {"id" : test_user_and_todo.id, "status_code" : 200}, 
+        {"id" : other_todo_id, "status_code" : 403, "detail" : "You are not allowed to delete this todo."}
+    ]
+    
+    with TestingSessionLocal() as db:
+        assert db.get(Todos, test_user_and_todo.id) is None
+        assert db.get(Todos, other_todo_id) is not None
+
+
+# ============================================== TEST #17 ===================================================== #
+def test_read_all_todos_conditional_get(test_user_and_todo):
+    first = client.get("/todo/")
+    etag = first.headers["etag"]
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["cache-control"] == "private, no-cache"
+    
+    # Unchanged list → 304 with an empty body
+    response = client.get("/todo/", headers = {"If-None-Match" : etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    
+    # Different page parameters are a different representation
+    assert client.get("/todo/?limit=1", headers = {"If-None-Match" : etag}).status_code == status.HTTP_200_OK
+    
+    # A write bumps the owner's version → full response with a new ETag
+    payload = {"title" : "Another todo", "description" : "Changes the list", "priority" : 3, "complete" : False}
+    client.post("/todo/create_todo/", json = payload)
+    response = client.get("/todo/", headers = {"If-None-Match" : etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+    assert len(response.json()["items"]) == 2
+
+
+# ============================================== TEST #18 ===================================================== #
+def test_read_todo_conditional_get(test_user_and_todo):
+    first = client.get(f"/todo/read_todo/{test_user_and_todo.id}")
+    etag = first.headers["etag"]
+    
+    response = client.get(f"/todo/read_todo/{test_user_and_todo.id}", headers = {"If-None-Match" : f"W/{etag}"})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    payload = {"title" : "Updated title", "description" : "Updated description", "priority" : 1, "complete" : True}
+    client.put(f"/todo/update_todo/{test_user_and_todo.id}", json = payload)
+    
+    response = client.get(f"/todo/read_todo/{test_user_and_todo.id}", headers = {"If-None-Match" : etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Updated title"
+
+
+# ============================================== TEST #19 ===================================================== #
+def test_not_modified_list_skips_the_query(test_user_and_todo, monkeypatch):
+    etag = client.get("/todo/").headers["etag"]
+    
+    async def no_database(*args, **kwargs):
+        pytest.fail("a cached version must answer 304 without running the page query")
+    monkeypatch.setattr(todos, "fetch_page", no_database)
+    
+    response = client.get("/todo/", headers = {"If-None-Match" : etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+# ============================================== TEST #20 ===================================================== #
+def test_todo_page_renders_first_page_filtered_in_sql(test_user_and_todo):
+    # 30 more todos: even ones complete, all priority 2 (the fixture todo is open, priority 5)
+    payload = [{"title" : f"Paged todo {n}", "description" : "Todo page", "priority" : 2, "complete" : n % 2 == 0} 
+               for n in range(30)]
+    client.post("/todo/bulk", json = payload)
+    
+    token = create_access_token("Wolverine1310", test_user_and_todo.owner_id, "Normal User", timedelta(minutes = 5))
+    cookies = {"access_token" : token}
+    
+    response = client.get("/todo/todo-page", cookies = cookies)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text.count("/todo/edit-todo-page/") == todos.TODO_PAGE_SIZE
+    assert 'data-next-cursor=""' not in response.text
+    
+    # Only open todos: fixture + 15 → a single page, nothing left to load
+    response = client.get("/todo/todo-page?complete=false", cookies = cookies)
+    assert response.text.count("/todo/edit-todo-page/") == 16
+    assert 'data-next-cursor=""' in response.text
+    assert "strike-through-td" not in response.text
+
+
+# ============================================== TEST #21 ===================================================== #
+def test_todo_page_items_continue_with_the_same_filters(test_user_and_todo):
+    payload = [{"title" : f"Paged todo {n}", "description" : "Todo page", "priority" : 2, "complete" : n % 2 == 0} 
+               for n in range(30)]
+    client.post("/todo/bulk", json = payload)
+    
+    first = client.get("/todo/todo-page/items?complete=true&priority=2&limit=10&fields=id,title,complete")
+    assert first.status_code == status.HTTP_200_OK
+    assert len(first.json()["items"]) == 10
+    assert all(item["complete"] and set(item) == {"id", "title", "complete"} for item in first.json()["items"])
+    
+    second = client.get(f"/todo/todo-page/items?complete=true&priority=2&limit=10&cursor={first.json()['next_cursor']}")
+    assert len(second.json()["items"]) == 5
+    assert second.json()["next_cursor"] is None
+    
+    assert client.get("/todo/todo-page/items?priority=9").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+# ============================================== TEST #22 ===================================================== #
+def test_single_todo_writes_take_one_statement(test_user_and_todo):
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "todos" in statement.lower():
+            statements.append(statement.split()[0])
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        payload = {"title" : "One round trip", "description" : "INSERT ... RETURNING", "priority" : 2, "complete" : False}
+        todo_id = client.post("/todo/create_todo/", json = payload).json()["id"]
+        client.put(f"/todo/update_todo/{todo_id}", json = {**payload, "complete" : True})
+        client.delete(f"/todo/delete_todo/{todo_id}")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    assert statements == ["INSERT", "UPDATE", "DELETE"]
+
+
+# ============================================== TEST #23 ===================================================== #
+def test_update_todo_of_another_user_is_forbidden(test_user_and_todo):
+    with TestingSessionLocal() as db:
+        other_user = Users(email = "other@gmail.com", username = "OtherUser", first_name = "Other", last_name = "User", 
+                           hashed_password = "abcdefgh", role = "Normal User", phone_number = "1234567890")
+        db.add(other_user)
+        db.flush()
+        other_todo = Todos(title = "Not yours", description = "Owned by another user", priority = 1, 
+                           complete = False, owner_id = other_user.id)
+        db.add(other_todo)
+        db.commit()
+        other_todo_id = other_todo.id
+    
+    payload = {"title" : "Hijacked", "description" : "Should not be written", "priority" : 1, "complete" : True}
+    response = client.put(f"/todo/update_todo/{other_todo_id}", json = payload)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["error"]["message"] == "You are not allowed to update this todo."
+    
+    response = client.delete(f"/todo/delete_todo/{other_todo_id}")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    with TestingSessionLocal() as db:
+        assert db.get(Todos, other_todo_id).title == "Not yours"
+
+
+# ============================================== TEST #24 ===================================================== #
+def test_bulk_writes_skip_todos_whose_owner_changed_after_the_check(test_user_and_todo, monkeypatch):
+    todo_id = test_user_and_todo.id
+    check_bulk_ownership = todos._check_bulk_ownership
+    
+    async def check_then_reassign(user, db, todo_ids, action):
+        allowed, errors = await check_bulk_ownership(user, db, todo_ids, action)
+        # Another request hands the todo to a different owner between check and write
+        await db.execute(update(Todos).where(Todos.id == todo_id).values(owner_id = todo_id + 1000))
+        return allowed, errors
+    
+    monkeypatch.setattr(todos, "_check_bulk_ownership", check_then_reassign)
+    payload = [{"id" : todo_id, "title" : "Hijacked", "description" : "Should not be written", "priority" : 1, "complete" : True}]
+    
+    assert client.put("/todo/bulk", json = payload).status_code == status.HTTP_200_OK
+    assert client.request("DELETE", "/todo/bulk", json = [todo_id]).json()["message"] == "0 todo items deleted successfully"
+    
+    with TestingSessionLocal() as db:
+        todo = db.get(Todos, todo_id)
+        assert (todo.title, todo.owner_id) == (test_user_and_todo.title, todo_id + 1000)
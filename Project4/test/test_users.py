@@ -91,4 +91,13 @@ def test_update_user(test_user):
         assert updated_user is not None
         
         for field, value in payload_update_user.items():
-            assert getattr(updated_user, field) == value
\ No newline at end of file
+            assert getattr(updated_user, field) == value
+
+
+# ============================================== TEST #4 ====================================================== #
+def test_get_current_user_details_hides_password_hash(test_user):
+    response = client.get("/users/get_user")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert "hashed_password" not in response.json()
+    assert response.json()["username"] == "Wolverine1310"
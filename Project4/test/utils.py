@@ -11,7 +11,8 @@ from sqlalchemy import create_engine, URL, text
 # Our Own Imports
 from app.main import app
 from app.models import Base, Todos, Users
-from app.config import get_db, get_current_user, bcrypt_context
+from app.database import ThreadedSession
+from app.config import get_db, get_current_user, bcrypt_context, row_cache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -54,17 +55,19 @@ Base.metadata.create_all(bind = engine)
 
 TestingSessionLocal = sessionmaker(bind = engine, autoflush = False, autocommit = False)
 
-def override_get_db():
+async def override_get_db():
     """
     Replaces the real database dependency with a test DB session.
     This ensures all API calls inside the test use TestingSessionLocal.
+    The session is wrapped in ThreadedSession so routers can await it exactly
+    like they await the production session.
     """
     
-    db = TestingSessionLocal()
+    db = ThreadedSession(TestingSessionLocal())
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
 
 
 def override_get_current_user():
@@ -118,6 +121,9 @@ def test_user():
         connection.execute(text("DELETE FROM Users;"))
         connection.commit()
     db.close()
+    
+    # Rows were deleted behind the API's back → drop what the read-through cache still holds
+    row_cache.clear()
 
 
 # ============================================== FIXTURES #2 =================================================== #
@@ -158,4 +164,7 @@ def test_user_and_todo():
         conn.execute(text("DELETE FROM users;"))
         conn.commit()
     
-    db.close()
\ No newline at end of file
+    db.close()
+    
+    # Rows were deleted behind the API's back → drop what the read-through cache still holds
+    row_cache.clear()
\ No newline at end of file